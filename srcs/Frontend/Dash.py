@@ -5,7 +5,7 @@ import logging
 import os
 
 # Import from local modules
-from config import KU_COLORS, DASHBOARD_CONFIG, FONTS
+from config import KU_COLORS, DASHBOARD_CONFIG, FONTS, CACHE_CONFIG
 from components import (
     create_system_overview,
     create_enhanced_server_cards,
@@ -13,8 +13,10 @@ from components import (
     create_network_monitor,
     create_enhanced_historical_graphs,
     create_compact_server_grid,
+    prefetch_historical_data,
 )
 from callbacks_enhanced import register_callbacks
+from cache_utils import start_cache_warmer
 
 # Configure logging
 logging.basicConfig(
@@ -238,6 +240,8 @@ app.layout = html.Div(
             interval=DASHBOARD_CONFIG["refresh_interval"],
             n_intervals=0,
         ),
+        # Latest server metrics shared by the overview, grid and network views
+        dcc.Store(id="metrics-store"),
         # Download component for exporting reports
         dcc.Download(id="download-report"),
         # System Overview Section
@@ -488,6 +492,18 @@ app.layout = html.Div(
 register_callbacks(app)
 
 if __name__ == "__main__":
+    debug = os.getenv("DEBUG") == "True"
     logger.info("Starting Khalifa University Server Monitoring Dashboard...")
-    logger.info(f"Debug mode: {os.getenv('DEBUG') == 'True'}")
-    app.run(debug=(os.getenv("DEBUG") == "True"), host="0.0.0.0", port=3000)
+    logger.info(f"Debug mode: {debug}")
+
+    # Keep historical data warm so chart callbacks only read the cache. Under
+    # the debug reloader only the serving child (WERKZEUG_RUN_MAIN) warms, so
+    # the watcher process doesn't run a duplicate thread.
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_cache_warmer(
+            prefetch_historical_data,
+            CACHE_CONFIG["prefetch_interval"],
+            "history-prefetch",
+        )
+
+    app.run(debug=debug, host="0.0.0.0", port=3000)
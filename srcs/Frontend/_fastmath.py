@@ -0,0 +1,76 @@
+# Numeric kernels for large historical windows
+# numba is optional: when it is installed the kernels are JIT-compiled,
+# otherwise the same functions run as plain Python/numpy.
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+
+def _anomaly_mask_numpy(values: np.ndarray, threshold_std: float) -> np.ndarray:
+    """Vectorized anomaly mask (NaN-skipping mean, sample std)"""
+    valid = ~np.isnan(values)
+    if np.count_nonzero(valid) < 2:
+        return np.zeros(values.size, dtype=np.bool_)
+
+    mean = np.nanmean(values)
+    std = np.nanstd(values, ddof=1)
+    if std == 0.0:
+        return np.zeros(values.size, dtype=np.bool_)
+
+    return np.abs(values - mean) > threshold_std * std
+
+
+def _anomaly_mask_loop(values, threshold_std):
+    """Single-pass-per-statistic anomaly mask written for numba"""
+    n = 0
+    total = 0.0
+    for v in values:
+        if not np.isnan(v):
+            n += 1
+            total += v
+
+    mask = np.zeros(values.size, dtype=np.bool_)
+    if n < 2:
+        return mask
+
+    mean = total / n
+    sq = 0.0
+    for v in values:
+        if not np.isnan(v):
+            sq += (v - mean) * (v - mean)
+    std = np.sqrt(sq / (n - 1))
+    if std == 0.0:
+        return mask
+
+    limit = threshold_std * std
+    for i in range(values.size):
+        mask[i] = abs(values[i] - mean) > limit
+    return mask
+
+
+# fastmath is deliberately off: it lets LLVM assume no NaNs, which would
+# break the NaN skipping above
+if njit is not None:
+    _anomaly_kernel = njit(cache=True)(_anomaly_mask_loop)
+else:
+    _anomaly_kernel = _anomaly_mask_numpy
+
+
+def anomaly_mask(values: np.ndarray, threshold_std: float) -> np.ndarray:
+    """
+    Flag values more than ``threshold_std`` sample standard deviations from the mean
+
+    NaN values are ignored when computing the statistics and are never flagged.
+    Fewer than two valid values, or zero spread, yield an all-False mask.
+
+    Args:
+        values: float64 array of samples
+        threshold_std: Number of standard deviations for the threshold
+
+    Returns:
+        Boolean array the same length as ``values``
+    """
+    return _anomaly_kernel(values, float(threshold_std))
@@ -3,7 +3,8 @@ import requests
 import logging
 import time
 from typing import Optional, Dict, List, Any, Tuple
-from config import API_BASE_URL
+from config import API_BASE_URL, CACHE_CONFIG
+from cache_utils import cached
 from exceptions import (
     APIConnectionError,
     APITimeoutError,
@@ -21,6 +22,18 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 3
 RETRY_BACKOFF_FACTOR = 2
+CONNECTION_POOL_SIZE = 32  # Matches the export report's fetch concurrency
+
+# Shared session so repeated calls (e.g. one per server) reuse keep-alive
+# connections instead of opening a new TCP connection each time. urllib3's
+# pool is thread-safe, so concurrent fetches can share it.
+_session = requests.Session()
+_session.mount(
+    "http://", requests.adapters.HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE)
+)
+_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE)
+)
 
 
 class APIResult:
@@ -104,7 +117,7 @@ def _make_api_request(
 
     try:
         logger.debug(f"Making API request to {url}")
-        response = requests.get(url, timeout=timeout, params=params)
+        response = _session.get(url, timeout=timeout, params=params)
 
         # Check HTTP status
         if response.status_code == 200:
@@ -226,6 +239,7 @@ def get_top_users() -> List[Dict]:
         return []
 
 
+@cached(ttl_seconds=CACHE_CONFIG["historical_ttl"], key_prefix="historical_")
 @retry_on_failure()
 def get_historical_metrics(server_name: str, hours: int = 24) -> List[Dict]:
     """
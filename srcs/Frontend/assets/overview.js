@@ -0,0 +1,64 @@
+// Clientside callbacks for the System Overview cards
+// The server ships raw metrics (with status) into the "metrics-store";
+// the browser derives every counter so no Python-side reduction is needed.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    overview: {
+        compute: function (metrics) {
+            const rows = Array.isArray(metrics) ? metrics : [];
+            const total = rows.length;
+
+            const toNumber = function (value) {
+                const parsed = parseFloat(value);
+                return isNaN(parsed) ? 0 : parsed;
+            };
+            const mean = function (key) {
+                if (!total) {
+                    return 0;
+                }
+                let sum = 0;
+                for (const row of rows) {
+                    sum += toNumber(row[key]);
+                }
+                return sum / total;
+            };
+
+            let online = 0;
+            let warning = 0;
+            let offline = 0;
+            let users = 0;
+            for (const row of rows) {
+                if (row.status === "online") {
+                    online += 1;
+                } else if (row.status === "warning") {
+                    warning += 1;
+                } else if (row.status === "offline") {
+                    offline += 1;
+                }
+                users += toNumber(row.logged_users);
+            }
+
+            const note = function (count, message) {
+                return count > 0
+                    ? [message, "stat-change negative"]
+                    : ["No action needed", "stat-change positive"];
+            };
+            const warningNote = note(warning, "Requires attention");
+            const offlineNote = note(offline, "Check connectivity");
+
+            return [
+                String(total),
+                String(online),
+                String(warning),
+                warningNote[0],
+                warningNote[1],
+                String(offline),
+                offlineNote[0],
+                offlineNote[1],
+                mean("cpu_load_5min").toFixed(1),
+                mean("ram_percentage").toFixed(1) + "%",
+                String(users),
+                mean("disk_percentage").toFixed(1) + "%",
+            ];
+        },
+    },
+});
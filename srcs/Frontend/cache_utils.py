@@ -0,0 +1,292 @@
+# In-process TTL caching utilities for the Server Monitoring Dashboard
+import time
+import threading
+import inspect
+import logging
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class SimpleCache:
+    """
+    Thread-safe key/value cache with per-entry expiry and hit statistics
+
+    ``clock`` is the nanosecond time source; tests pass a fake one.
+    """
+
+    __slots__ = ("_cache", "_lock", "_hits", "_misses", "_clock")
+
+    def __init__(self, clock: Callable[[], int] = time.monotonic_ns):
+        self._clock = clock
+        # key -> (monotonic expiry time in ns, data)
+        self._cache: Dict[Hashable, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Hits take no lock: a single dict read is atomic under the GIL and
+        entries are immutable tuples. Only dropping an expired entry locks.
+        Hit/miss counters are unsynchronized and may undercount slightly
+        under contention; they only feed get_stats().
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expiry, data = entry
+        if self._clock() >= expiry:
+            with self._lock:
+                # A concurrent set() may already have replaced the entry
+                if self._cache.get(key) is entry:
+                    del self._cache[key]
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return data
+
+    def set(self, key: Hashable, data: Any, ttl_seconds: float = 60) -> None:
+        """
+        Store a value in the cache
+
+        Args:
+            key: Cache key
+            data: Value to cache
+            ttl_seconds: Time-to-live in seconds
+        """
+        with self._lock:
+            expiry = self._clock() + int(ttl_seconds * _NS_PER_SECOND)
+            self._cache[key] = (expiry, data)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single key from the cache"""
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Remove every key starting with a pattern
+
+        String keys are matched directly; tuple keys (as built by @cached)
+        are matched on their first element, the key prefix.
+
+        Args:
+            pattern: Key prefix to match; an empty pattern matches every key
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._cache
+                if (key[0] if isinstance(key, tuple) else key).startswith(pattern)
+            ]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache"""
+        with self._lock:
+            self._cache.clear()
+
+    def cleanup_expired(self) -> int:
+        """
+        Drop expired entries
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            now = self._clock()
+            expired = [key for key, (expiry, _) in self._cache.items() if now >= expiry]
+            for key in expired:
+                del self._cache[key]
+        if expired:
+            logger.debug(f"Removed {len(expired)} expired cache entries")
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hits, misses, total_requests, hit_rate (%) and cached_items
+        """
+        # Read each counter once; this is a monitoring snapshot, so no lock
+        hits = self._hits
+        misses = self._misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "total_requests": total,
+            "hit_rate": round(hits * 100.0 / total, 2) if total else 0.0,
+            "cached_items": len(self._cache),
+        }
+
+
+# Created at import so get_cache() needs no None check and no first-call race
+_cache = SimpleCache()
+
+
+def get_cache() -> SimpleCache:
+    """Get the process-wide cache instance"""
+    return _cache
+
+
+def _make_key(prefix: str, args: tuple, kwargs: dict) -> tuple:
+    """
+    Build a cache key from a key prefix and the call arguments
+
+    The key is a plain tuple, hashed in C, rather than a formatted string, so
+    cached functions must take hashable arguments.
+    """
+    if kwargs:
+        return (prefix, args, tuple(sorted(kwargs.items())))
+    return (prefix, args)
+
+
+def _is_empty(result: Any) -> bool:
+    """Check for None, empty containers and empty DataFrames"""
+    if result is None:
+        return True
+    empty = getattr(result, "empty", None)
+    if isinstance(empty, bool):
+        return empty
+    try:
+        return len(result) == 0
+    except TypeError:
+        return False
+
+
+def cached(ttl_seconds: float = 60, key_prefix: str = "", cache_empty: bool = False):
+    """
+    Decorator to memoize a function's result in the shared cache
+
+    Exceptions are never cached. Empty results (None, [], {}, empty
+    DataFrames) are only cached when ``cache_empty`` is set, so a failed API
+    fetch that degrades to an empty list is retried on the next call instead
+    of sticking for the TTL. The decorated function gains a ``refresh``
+    method that recomputes and stores a result without reading the cache.
+
+    Arguments are bound to the function signature with defaults applied
+    before keying, so ``f(x, 24)``, ``f(x, hours=24)`` and ``f(x)`` (when
+    ``hours`` defaults to 24) all share one entry.
+
+    Args:
+        ttl_seconds: Time-to-live for cached results
+        key_prefix: Prefix for cache keys (defaults to the function name)
+        cache_empty: Whether to cache empty/None results
+    """
+
+    def decorator(func):
+        prefix = key_prefix or f"{func.__name__}:"
+        signature = inspect.signature(func)
+
+        def call_key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return _make_key(prefix, bound.args, bound.kwargs)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            key = call_key(args, kwargs)
+
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+            result = func(*args, **kwargs)
+            if cache_empty or not _is_empty(result):
+                cache.set(key, result, ttl_seconds)
+            return result
+
+        def refresh(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if cache_empty or not _is_empty(result):
+                get_cache().set(call_key(args, kwargs), result, ttl_seconds)
+            return result
+
+        wrapper.refresh = refresh
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cache_pattern(pattern: str) -> int:
+    """
+    Invalidate every cached entry whose key starts with a pattern
+
+    @cached keys begin with their ``key_prefix`` (or ``<function name>:``),
+    so passing a prefix drops everything one cached function has stored.
+
+    Args:
+        pattern: Key prefix to match; an empty pattern clears everything
+
+    Returns:
+        Number of entries removed
+    """
+    removed = get_cache().invalidate_pattern(pattern)
+    logger.info(f"Invalidated {removed} cache entries matching '{pattern}'")
+    return removed
+
+
+def invalidate_all_caches() -> None:
+    """Clear every cached entry"""
+    get_cache().clear()
+    logger.info("Cleared all cache entries")
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get statistics for the shared cache"""
+    return get_cache().get_stats()
+
+
+def start_cache_warmer(
+    warm: Callable[[], None], interval_seconds: float, name: str = "cache-warmer"
+) -> threading.Event:
+    """
+    Run a cache-warming function now and then every ``interval_seconds``
+
+    The warmer runs on a daemon thread so it never blocks request handling
+    or interpreter shutdown; errors are logged and the loop keeps going.
+
+    Args:
+        warm: Function that refreshes cached entries
+        interval_seconds: Delay between runs
+        name: Thread name (for logs)
+
+    Returns:
+        Event that stops the warmer when set
+    """
+    stop = threading.Event()
+
+    def run():
+        while not stop.is_set():
+            try:
+                warm()
+            except Exception as e:
+                logger.error(f"Cache warmer '{name}' failed: {e}", exc_info=True)
+            stop.wait(interval_seconds)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    logger.info(f"Started cache warmer '{name}' (every {interval_seconds}s)")
+    return stop
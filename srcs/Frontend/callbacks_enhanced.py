@@ -1,23 +1,38 @@
 # Enhanced callback functions with toast notifications
-from dash import Input, Output, dcc, html
+from dash import (
+    ALL,
+    Input,
+    Output,
+    State,
+    ClientsideFunction,
+    ctx,
+    dcc,
+    html,
+    no_update,
+)
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
-import pandas as pd
 from datetime import datetime
 import logging
 
-from config import KU_COLORS, CHART_CONFIG
+from config import KU_COLORS, CHART_CONFIG, CACHE_CONFIG
 from components import (
-    create_system_overview,
+    get_metrics_store_data,
     create_enhanced_server_cards,
     create_enhanced_users_table,
+    create_user_tab_table,
+    get_user_tab_rows,
     create_network_monitor,
     create_enhanced_historical_graphs,
     create_compact_server_grid,
+    load_historical_dataframe,
 )
-from api_client import get_historical_metrics
-from export_utils import generate_export_report, export_to_excel
-from refresh_utils import get_refresh_status_message
+from api_client import get_latest_server_metrics
+from cache_utils import cached
+from data_processing import format_timestamps_for_plot
+from downsample import downsample_series
+from export_utils import export_report
+from refresh_utils import get_refresh_status_message, trigger_dashboard_refresh
 from toast_utils import (
     create_success_toast,
     create_error_toast,
@@ -29,12 +44,232 @@ from toast_utils import (
 logger = logging.getLogger(__name__)
 
 
+@cached(ttl_seconds=CACHE_CONFIG["historical_ttl"], key_prefix="analytics_fig_")
+def _build_analytics_figure_json(server_name, hours):
+    """
+    Build the analytics figure and summary stats for a server and time range
+
+    Cached per (server_name, hours) for the same TTL as the historical data,
+    so switching back to a recently viewed server or range skips figure
+    construction and Plotly serialization.
+
+    Args:
+        server_name: Name of the server
+        hours: Number of hours of history to plot
+
+    Returns:
+        Dict with the Plotly figure JSON and summary stats, or None when
+        there is no data
+    """
+    # Parsed, numeric and sorted already; shared via the cache, so read-only
+    df = load_historical_dataframe(server_name, hours)
+
+    if df.empty:
+        return None
+
+    # Decimate long ranges (e.g. a week of samples) before plotting
+    series = {}
+    for col in [
+        "cpu_load_1min",
+        "cpu_load_5min",
+        "cpu_load_15min",
+        "ram_percentage",
+        "disk_percentage",
+        "logged_users",
+        "tcp_connections",
+    ]:
+        x, y = downsample_series(
+            df["timestamp"], df[col], CHART_CONFIG["max_trace_points"]
+        )
+        series[col] = (format_timestamps_for_plot(x), y)
+
+    # Create the comprehensive chart
+    fig = make_subplots(
+        rows=2,
+        cols=2,
+        subplot_titles=(
+            "CPU Load Averages",
+            "Memory Usage",
+            "Disk Usage",
+            "Network Activity",
+        ),
+        specs=[
+            [{"secondary_y": False}, {"secondary_y": False}],
+            [{"secondary_y": False}, {"secondary_y": True}],
+        ],
+    )
+
+    # CPU Load
+    fig.add_trace(
+        go.Scatter(
+            x=series["cpu_load_1min"][0],
+            y=series["cpu_load_1min"][1],
+            mode="lines",
+            name="1-min Load",
+            line_shape="spline",
+            line=dict(color=KU_COLORS["primary"], width=2),
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=series["cpu_load_5min"][0],
+            y=series["cpu_load_5min"][1],
+            mode="lines",
+            name="5-min Load",
+            line_shape="spline",
+            line=dict(color=KU_COLORS["secondary"], width=2),
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=series["cpu_load_15min"][0],
+            y=series["cpu_load_15min"][1],
+            mode="lines",
+            name="15-min Load",
+            line_shape="spline",
+            line=dict(color=KU_COLORS["accent"], width=2),
+        ),
+        row=1,
+        col=1,
+    )
+    fig.update_yaxes(title_text="CPU Load %", range=[0, 100], row=1, col=1)
+    fig.update_xaxes(title_text="Time", row=1, col=1, tickformat="%H:%M\n%b %d")
+
+    # Memory Usage
+    fig.add_trace(
+        go.Scatter(
+            x=series["ram_percentage"][0],
+            y=series["ram_percentage"][1],
+            mode="lines+markers+text",
+            name="RAM %",
+            line=dict(color=KU_COLORS["warning"], width=3),
+            text=["RAM %" if i == len(series["ram_percentage"][1]) - 1 else "" for i in range(len(series["ram_percentage"][1]))],
+					textposition="top left",
+					textfont=dict(
+						size=10,
+						color=KU_COLORS["warning"],
+						weight=500,
+					),
+        ),
+        row=1,
+        col=2,
+    )
+    fig.update_yaxes(title_text="Memory Usage %", range=[0, 100], row=1, col=2)
+    fig.update_xaxes(title_text="Time", row=1, col=2, tickformat="%H:%M\n%b %d")
+
+    # Disk Usage
+    fig.add_trace(
+        go.Scatter(
+            x=series["disk_percentage"][0],
+            y=series["disk_percentage"][1],
+            mode="lines+markers+text",
+            name="Disk %",
+            line=dict(color=KU_COLORS["primary"], width=3),
+            text=["Disk %" if i == len(series["disk_percentage"][1]) - 1 else "" for i in range(len(series["disk_percentage"][1]))],
+					textposition="top left",
+					textfont=dict(
+						size=10,
+						color=KU_COLORS["primary"],
+						weight=500,
+					),
+        ),
+        row=2,
+        col=1,
+    )
+    fig.update_yaxes(title_text="Disk Usage %", range=[0, 100], row=2, col=1)
+    fig.update_xaxes(title_text="Time", row=2, col=1, tickformat="%H:%M\n%b %d")
+
+    # Network Activity
+    fig.add_trace(
+        go.Scatter(
+            x=series["logged_users"][0],
+            y=series["logged_users"][1],
+            mode="lines+markers+text",
+            name="Users",
+            line_shape="hv",
+            line=dict(color=KU_COLORS["info"], width=2),
+            text=["Users" if i == len(series["logged_users"][1]) - 1 else "" for i in range(len(series["logged_users"][1]))],
+					textposition="top left",
+					textfont=dict(
+						size=10,
+						color=KU_COLORS["info"],
+						weight=500,
+					),
+        ),
+        row=2,
+        col=2,
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=series["tcp_connections"][0],
+            y=series["tcp_connections"][1],
+            mode="lines+markers+text",
+            name="TCP Connections",
+            line=dict(color=KU_COLORS["accent"], width=2),
+            text=["TCP Conn" if i == len(series["tcp_connections"][1]) - 1 else "" for i in range(len(series["tcp_connections"][1]))],
+					textposition="top left",
+					textfont=dict(
+						size=10,
+						color=KU_COLORS["accent"],
+						weight=500,
+					),
+        ),
+        row=2,
+        col=2,
+        secondary_y=True,
+    )
+    fig.update_yaxes(
+        title_text="No. of Users",
+        range=[
+            0,
+            df["logged_users"].max() * 1.2
+            if not df["logged_users"].empty
+            else 10,
+        ],
+        row=2,
+        col=2,
+        secondary_y=False,
+    )
+    fig.update_yaxes(
+        title_text="TCP Connections",
+        range=[
+            0,
+            df["tcp_connections"].max() * 1.2
+            if not df["tcp_connections"].empty
+            else 10,
+        ],
+        row=2,
+        col=2,
+        secondary_y=True,
+    )
+    fig.update_xaxes(title_text="Time", row=2, col=2, tickformat="%H:%M\n%b %d")
+
+    # Simple layout update - CSS will handle dark mode colors
+    fig.update_layout(
+        height=CHART_CONFIG["default_height"],
+        showlegend=True,
+        title_text=f"Performance Analytics - {server_name}",
+    )
+
+    # Performance Summary
+    return {
+        "figure": fig.to_plotly_json(),
+        "avg_cpu": df["cpu_load_5min"].mean() if not df.empty else 0,
+        "max_ram": df["ram_percentage"].max() if not df.empty else 0,
+        "avg_disk": df["disk_percentage"].mean() if not df.empty else 0,
+    }
+
+
 def register_callbacks(app):
     """Register all dashboard callbacks with toast notifications"""
 
     @app.callback(
         [
-            Output("system-overview", "children"),
+            Output("metrics-store", "data"),
             Output("enhanced-server-cards", "children"),
             Output("last-updated", "children"),
             Output("toast-container", "children"),
@@ -51,25 +286,32 @@ def register_callbacks(app):
 
         try:
             # Trigger refresh if manual button clicked
-            if refresh_clicks and refresh_clicks > 0:
+            refresh_result = None
+            if ctx.triggered_id == "refresh-button" and refresh_clicks:
                 logger.info("Manual refresh triggered")
                 toasts.append(create_info_toast("Refreshing data..."))
+                refresh_result = trigger_dashboard_refresh()
 
-            # Update components
-            system_overview = create_system_overview()
-            server_cards = create_enhanced_server_cards()
+            # Fetch metrics once; the overview cards are derived client-side
+            metrics = get_latest_server_metrics()
+            metrics_store = get_metrics_store_data(metrics)
+            server_cards = create_enhanced_server_cards(metrics)
             timestamp = f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-            # Add success toast on manual refresh
-            if refresh_clicks and refresh_clicks > 0:
-                toasts = [
-                    create_success_toast(
-                        f"Dashboard refreshed successfully! {get_refresh_status_message()}"
-                    )
-                ]
+            # Replace the info toast with the refresh outcome
+            if refresh_result is not None:
+                status = get_refresh_status_message(refresh_result)
+                if refresh_result.success:
+                    toasts = [
+                        create_success_toast(
+                            f"Dashboard refreshed successfully! {status}"
+                        )
+                    ]
+                else:
+                    toasts = [create_warning_toast(status)]
 
             return (
-                system_overview,
+                metrics_store,
                 server_cards,
                 timestamp,
                 create_toast_container(toasts).children if toasts else [],
@@ -81,12 +323,31 @@ def register_callbacks(app):
                 create_error_toast("Failed to update dashboard. Please try again.")
             ]
             return (
-                html.Div("Error loading data"),
+                [],
                 html.Div("Error loading data"),
                 f"Error at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
                 create_toast_container(toasts).children,
             )
 
+    app.clientside_callback(
+        ClientsideFunction(namespace="overview", function_name="compute"),
+        [
+            Output("overview-total-servers", "children"),
+            Output("overview-online-servers", "children"),
+            Output("overview-warning-servers", "children"),
+            Output("overview-warning-note", "children"),
+            Output("overview-warning-note", "className"),
+            Output("overview-offline-servers", "children"),
+            Output("overview-offline-note", "children"),
+            Output("overview-offline-note", "className"),
+            Output("overview-avg-cpu", "children"),
+            Output("overview-avg-ram", "children"),
+            Output("overview-total-users", "children"),
+            Output("overview-avg-disk", "children"),
+        ],
+        Input("metrics-store", "data"),
+    )
+
     @app.callback(
         Output("enhanced-users-table", "children"),
         [
@@ -109,17 +370,29 @@ def register_callbacks(app):
                 },
             )
 
+    @app.callback(
+        Output({"type": "user-tab-content", "server": ALL}, "children"),
+        Input("enhanced-user-tabs", "value"),
+        State({"type": "user-tab-content", "server": ALL}, "id"),
+    )
+    def render_active_user_tab(active_server, tab_ids):
+        """Build the users table for the active tab only; others stay as they are"""
+        return [
+            create_user_tab_table(active_server, get_user_tab_rows(active_server))
+            if tab_id["server"] == active_server
+            else no_update
+            for tab_id in tab_ids
+        ]
+
     @app.callback(
         Output("network-monitor", "children"),
-        [
-            Input("interval-component", "n_intervals"),
-            Input("refresh-button", "n_clicks"),
-        ],
+        Input("metrics-store", "data"),
+        prevent_initial_call=True,
     )
-    def update_network_monitor(n_intervals, n_clicks):
-        """Update network monitor with error handling"""
+    def update_network_monitor(metrics):
+        """Update network monitor from the shared metrics store"""
         try:
-            return create_network_monitor()
+            return create_network_monitor(metrics or [])
         except Exception as e:
             logger.error(f"Error updating network monitor: {e}", exc_info=True)
             return html.Div(
@@ -170,207 +443,17 @@ def register_callbacks(app):
             return {}, html.Div("No server selected")
 
         try:
-            historical_data = get_historical_metrics(
+            analytics = _build_analytics_figure_json(
                 server_name, time_range or CHART_CONFIG["default_time_range"]
             )
 
-            if not historical_data:
+            if analytics is None:
                 return {}, html.Div(f"No data available for {server_name}")
 
-            df = pd.DataFrame(historical_data)
-            if not df.empty:
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-            # Convert columns to numeric
-            for col in [
-                "cpu_load_1min",
-                "cpu_load_5min",
-                "cpu_load_15min",
-                "ram_percentage",
-                "disk_percentage",
-                "logged_users",
-                "tcp_connections",
-            ]:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            # Create the comprehensive chart
-            fig = make_subplots(
-                rows=2,
-                cols=2,
-                subplot_titles=(
-                    "CPU Load Averages",
-                    "Memory Usage",
-                    "Disk Usage",
-                    "Network Activity",
-                ),
-                specs=[
-                    [{"secondary_y": False}, {"secondary_y": False}],
-                    [{"secondary_y": False}, {"secondary_y": True}],
-                ],
-            )
-
-            # CPU Load
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["cpu_load_1min"],
-                    mode="lines",
-                    name="1-min Load",
-                    line_shape="spline",
-                    line=dict(color=KU_COLORS["primary"], width=2),
-                ),
-                row=1,
-                col=1,
-            )
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["cpu_load_5min"],
-                    mode="lines",
-                    name="5-min Load",
-                    line_shape="spline",
-                    line=dict(color=KU_COLORS["secondary"], width=2),
-                ),
-                row=1,
-                col=1,
-            )
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["cpu_load_15min"],
-                    mode="lines",
-                    name="15-min Load",
-                    line_shape="spline",
-                    line=dict(color=KU_COLORS["accent"], width=2),
-                ),
-                row=1,
-                col=1,
-            )
-            fig.update_yaxes(title_text="CPU Load %", range=[0, 100], row=1, col=1)
-            fig.update_xaxes(title_text="Time", row=1, col=1, tickformat="%H:%M\n%b %d")
-
-            # Memory Usage
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["ram_percentage"],
-                    mode="lines+markers+text",
-                    name="RAM %",
-                    line=dict(color=KU_COLORS["warning"], width=3),
-                    text=["RAM %" if i == len(df["ram_percentage"]) - 1 else "" for i in range(len(df["ram_percentage"]))],
-					textposition="top left",
-					textfont=dict(
-						size=10,
-						color=KU_COLORS["warning"],
-						weight=500,
-					),
-                ),
-                row=1,
-                col=2,
-            )
-            fig.update_yaxes(title_text="Memory Usage %", range=[0, 100], row=1, col=2)
-            fig.update_xaxes(title_text="Time", row=1, col=2, tickformat="%H:%M\n%b %d")
-
-            # Disk Usage
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["disk_percentage"],
-                    mode="lines+markers+text",
-                    name="Disk %",
-                    line=dict(color=KU_COLORS["primary"], width=3),
-                    text=["Disk %" if i == len(df["disk_percentage"]) - 1 else "" for i in range(len(df["disk_percentage"]))],
-					textposition="top left",
-					textfont=dict(
-						size=10,
-						color=KU_COLORS["primary"],
-						weight=500,
-					),
-                ),
-                row=2,
-                col=1,
-            )
-            fig.update_yaxes(title_text="Disk Usage %", range=[0, 100], row=2, col=1)
-            fig.update_xaxes(title_text="Time", row=2, col=1, tickformat="%H:%M\n%b %d")
-
-            # Network Activity
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["logged_users"],
-                    mode="lines+markers+text",
-                    name="Users",
-                    line_shape="hv",
-                    line=dict(color=KU_COLORS["info"], width=2),
-                    text=["Users" if i == len(df["logged_users"]) - 1 else "" for i in range(len(df["logged_users"]))],
-					textposition="top left",
-					textfont=dict(
-						size=10,
-						color=KU_COLORS["info"],
-						weight=500,
-					),
-                ),
-                row=2,
-                col=2,
-            )
-            fig.add_trace(
-                go.Scatter(
-                    x=df["timestamp"],
-                    y=df["tcp_connections"],
-                    mode="lines+markers+text",
-                    name="TCP Connections",
-                    line=dict(color=KU_COLORS["accent"], width=2),
-                    text=["TCP Conn" if i == len(df["tcp_connections"]) - 1 else "" for i in range(len(df["tcp_connections"]))],
-					textposition="top left",
-					textfont=dict(
-						size=10,
-						color=KU_COLORS["accent"],
-						weight=500,
-					),
-                ),
-                row=2,
-                col=2,
-                secondary_y=True,
-            )
-            fig.update_yaxes(
-                title_text="No. of Users",
-                range=[
-                    0,
-                    df["logged_users"].max() * 1.2
-                    if not df["logged_users"].empty
-                    else 10,
-                ],
-                row=2,
-                col=2,
-                secondary_y=False,
-            )
-            fig.update_yaxes(
-                title_text="TCP Connections",
-                range=[
-                    0,
-                    df["tcp_connections"].max() * 1.2
-                    if not df["tcp_connections"].empty
-                    else 10,
-                ],
-                row=2,
-                col=2,
-                secondary_y=True,
-            )
-            fig.update_xaxes(title_text="Time", row=2, col=2, tickformat="%H:%M\n%b %d")
-
-            # Simple layout update - CSS will handle dark mode colors
-            fig.update_layout(
-                height=CHART_CONFIG["default_height"],
-                showlegend=True,
-                title_text=f"Performance Analytics - {server_name}",
-            )
-
-            # Performance Summary
-            latest_data = df.iloc[-1] if not df.empty else {}
-            avg_cpu = df["cpu_load_5min"].mean() if not df.empty else 0
-            max_ram = df["ram_percentage"].max() if not df.empty else 0
-            avg_disk = df["disk_percentage"].mean() if not df.empty else 0
+            fig = analytics["figure"]
+            avg_cpu = analytics["avg_cpu"]
+            max_ram = analytics["max_ram"]
+            avg_disk = analytics["avg_disk"]
 
             summary = html.Div(
                 [
@@ -416,31 +499,23 @@ def register_callbacks(app):
         Input("export-button", "n_clicks"),
         prevent_initial_call=True,
     )
-    def export_report(n_clicks):
+    def download_report(n_clicks):
         """Handle export button click with toast feedback"""
         if n_clicks:
             try:
                 logger.info("Export report requested")
-                # Generate export data
-                export_data = generate_export_report()
-
-                if export_data:
-                    # Export to Excel
-                    filepath = export_to_excel(export_data)
-
-                    if filepath:
-                        logger.info(f"Report exported successfully: {filepath}")
-                        toast = create_success_toast("Report exported successfully!")
-                        return dcc.send_file(filepath), create_toast_container(
-                            [toast]
-                        ).children
-                    else:
-                        logger.error("Failed to create Excel file")
-                        toast = create_error_toast("Failed to create export file")
-                        return None, create_toast_container([toast]).children
+                # Generate the report and write it to an Excel file
+                filepath = export_report("excel")
+
+                if filepath:
+                    logger.info(f"Report exported successfully: {filepath}")
+                    toast = create_success_toast("Report exported successfully!")
+                    return dcc.send_file(filepath), create_toast_container(
+                        [toast]
+                    ).children
                 else:
-                    logger.error("Failed to generate export data")
-                    toast = create_warning_toast("No data available to export")
+                    logger.error("Failed to generate or write export report")
+                    toast = create_error_toast("Failed to create export file")
                     return None, create_toast_container([toast]).children
 
             except Exception as e:
@@ -452,16 +527,13 @@ def register_callbacks(app):
 
     @app.callback(
         Output("server-grid", "children"),
-        [
-            Input("refresh-button", "n_clicks"),
-            Input("interval-component", "n_intervals"),
-        ],
-        prevent_initial_call=False,
+        Input("metrics-store", "data"),
+        prevent_initial_call=True,
     )
-    def refresh_server_grid(n_clicks, n_intervals):
-        """Refresh server grid when refresh button is clicked or interval triggers"""
+    def refresh_server_grid(metrics):
+        """Refresh server grid whenever the shared metrics store is updated"""
         try:
-            return create_compact_server_grid()
+            return create_compact_server_grid(metrics or [])
         except Exception as e:
             logger.error(f"Error refreshing server grid: {e}", exc_info=True)
             return html.Div(
@@ -5,12 +5,25 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from collections import namedtuple
 import logging
 
-from config import KU_COLORS, TABLE_CONFIG, CHART_CONFIG, LAYOUT_CONFIG
+from config import (
+    KU_COLORS,
+    KU_PRIMARY,
+    KU_SECONDARY,
+    KU_ACCENT,
+    KU_BORDER,
+    KU_TEXT_PRIMARY,
+    TABLE_CONFIG,
+    CHART_CONFIG,
+    CACHE_CONFIG,
+    LAYOUT_CONFIG,
+)
 from api_client import get_latest_server_metrics, get_top_users, get_historical_metrics
+from cache_utils import cached
 from utils import (
-    determine_server_status,
+    determine_server_statuses,
     get_performance_rating,
     generate_alerts,
     safe_float,
@@ -20,7 +33,11 @@ from utils import (
     sanitize_server_name,
 )
 from validation import validate_timestamp
-from data_processing import prepare_historical_dataframe
+from data_processing import (
+    prepare_historical_dataframe,
+    format_timestamps_for_plot,
+)
+from downsample import downsample_series
 from graph_config import (
     GRAPH_COLORS,
     ENHANCED_LAYOUT,
@@ -33,113 +50,276 @@ from table_card_config import (
     ENHANCED_TABLE_STYLE,
     get_enhanced_table_conditional_styles,
     get_network_table_conditional_styles,
+    get_conditional_styles_for_columns,
 )
 
 logger = logging.getLogger(__name__)
 
+# Static DataTable schemas, built once instead of on every render
+_NETWORK_COLUMNS = (
+    {"name": "🖥️ Server", "id": "server_name"},
+    {"name": "🔌 TCP Connections", "id": "tcp_connections", "type": "numeric"},
+    {"name": "🔐 SSH Users", "id": "active_ssh_users", "type": "numeric"},
+    {"name": "🖥️ VNC Users", "id": "active_vnc_users", "type": "numeric"},
+    {"name": "⚡ Status", "id": "status"},
+)
 
-def create_system_overview():
-    """Create system overview cards"""
-    metrics = get_latest_server_metrics()
+_USERS_COLUMNS = (
+    {"name": "👤 Username", "id": "username"},
+    {"name": "💻 CPU %", "id": "cpu", "type": "numeric"},
+    {"name": "🧠 Memory %", "id": "mem", "type": "numeric"},
+    {"name": "💾 Disk (GB)", "id": "disk", "type": "numeric"},
+    {"name": "⚙️ Processes", "id": "process_count", "type": "numeric"},
+    {"name": "📊 Top Process", "id": "top_process"},
+    {"name": "🕐 Last Login", "id": "last_login", "type": "datetime"},
+    {"name": "📝 Full Name", "id": "full_name"},
+    {"name": "⚡ Status", "id": "status"},
+)
 
-    total_servers = len(metrics)
-    online_servers = len([m for m in metrics if determine_server_status(m) == "online"])
-    warning_servers = len(
-        [m for m in metrics if determine_server_status(m) == "warning"]
+# Only the rules for columns each table renders, so DataTable tests fewer per cell
+_NETWORK_STYLE_COND = tuple(
+    get_conditional_styles_for_columns(
+        get_network_table_conditional_styles(),
+        [column["id"] for column in _NETWORK_COLUMNS],
     )
-    offline_servers = len(
-        [m for m in metrics if determine_server_status(m) == "offline"]
+)
+_USERS_STYLE_COND = tuple(
+    get_conditional_styles_for_columns(
+        get_enhanced_table_conditional_styles(),
+        [column["id"] for column in _USERS_COLUMNS],
     )
+)
+
+# Shared by every render; Dash only serializes these, never mutates
+_USER_TABLE_CONDITIONAL = list(_USERS_STYLE_COND)
+_NETWORK_TABLE_CONDITIONAL = list(_NETWORK_STYLE_COND)
+# Users tables are virtualized: only rows scrolled into this box are mounted
+_USER_TABLE_STYLE = {
+    **ENHANCED_TABLE_STYLE["table"],
+    "height": "500px",
+    "overflowY": "auto",
+}
+_USER_TAB_STYLE = {"padding": "15px", "fontSize": "14px", "borderRadius": "60px"}
+_USER_TAB_SELECTED_STYLE = {
+    "backgroundColor": KU_PRIMARY,
+    "color": "white",
+    "padding": "15px",
+    "fontSize": "14px",
+    "fontWeight": "600",
+    "borderRadius": "60px",
+}
+
+# Fields (with defaults) read from each server's metrics when rendering cards
+_GRID_FIELDS = {
+    "server_name": "Unknown",
+    "cpu_load_5min": 0,
+    "ram_percentage": 0,
+    "disk_percentage": 0,
+    "logged_users": 0,
+}
+
+_SERVER_CARD_FIELDS = {
+    **_GRID_FIELDS,
+    "cpu_load_1min": 0,
+    "cpu_load_15min": 0,
+    "timestamp": "Unknown",
+    "ram_used": 0,
+    "ram_total": 0,
+    "disk_used": 0,
+    "disk_total": 0,
+    "operating_system": "Unknown",
+    "physical_cpus": 0,
+    "virtual_cpus": 0,
+    "last_boot": "Unknown",
+    "active_ssh_users": 0,
+    "active_vnc_users": 0,
+}
+
+# Row types for those field sets; each carries its defaults in _field_defaults
+_GridRow = namedtuple("GridRow", _GRID_FIELDS, defaults=_GRID_FIELDS.values())
+_ServerCardRow = namedtuple(
+    "ServerCardRow", _SERVER_CARD_FIELDS, defaults=_SERVER_CARD_FIELDS.values()
+)
+
+_CARD_TIMESTAMP_FORMAT = "%b %d, %Y %H:%M"
+
+# Threshold bands for user-table highlighting: (thresholds, labels), where a
+# value above the i-th threshold gets label i+1, matching the styles in
+# get_enhanced_table_conditional_styles
+_USAGE_BANDS = {
+    "cpu": (np.array([50.0, 70.0]), np.array(["ok", "warn", "danger"], dtype=object)),
+    "mem": (np.array([50.0, 70.0]), np.array(["ok", "warn", "danger"], dtype=object)),
+    "disk": (np.array([10.0]), np.array(["ok", "warn"], dtype=object)),
+}
+
+_NETWORK_BANDS = {
+    "tcp_connections": (
+        np.array([50.0, 100.0]),
+        np.array(["ok", "warn", "danger"], dtype=object),
+    ),
+}
+
+_TABLE_CSS = (
+    {
+        "selector": ".dash-spreadsheet-container",
+        "rule": "border-radius: 12px; overflow: hidden;",
+    },
+)
+
+
+def get_metrics_store_data(metrics=None):
+    """
+    Build the payload for the shared ``metrics-store``
+
+    Each server's metrics are shipped raw with their computed status attached,
+    so the browser can derive the overview counters without a round trip.
+
+    Args:
+        metrics: Latest server metrics (fetched from the API when omitted)
+
+    Returns:
+        List of metric dictionaries with a ``status`` key
+    """
+    if metrics is None:
+        metrics = get_latest_server_metrics()
+
+    statuses = determine_server_statuses(metrics)
+    return [{**m, "status": status} for m, status in zip(metrics, statuses)]
 
-    avg_cpu = (
-        np.mean([safe_float(m.get("cpu_load_5min", 0)) for m in metrics])
-        if metrics
-        else 0
-    )
-    avg_ram = np.mean([m.get("ram_percentage", 0) for m in metrics]) if metrics else 0
-    avg_disk = np.mean([m.get("disk_percentage", 0) for m in metrics]) if metrics else 0
 
-    total_users = sum([m.get("logged_users", 0) for m in metrics])
+def _iter_metric_rows(metrics, row_type):
+    """
+    Iterate server metrics as namedtuples instead of dicts
+
+    Missing fields take the row type's default; fields present with a None
+    value stay None, as with ``dict.get``.
+
+    Args:
+        metrics: List of server metric dictionaries
+        row_type: Namedtuple type whose field defaults are the fallbacks
+
+    Returns:
+        Iterator of ``row_type`` tuples, one per server, in input order
+    """
+    fields = row_type._field_defaults.items()
+    return (row_type(*(m.get(k, d) for k, d in fields)) for m in metrics)
+
+
+def _format_card_timestamp(timestamp_raw):
+    """Format a single card timestamp, falling back to the raw value"""
+    try:
+        return validate_timestamp(timestamp_raw).strftime(_CARD_TIMESTAMP_FORMAT)
+    except Exception as e:
+        logger.warning(f"Failed to parse timestamp {timestamp_raw}: {e}")
+        return str(timestamp_raw) if timestamp_raw != "Unknown" else "Unknown"
+
+
+def _format_card_timestamps(raw_timestamps):
+    """
+    Format all server card timestamps in one vectorized pass
+
+    Args:
+        raw_timestamps: List of raw timestamp values, one per server
+
+    Returns:
+        List of display strings in the same order
+    """
+    try:
+        parsed = pd.to_datetime(
+            pd.Series(raw_timestamps, dtype=object), errors="coerce", format="ISO8601"
+        )
+        formatted = parsed.dt.strftime(_CARD_TIMESTAMP_FORMAT).tolist()
+    except (ValueError, TypeError, AttributeError) as e:
+        # e.g. mixed timezone offsets; parse each value individually instead
+        logger.warning(f"Vectorized timestamp formatting failed: {e}")
+        return [_format_card_timestamp(ts) for ts in raw_timestamps]
+
+    return [
+        text if isinstance(text, str) else _format_card_timestamp(raw)
+        for text, raw in zip(formatted, raw_timestamps)
+    ]
+
+
+def _add_usage_bands(rows, bands=_USAGE_BANDS):
+    """
+    Tag table rows with precomputed threshold bands
+
+    The users table styles cells by matching ``{cpu_band} = "warn"`` etc.,
+    which DataTable evaluates far faster than per-cell range expressions.
+
+    Args:
+        rows: List of row dictionaries (modified in place)
+        bands: Column -> (upper-inclusive thresholds, band labels); defaults
+            to the users table's cpu/mem/disk bands
+
+    Returns:
+        The same list, with ``<column>_band`` keys added
+    """
+    if not rows:
+        return rows
+
+    for column, (thresholds, labels) in bands.items():
+        values = np.fromiter(
+            (row.get(column, np.nan) for row in rows), dtype=np.float64, count=len(rows)
+        )
+        codes = np.digitize(values, thresholds, right=True)
+        codes[np.isnan(values)] = 0
+        for row, band in zip(rows, labels[codes]):
+            row[f"{column}_band"] = band
+
+    return rows
+
+
+def _overview_stat(value_id, label, note_id=None, note=None):
+    """Create a single overview stat card whose value is filled client-side"""
+    children = [
+        html.Span("-", id=value_id, className="stat-value"),
+        html.Div(label, className="stat-label"),
+    ]
+    if note_id:
+        children.append(html.Div(id=note_id, className="stat-change"))
+    elif note:
+        children.append(html.Div(note, className="stat-change"))
+
+    return html.Div(children, className="overview-stat")
+
+
+def create_system_overview():
+    """
+    Create system overview cards
 
+    The counters are computed in the browser by the ``overview.compute``
+    clientside callback (assets/overview.js) from the ``metrics-store`` data.
+    """
     return html.Div(
         [
             html.Div(
                 [
-                    html.Div(
-                        [
-                            html.Span(f"{total_servers}", className="stat-value"),
-                            html.Div("Total Servers", className="stat-label"),
-                        ],
-                        className="overview-stat",
+                    _overview_stat("overview-total-servers", "Total Servers"),
+                    _overview_stat("overview-online-servers", "Online Servers"),
+                    _overview_stat(
+                        "overview-warning-servers",
+                        "Servers with Warnings",
+                        note_id="overview-warning-note",
                     ),
-                    html.Div(
-                        [
-                            html.Span(f"{online_servers}", className="stat-value"),
-                            html.Div("Online Servers", className="stat-label"),
-                        ],
-                        className="overview-stat",
+                    _overview_stat(
+                        "overview-offline-servers",
+                        "Offline Servers",
+                        note_id="overview-offline-note",
                     ),
-                    html.Div(
-                        [
-                            html.Span(f"{warning_servers}", className="stat-value"),
-                            html.Div("Servers with Warnings", className="stat-label"),
-                            html.Div(
-                                "Requires attention"
-                                if warning_servers > 0
-                                else "No action needed",
-                                className="stat-change negative"
-                                if warning_servers > 0
-                                else "stat-change positive",
-                            ),
-                        ],
-                        className="overview-stat",
+                    _overview_stat(
+                        "overview-avg-cpu", "Avg CPU Load", note="5-minute average"
                     ),
-                    html.Div(
-                        [
-                            html.Span(f"{offline_servers}", className="stat-value"),
-                            html.Div("Offline Servers", className="stat-label"),
-                            html.Div(
-                                "Check connectivity"
-                                if offline_servers > 0
-                                else "No action needed",
-                                className="stat-change negative"
-                                if offline_servers > 0
-                                else "stat-change positive",
-                            ),
-                        ],
-                        className="overview-stat",
+                    _overview_stat(
+                        "overview-avg-ram", "Avg RAM Usage", note="Across all servers"
                     ),
-                    html.Div(
-                        [
-                            html.Span(f"{avg_cpu:.1f}", className="stat-value"),
-                            html.Div("Avg CPU Load", className="stat-label"),
-                            html.Div("5-minute average", className="stat-change"),
-                        ],
-                        className="overview-stat",
+                    _overview_stat(
+                        "overview-total-users", "Users", note="Currently logged in"
                     ),
-                    html.Div(
-                        [
-                            html.Span(f"{avg_ram:.1f}%", className="stat-value"),
-                            html.Div("Avg RAM Usage", className="stat-label"),
-                            html.Div("Across all servers", className="stat-change"),
-                        ],
-                        className="overview-stat",
-                    ),
-                    html.Div(
-                        [
-                            html.Span(f"{total_users}", className="stat-value"),
-                            html.Div("Users", className="stat-label"),
-                            html.Div("Currently logged in", className="stat-change"),
-                        ],
-                        className="overview-stat",
-                    ),
-                    html.Div(
-                        [
-                            html.Span(f"{avg_disk:.1f}%", className="stat-value"),
-                            html.Div("Avg Disk Usage", className="stat-label"),
-                            html.Div("Storage utilization", className="stat-change"),
-                        ],
-                        className="overview-stat",
+                    _overview_stat(
+                        "overview-avg-disk",
+                        "Avg Disk Usage",
+                        note="Storage utilization",
                     ),
                 ],
                 className="system-overview",
@@ -151,7 +331,8 @@ def create_system_overview():
 def create_alert_panel():
     """Create alerts panel"""
     metrics = get_latest_server_metrics()
-    alerts = generate_alerts(metrics)
+    # Only the first max_alerts are shown, so don't build the rest
+    alerts = generate_alerts(metrics, limit=TABLE_CONFIG["max_alerts"])
 
     if not alerts:
         return html.Div(
@@ -185,7 +366,7 @@ def create_alert_panel():
         )
 
     alert_items = []
-    for alert in alerts[: TABLE_CONFIG["max_alerts"]]:  # Show only top 5 alerts
+    for alert in alerts:
         alert_items.append(
             html.Div(
                 [
@@ -208,9 +389,10 @@ def create_alert_panel():
     return html.Div(alert_items, className="alert-panel")
 
 
-def create_compact_server_grid():
+def create_compact_server_grid(metrics=None):
     """Create grid of compact server cards with maximum data density"""
-    metrics = get_latest_server_metrics()
+    if metrics is None:
+        metrics = get_latest_server_metrics()
 
     if not metrics:
         return html.Div(
@@ -229,15 +411,15 @@ def create_compact_server_grid():
 
     server_cards = []
 
-    for metric in metrics:
-        server_name = metric.get("server_name", "Unknown")
-        status = determine_server_status(metric)
+    statuses = determine_server_statuses(metrics)
+    for row, status in zip(_iter_metric_rows(metrics, _GridRow), statuses):
+        server_name = row.server_name
 
         # Extract key metrics
-        cpu_load = safe_float(metric.get("cpu_load_5min", 0))
-        ram_percent = metric.get("ram_percentage", 0)
-        disk_percent = metric.get("disk_percentage", 0)
-        users = metric.get("logged_users", 0)
+        cpu_load = safe_float(row.cpu_load_5min)
+        ram_percent = row.ram_percentage
+        disk_percent = row.disk_percentage
+        users = row.logged_users
 
         # Determine metric value classes for color coding
         cpu_class = "critical" if cpu_load > 80 else "warning" if cpu_load > 50 else ""
@@ -318,9 +500,10 @@ def create_compact_server_grid():
     return html.Div(server_cards, className="server-grid")
 
 
-def create_enhanced_server_cards():
+def create_enhanced_server_cards(metrics=None):
     """Create enhanced server cards with detailed information"""
-    metrics = get_latest_server_metrics()
+    if metrics is None:
+        metrics = get_latest_server_metrics()
 
     if not metrics:
         return html.Div(
@@ -328,18 +511,21 @@ def create_enhanced_server_cards():
         )
 
     server_cards = []
+    rows = list(_iter_metric_rows(metrics, _ServerCardRow))
+    timestamp_strs = _format_card_timestamps([row.timestamp for row in rows])
 
-    for metric in metrics:
-        server_name = metric.get("server_name", "Unknown")
+    statuses = determine_server_statuses(metrics)
+
+    for row, timestamp_str, status in zip(rows, timestamp_strs, statuses):
+        server_name = row.server_name
         historical_data = get_historical_metrics(
             server_name, CHART_CONFIG["default_time_range"]
         )
-        status = determine_server_status(metric)
 
         # Get performance rating
-        cpu_load = safe_float(metric.get("cpu_load_5min", 0))
-        ram_percentage = metric.get("ram_percentage", 0)
-        disk_percentage = metric.get("disk_percentage", 0)
+        cpu_load = safe_float(row.cpu_load_5min)
+        ram_percentage = row.ram_percentage
+        disk_percentage = row.disk_percentage
 
         perf_rating, perf_color = get_performance_rating(
             cpu_load, ram_percentage, disk_percentage
@@ -349,17 +535,6 @@ def create_enhanced_server_cards():
         status_class = get_status_badge_class(status)
         status_text = status.upper()
 
-        # Format timestamp with error handling
-        timestamp_raw = metric.get("timestamp", "Unknown")
-        try:
-            timestamp_dt = validate_timestamp(timestamp_raw)
-            timestamp_str = timestamp_dt.strftime("%b %d, %Y %H:%M")
-        except Exception as e:
-            logger.warning(f"Failed to parse timestamp {timestamp_raw}: {e}")
-            timestamp_str = (
-                str(timestamp_raw) if timestamp_raw != "Unknown" else "Unknown"
-            )
-
         # Enhanced historical graph with polished styling
         fig = go.Figure()
 
@@ -579,7 +754,7 @@ def create_enhanced_server_cards():
                         html.Div(
                             [
                                 html.Span(
-                                    f"{metric.get('logged_users', 0)}",
+                                    f"{row.logged_users}",
                                     className="metric-value",
                                 ),
                                 html.Span("Connected Users", className="metric-label"),
@@ -618,7 +793,7 @@ def create_enhanced_server_cards():
                         html.Div(
                             [
                                 html.Div(
-                                    f"Memory: {metric.get('ram_used', 0):} / {metric.get('ram_total', 0)}",
+                                    f"Memory: {row.ram_used} / {row.ram_total}",
                                     style={
                                         "fontSize": "12px",
                                         "marginBottom": "4px",
@@ -639,7 +814,7 @@ def create_enhanced_server_cards():
                         html.Div(
                             [
                                 html.Div(
-                                    f"Disk: {metric.get('disk_used', 0)} / {metric.get('disk_total', 0)}",
+                                    f"Disk: {row.disk_used} / {row.disk_total}",
                                     style={
                                         "fontSize": "12px",
                                         "marginBottom": "4px",
@@ -667,7 +842,7 @@ def create_enhanced_server_cards():
                             [
                                 html.Span("Operating System", className="detail-label"),
                                 html.Span(
-                                    f"{metric.get('operating_system', 'Unknown')}",
+                                    f"{row.operating_system}",
                                     className="detail-value",
                                 ),
                             ],
@@ -679,7 +854,7 @@ def create_enhanced_server_cards():
                                     "CPU Configuration", className="detail-label"
                                 ),
                                 html.Span(
-                                    f"Physical: {metric.get('physical_cpus', 0)}, Virtual: {metric.get('virtual_cpus', 0)}",
+                                    f"Physical: {row.physical_cpus}, Virtual: {row.virtual_cpus}",
                                     className="detail-value",
                                 ),
                             ],
@@ -689,7 +864,7 @@ def create_enhanced_server_cards():
                             [
                                 html.Span("Last Boot Time", className="detail-label"),
                                 html.Span(
-                                    metric.get("last_boot", "Unknown"),
+                                    row.last_boot,
                                     className="detail-value",
                                 ),
                             ],
@@ -699,7 +874,7 @@ def create_enhanced_server_cards():
                             [
                                 html.Span("User Sessions", className="detail-label"),
                                 html.Span(
-                                    f"SSH: {metric.get('active_ssh_users', 0)}, VNC: {metric.get('active_vnc_users', 0)}",
+                                    f"SSH: {row.active_ssh_users}, VNC: {row.active_vnc_users}",
                                     className="detail-value",
                                 ),
                             ],
@@ -709,7 +884,7 @@ def create_enhanced_server_cards():
                             [
                                 html.Span("Load Averages", className="detail-label"),
                                 html.Span(
-                                    f"1m: {metric.get('cpu_load_1min', 0)} | 5m: {metric.get('cpu_load_5min', 0)} | 15m: {metric.get('cpu_load_15min', 0)}",
+                                    f"1m: {row.cpu_load_1min} | 5m: {row.cpu_load_5min} | 15m: {row.cpu_load_15min}",
                                     className="detail-value",
                                 ),
                             ],
@@ -743,9 +918,10 @@ def create_enhanced_server_cards():
     )
 
 
-def create_network_monitor():
+def create_network_monitor(metrics=None):
     """Create network monitoring component"""
-    metrics = get_latest_server_metrics()
+    if metrics is None:
+        metrics = get_latest_server_metrics()
 
     if not metrics:
         return html.Div(
@@ -811,52 +987,40 @@ def create_network_monitor():
                             # Enhanced network table with modern styling
                             dash_table.DataTable(
                                 id="network-table",
-                                columns=[
-                                    {"name": "🖥️ Server", "id": "server_name"},
-                                    {
-                                        "name": "🔌 TCP Connections",
-                                        "id": "tcp_connections",
-                                        "type": "numeric",
-                                    },
-                                    {
-                                        "name": "🔐 SSH Users",
-                                        "id": "active_ssh_users",
-                                        "type": "numeric",
-                                    },
-                                    {
-                                        "name": "🖥️ VNC Users",
-                                        "id": "active_vnc_users",
-                                        "type": "numeric",
-                                    },
-                                    {"name": "⚡ Status", "id": "status"},
-                                ],
-                                data=[
-                                    {
-                                        "server_name": m.get("server_name", "Unknown"),
-                                        "tcp_connections": m.get("tcp_connections", 0),
-                                        "active_ssh_users": m.get(
-                                            "active_ssh_users", 0
-                                        ),
-                                        "active_vnc_users": m.get(
-                                            "active_vnc_users", 0
-                                        ),
-                                        "status": determine_server_status(m).title(),
-                                    }
-                                    for m in metrics
-                                ],
+                                columns=list(_NETWORK_COLUMNS),
+                                data=_add_usage_bands(
+                                    [
+                                        {
+                                            "server_name": m.get(
+                                                "server_name", "Unknown"
+                                            ),
+                                            "tcp_connections": m.get(
+                                                "tcp_connections", 0
+                                            ),
+                                            "active_ssh_users": m.get(
+                                                "active_ssh_users", 0
+                                            ),
+                                            "active_vnc_users": m.get(
+                                                "active_vnc_users", 0
+                                            ),
+                                            "status": status.title(),
+                                        }
+                                        for m, status in zip(
+                                            metrics, determine_server_statuses(metrics)
+                                        )
+                                    ],
+                                    _NETWORK_BANDS,
+                                ),
                                 style_table=ENHANCED_TABLE_STYLE["table"],
                                 style_cell=ENHANCED_TABLE_STYLE["cell"],
                                 style_header=ENHANCED_TABLE_STYLE["header"],
                                 style_data=ENHANCED_TABLE_STYLE["data"],
-                                style_data_conditional=get_network_table_conditional_styles(),
+                                style_data_conditional=_NETWORK_TABLE_CONDITIONAL,
                                 sort_action="native",
                                 filter_action="native",
                                 page_size=TABLE_CONFIG["network_page_size"],
                                 page_action="native",
-                                css=[{
-                                    "selector": ".dash-spreadsheet-container",
-                                    "rule": "border-radius: 12px; overflow: hidden;"
-                                }],
+                                css=list(_TABLE_CSS),
                             )
                         ],
                         className="enhanced-table",
@@ -867,11 +1031,58 @@ def create_network_monitor():
     )
 
 
+@cached(ttl_seconds=CACHE_CONFIG["users_ttl"], key_prefix="user_tab_rows_")
+def load_user_tab_rows():
+    """
+    Fetch top users and prepare their tab table rows, grouped by server
+
+    Refreshed whenever the users table is rebuilt; tab switches read the
+    cached rows server-side instead of shipping every server's rows to the
+    browser.
+
+    Returns:
+        Dict of server name -> prepared user rows (with usage bands), in API
+        order; empty when there is no user data
+    """
+    users_by_server = {}
+    for user in get_top_users():
+        # Format last_login for display while keeping it sortable
+        last_login = user["last_login"]
+        if last_login:
+            try:
+                dt = datetime.strptime(last_login, "%Y-%m-%dT%H:%M:%S")
+                last_login = dt.strftime("%Y-%m-%d")
+            except Exception:
+                pass  # Keep original format if parsing fails
+
+        users_by_server.setdefault(user["server_name"], []).append(
+            {
+                **user,
+                "cpu": float(user["cpu"]),
+                "mem": float(user["mem"]),
+                "disk": float(user["disk"]),
+                "process_count": int(user["process_count"]),
+                "last_login": last_login,
+                "status": "High Usage" if is_high_usage_user(user) else "Normal",
+            }
+        )
+
+    return {
+        server_name: _add_usage_bands(rows)
+        for server_name, rows in users_by_server.items()
+    }
+
+
+def get_user_tab_rows(server_name):
+    """Prepared user rows for one server's tab (empty if it has none)"""
+    return load_user_tab_rows().get(server_name, [])
+
+
 def create_enhanced_users_table():
     """Create enhanced users table with more details"""
-    users_data = get_top_users()
+    users_by_server = load_user_tab_rows.refresh()
 
-    if not users_data:
+    if not users_by_server:
         return html.Div(
             "No user data available",
             style={
@@ -883,25 +1094,12 @@ def create_enhanced_users_table():
             },
         )
 
-    # Group users by server
-    servers = {}
-    total_users = len(users_data)
-
-    high_usage_users = len([u for u in users_data if is_high_usage_user(u)])
-
-    for user in users_data:
-        server_name = user["server_name"]
-        if server_name not in servers:
-            servers[server_name] = []
-        servers[server_name].append(user)
-
-        # Format last_login for display while keeping it sortable
-        if user["last_login"]:
-            try:
-                dt = datetime.strptime(user["last_login"], "%Y-%m-%dT%H:%M:%S")
-                user["last_login"] = dt.strftime("%Y-%m-%d")
-            except Exception:
-                pass  # Keep original format if parsing fails
+    total_users = sum(len(rows) for rows in users_by_server.values())
+    high_usage_users = sum(
+        row["status"] == "High Usage"
+        for rows in users_by_server.values()
+        for row in rows
+    )
 
     # Summary statistics
     summary = html.Div(
@@ -915,7 +1113,7 @@ def create_enhanced_users_table():
             ),
             html.Div(
                 [
-                    html.Span(f"{len(servers)}", className="stat-value"),
+                    html.Span(f"{len(users_by_server)}", className="stat-value"),
                     html.Div("Servers with Users", className="stat-label"),
                 ],
                 className="overview-stat",
@@ -931,63 +1129,16 @@ def create_enhanced_users_table():
         style={"display": "flex", "gap": "20px", "margin": "20px 0"},
     )
 
-    # Create tabs for each server
+    # Tabs start empty; the active tab's table is rendered on demand by the
+    # render_active_user_tab callback from the cached rows (get_user_tab_rows)
     tabs = []
-    for server_name, users in servers.items():
-        # Enhanced users table with modern styling
-        table = dash_table.DataTable(
-            id=f"users-table-{sanitize_server_name(server_name)}",
-            columns=[
-                {"name": "👤 Username", "id": "username"},
-                {"name": "💻 CPU %", "id": "cpu", "type": "numeric"},
-                {"name": "🧠 Memory %", "id": "mem", "type": "numeric"},
-                {"name": "💾 Disk (GB)", "id": "disk", "type": "numeric"},
-                {"name": "⚙️ Processes", "id": "process_count", "type": "numeric"},
-                {"name": "📊 Top Process", "id": "top_process"},
-                {"name": "🕐 Last Login", "id": "last_login", "type": "datetime"},
-                {"name": "📝 Full Name", "id": "full_name"},
-                {"name": "⚡ Status", "id": "status"},
-            ],
-            data=[
-                {
-                    **user,
-                    "cpu": float(user["cpu"]),
-                    "mem": float(user["mem"]),
-                    "disk": float(user["disk"]),
-                    "process_count": int(user["process_count"]),
-                    "last_login": user["last_login"],
-                    "status": "High Usage" if is_high_usage_user(user) else "Normal",
-                }
-                for user in users
-            ],
-            style_table=ENHANCED_TABLE_STYLE["table"],
-            style_cell=ENHANCED_TABLE_STYLE["cell"],
-            style_header=ENHANCED_TABLE_STYLE["header"],
-            style_data=ENHANCED_TABLE_STYLE["data"],
-            style_data_conditional=get_enhanced_table_conditional_styles(),
-            sort_action="native",
-            filter_action="native",
-            page_size=TABLE_CONFIG["users_page_size"],
-            page_action="native",
-            css=[{
-                "selector": ".dash-spreadsheet-container",
-                "rule": "border-radius: 12px; overflow: hidden;"
-            }],
-        )
-
+    for server_name, rows in users_by_server.items():
         tab = dcc.Tab(
-            label=f"{server_name} ({len(users)})",
+            label=f"{server_name} ({len(rows)})",
             value=server_name,
-            children=[table],
-            style={"padding": "15px", "fontSize": "14px", "borderRadius": "60px"},
-            selected_style={
-                "backgroundColor": KU_COLORS["primary"],
-                "color": "white",
-                "padding": "15px",
-                "fontSize": "14px",
-                "fontWeight": "600",
-                "borderRadius": "60px",
-            },
+            children=[html.Div(id={"type": "user-tab-content", "server": server_name})],
+            style=_USER_TAB_STYLE,
+            selected_style=_USER_TAB_SELECTED_STYLE,
         )
         tabs.append(tab)
 
@@ -996,7 +1147,7 @@ def create_enhanced_users_table():
             summary,
             dcc.Tabs(
                 id="enhanced-user-tabs",
-                value=list(servers.keys())[0] if servers else "",
+                value=next(iter(users_by_server)),
                 children=tabs,
                 style={"margin": "20px 0"},
             ),
@@ -1004,29 +1155,118 @@ def create_enhanced_users_table():
     )
 
 
-def create_enhanced_historical_graphs():
-    """Create enhanced historical graphs with better visualizations"""
-    metrics = get_latest_server_metrics()
+def create_user_tab_table(server_name, rows):
+    """
+    Create the users DataTable for a single server tab
+
+    Args:
+        server_name: Name of the server the tab belongs to
+        rows: Prepared user rows (with usage bands) for that server
+
+    Returns:
+        DataTable component
+    """
+    return dash_table.DataTable(
+        id=f"users-table-{sanitize_server_name(server_name)}",
+        columns=list(_USERS_COLUMNS),
+        data=rows,
+        style_table=_USER_TABLE_STYLE,
+        style_cell=ENHANCED_TABLE_STYLE["cell"],
+        style_header=ENHANCED_TABLE_STYLE["header"],
+        style_data=ENHANCED_TABLE_STYLE["data"],
+        style_data_conditional=_USER_TABLE_CONDITIONAL,
+        sort_action="native",
+        filter_action="native",
+        virtualization=True,
+        fixed_rows={"headers": True},
+        page_action="none",
+        css=list(_TABLE_CSS),
+    )
 
-    if not metrics:
-        return html.Div(
-            "No server data available", style={"text-align": "center", "margin": "20px"}
-        )
 
-    server_name = metrics[0]["server_name"]
-    historical_data = get_historical_metrics(
-        server_name, CHART_CONFIG["default_time_range"]
+@cached(ttl_seconds=CACHE_CONFIG["historical_ttl"], key_prefix="history_df_")
+def load_historical_dataframe(server_name, hours):
+    """
+    Load a server's history as a prepared DataFrame
+
+    Cached per (server_name, hours); the default range is kept warm by
+    ``prefetch_historical_data``, so chart callbacks read an already-parsed
+    frame instead of building one. Callers must not mutate the result.
+
+    Args:
+        server_name: Name of the server
+        hours: Number of hours of history
+
+    Returns:
+        Prepared DataFrame (empty when there is no data)
+    """
+    return prepare_historical_dataframe(
+        get_historical_metrics(server_name, hours), server_name
     )
 
-    if not historical_data:
-        return html.Div(
-            f"No historical data available for {server_name}",
-            style={"text-align": "center"},
+
+def prefetch_historical_data():
+    """
+    Refresh cached history for every server at the default time range
+
+    Other ranges are fetched on demand when a user selects them, so the
+    warmer's API load stays one request per server per interval.
+    """
+    hours = CHART_CONFIG["default_time_range"]
+    metrics = get_latest_server_metrics()
+    for metric in metrics:
+        server_name = metric.get("server_name")
+        if not server_name:
+            continue
+        get_historical_metrics.refresh(server_name, hours)
+        load_historical_dataframe.refresh(server_name, hours)
+    logger.info(f"Prefetched historical data for {len(metrics)} servers")
+
+
+@cached(ttl_seconds=CACHE_CONFIG["historical_ttl"], key_prefix="historical_fig_")
+def _build_historical_figure_json(server_name, hours):
+    """
+    Build the multi-metric historical figure as a Plotly JSON dict
+
+    The result is cached per (server_name, hours) for the same TTL as the
+    underlying historical data, so re-renders skip both figure construction
+    and Plotly's Python-side serialization.
+
+    Args:
+        server_name: Name of the server
+        hours: Number of hours of history to plot
+
+    Returns:
+        Figure dict ready for dcc.Graph, or None when there is no data
+    """
+    df = load_historical_dataframe(server_name, hours)
+
+    if df.empty:
+        return None
+
+    # Decimate long ranges (e.g. a week of samples) before sending to the browser
+    series = {}
+    for column in (
+        "cpu_load_1min",
+        "cpu_load_5min",
+        "cpu_load_15min",
+        "ram_percentage",
+        "disk_percentage",
+        "logged_users",
+        "tcp_connections",
+    ):
+        x, y = downsample_series(
+            df["timestamp"], df[column], CHART_CONFIG["max_trace_points"]
         )
+        series[column] = (format_timestamps_for_plot(x), y)
 
-    df = pd.DataFrame(historical_data)
-    if not df.empty:
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
+    # Long ranges render through WebGL; it has no spline smoothing, so short
+    # ranges keep the SVG renderer and its smoothed curves
+    use_webgl = len(series["cpu_load_1min"][0]) > CHART_CONFIG["webgl_threshold"]
+    Trace = go.Scattergl if use_webgl else go.Scatter
+
+    def _smooth(smoothing):
+        return {} if use_webgl else {"shape": "spline", "smoothing": smoothing}
 
     # Create comprehensive multi-metric dashboard with enhanced styling
     fig = make_subplots(
@@ -1048,12 +1288,12 @@ def create_enhanced_historical_graphs():
 
     # Enhanced CPU Load traces with smooth curves and fills
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["cpu_load_1min"],
+        Trace(
+            x=series["cpu_load_1min"][0],
+            y=series["cpu_load_1min"][1],
             mode="lines",
             name="1-min Load",
-            line=dict(color=KU_COLORS["primary"], width=2.5, shape="spline", smoothing=1.0),
+            line=dict(color=KU_PRIMARY, width=2.5, **_smooth(1.0)),
             hovertemplate="<b>1-min</b>: %{y:.2f}%<extra></extra>",
             fill="tonexty",
             fillcolor=GRAPH_COLORS["cpu"]["fill"],
@@ -1062,12 +1302,12 @@ def create_enhanced_historical_graphs():
         col=1,
     )
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["cpu_load_5min"],
+        Trace(
+            x=series["cpu_load_5min"][0],
+            y=series["cpu_load_5min"][1],
             mode="lines",
             name="5-min Load",
-            line=dict(color=KU_COLORS["secondary"], width=2, shape="spline", smoothing=1.0),
+            line=dict(color=KU_SECONDARY, width=2, **_smooth(1.0)),
             hovertemplate="<b>5-min</b>: %{y:.2f}%<extra></extra>",
             opacity=0.8,
         ),
@@ -1075,12 +1315,12 @@ def create_enhanced_historical_graphs():
         col=1,
     )
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["cpu_load_15min"],
+        Trace(
+            x=series["cpu_load_15min"][0],
+            y=series["cpu_load_15min"][1],
             mode="lines",
             name="15-min Load",
-            line=dict(color=KU_COLORS["accent"], width=1.5, shape="spline", smoothing=1.0, dash="dot"),
+            line=dict(color=KU_ACCENT, width=1.5, **_smooth(1.0), dash="dot"),
             hovertemplate="<b>15-min</b>: %{y:.2f}%<extra></extra>",
             opacity=0.6,
         ),
@@ -1090,12 +1330,12 @@ def create_enhanced_historical_graphs():
 
     # Enhanced Memory Usage with smooth curves and area fill
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["ram_percentage"],
+        Trace(
+            x=series["ram_percentage"][0],
+            y=series["ram_percentage"][1],
             mode="lines",
             name="RAM Usage",
-            line=dict(color=KU_COLORS["secondary"], width=3, shape="spline", smoothing=1.0),
+            line=dict(color=KU_SECONDARY, width=3, **_smooth(1.0)),
             fill="tozeroy",
             fillcolor=GRAPH_COLORS["ram"]["fill"],
             hovertemplate="<b>RAM</b>: %{y:.1f}%<extra></extra>",
@@ -1131,12 +1371,12 @@ def create_enhanced_historical_graphs():
 
     # Enhanced Disk Usage with gradient fill
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["disk_percentage"],
+        Trace(
+            x=series["disk_percentage"][0],
+            y=series["disk_percentage"][1],
             mode="lines",
             name="Disk Usage",
-            line=dict(color=KU_COLORS["accent"], width=3, shape="spline", smoothing=1.0),
+            line=dict(color=KU_ACCENT, width=3, **_smooth(1.0)),
             fill="tozeroy",
             fillcolor=GRAPH_COLORS["disk"]["fill"],
             hovertemplate="<b>Disk</b>: %{y:.1f}%<extra></extra>",
@@ -1147,12 +1387,12 @@ def create_enhanced_historical_graphs():
 
     # Enhanced User Activity (dual y-axis) with smooth curves
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["logged_users"],
+        Trace(
+            x=series["logged_users"][0],
+            y=series["logged_users"][1],
             mode="lines+markers",
             name="Logged Users",
-            line=dict(color=GRAPH_COLORS["users"]["line"], width=2.5, shape="spline", smoothing=0.8),
+            line=dict(color=GRAPH_COLORS["users"]["line"], width=2.5, **_smooth(0.8)),
             marker=dict(size=4, opacity=0.7),
             fill="tozeroy",
             fillcolor=GRAPH_COLORS["users"]["fill"],
@@ -1162,12 +1402,12 @@ def create_enhanced_historical_graphs():
         col=2,
     )
     fig.add_trace(
-        go.Scatter(
-            x=df["timestamp"],
-            y=df["tcp_connections"],
+        Trace(
+            x=series["tcp_connections"][0],
+            y=series["tcp_connections"][1],
             mode="lines+markers",
             name="TCP Connections",
-            line=dict(color=GRAPH_COLORS["network"]["line"], width=2.5, shape="spline", smoothing=0.8),
+            line=dict(color=GRAPH_COLORS["network"]["line"], width=2.5, **_smooth(0.8)),
             marker=dict(size=4, opacity=0.7, symbol="diamond"),
             hovertemplate="<b>Connections</b>: %{y}<extra></extra>",
             yaxis="y4",
@@ -1183,7 +1423,7 @@ def create_enhanced_historical_graphs():
         height=CHART_CONFIG["default_height"],
         title={
             "text": f"<b>Comprehensive Performance Analytics</b><br><sub>{server_name}</sub>",
-            "font": {"size": 22, "color": KU_COLORS["text_primary"]},
+            "font": {"size": 22, "color": KU_TEXT_PRIMARY},
             "x": 0.5,
             "xanchor": "center",
         },
@@ -1195,7 +1435,7 @@ def create_enhanced_historical_graphs():
             xanchor="center",
             x=0.5,
             bgcolor="rgba(255, 255, 255, 0.9)",
-            bordercolor=KU_COLORS["border"],
+            bordercolor=KU_BORDER,
             borderwidth=1,
             font={"size": 11},
         ),
@@ -1207,6 +1447,27 @@ def create_enhanced_historical_graphs():
     fig.update_xaxes(**ENHANCED_XAXIS)
     fig.update_yaxes(**ENHANCED_YAXIS)
 
+    return fig.to_plotly_json()
+
+
+def create_enhanced_historical_graphs():
+    """Create enhanced historical graphs with better visualizations"""
+    metrics = get_latest_server_metrics()
+
+    if not metrics:
+        return html.Div(
+            "No server data available", style={"text-align": "center", "margin": "20px"}
+        )
+
+    server_name = metrics[0]["server_name"]
+    fig = _build_historical_figure_json(server_name, CHART_CONFIG["default_time_range"])
+
+    if fig is None:
+        return html.Div(
+            f"No historical data available for {server_name}",
+            style={"text-align": "center"},
+        )
+
     return html.Div(
         [
             # Server and time range selectors
@@ -1255,7 +1516,7 @@ def create_enhanced_historical_graphs():
                         "Performance Summary",
                         style={
                             "margin": "20px 0 16px 0",
-                            "color": KU_COLORS["text_primary"],
+                            "color": KU_TEXT_PRIMARY,
                         },
                     ),
                     html.Div(id="performance-summary"),
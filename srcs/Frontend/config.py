@@ -1,12 +1,14 @@
 # Configuration file for the Server Monitoring Dashboard
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Official Khalifa University brand colors per 2020 Brand Guidelines
-KU_COLORS = {
+# (read-only: shared by every render, so it must never be mutated)
+KU_COLORS = MappingProxyType({
     "primary": "#003DA5",  # Official KU Blue (Pantone 293C)
     "secondary": "#6F5091",  # KU Purple (Pantone 267C)
     "accent": "#78D64B",  # KU Green (Pantone 375C)
@@ -36,7 +38,17 @@ KU_COLORS = {
     "performance_good": "#003DA5",
     "performance_fair": "#F57F29",
     "performance_poor": "#E31E24",
-}
+})
+
+# Pre-resolved brand colors for hot render paths
+KU_PRIMARY = KU_COLORS["primary"]
+KU_SECONDARY = KU_COLORS["secondary"]
+KU_ACCENT = KU_COLORS["accent"]
+KU_SUCCESS = KU_COLORS["success"]
+KU_WARNING = KU_COLORS["warning"]
+KU_DANGER = KU_COLORS["danger"]
+KU_BORDER = KU_COLORS["border"]
+KU_TEXT_PRIMARY = KU_COLORS["text_primary"]
 
 # API Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://API:5000/api")
@@ -67,8 +79,8 @@ PERFORMANCE_THRESHOLDS = {
     "high_disk_usage": 10,
 }
 
-# Chart Configuration
-CHART_CONFIG = {
+# Chart Configuration (read-only)
+CHART_CONFIG = MappingProxyType({
     "default_height": 800,
     "time_ranges": [
         {"label": "Last 6 Hours", "value": 6},
@@ -78,15 +90,25 @@ CHART_CONFIG = {
         {"label": "Last Week", "value": 168},
     ],
     "default_time_range": 24,
+    "max_trace_points": 2000,  # Traces longer than 2x this are downsampled
+    "webgl_threshold": 1000,  # Plotted traces longer than this use Scattergl
+})
+
+# Cache Configuration (seconds; kept below the dashboard refresh interval)
+CACHE_CONFIG = {
+    "historical_ttl": 600,
+    "prefetch_interval": 540,  # Background refresh, just ahead of expiry
+    "export_ttl": 30,  # Reuse fetched data across back-to-back exports
+    "health_ttl": 5,  # Rapid refresh clicks share one API health probe
+    "users_ttl": 600,  # Prepared user tab rows, read on every tab switch
 }
 
-# Table Configuration
-TABLE_CONFIG = {
+# Table Configuration (read-only)
+TABLE_CONFIG = MappingProxyType({
     "page_size": 15,
-    "users_page_size": 30,
     "network_page_size": 10,
     "max_alerts": 5,
-}
+})
 
 # Font Configuration - KU Brand Guidelines 2020 specify DIN Next (commercial)
 # Using Inter as the closest free alternative to DIN Next
@@ -1,18 +1,56 @@
 # Data processing utilities for the Server Monitoring Dashboard
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
 import logging
 
-logger = logging.getLogger(__name__)
+from _fastmath import anomaly_mask
 
+logger = logging.getLogger(__name__)
 
-def safe_create_dataframe(data: List[Dict], name: str = "data") -> pd.DataFrame:
+# Numeric metric columns shared by historical and latest-metrics processing
+NUMERIC_METRIC_COLUMNS = [
+    "cpu_load_1min",
+    "cpu_load_5min",
+    "cpu_load_15min",
+    "ram_percentage",
+    "disk_percentage",
+    "logged_users",
+    "tcp_connections",
+]
+
+# Columns read from historical payloads, in plotting order
+HISTORICAL_COLUMNS = ["timestamp"] + NUMERIC_METRIC_COLUMNS
+
+# Compact dtypes for historical frames: loads/percentages don't need float64
+# precision and user/connection counts are small integers
+HISTORICAL_DTYPES = {
+    "cpu_load_1min": "float32",
+    "cpu_load_5min": "float32",
+    "cpu_load_15min": "float32",
+    "ram_percentage": "float32",
+    "disk_percentage": "float32",
+    "logged_users": "int32",
+    "tcp_connections": "int32",
+}
+
+# Below this many servers plain Python beats pandas' fixed DataFrame overhead
+_USE_VECTOR_PATH_THRESHOLD = 16
+
+
+def safe_create_dataframe(
+    data: List[Dict], name: str = "data", columns: Optional[List[str]] = None
+) -> pd.DataFrame:
     """
     Safely create a DataFrame from data with error handling
 
+    When ``columns`` is given only those keys are read (missing keys become
+    NaN columns), which skips inferring unused columns from every record.
+
     Args:
         data: List of dictionaries to convert
         name: Name of the data for logging
+        columns: Optional list of columns to keep, in order
 
     Returns:
         DataFrame (empty if creation fails)
@@ -26,7 +64,10 @@ def safe_create_dataframe(data: List[Dict], name: str = "data") -> pd.DataFrame:
         return pd.DataFrame()
 
     try:
-        df = pd.DataFrame(data)
+        if columns is not None:
+            df = pd.DataFrame.from_records(data, columns=columns)
+        else:
+            df = pd.DataFrame(data)
         logger.info(f"Created DataFrame with {len(df)} rows for {name}")
         return df
     except Exception as e:
@@ -35,14 +76,20 @@ def safe_create_dataframe(data: List[Dict], name: str = "data") -> pd.DataFrame:
 
 
 def parse_dataframe_timestamps(
-    df: pd.DataFrame, column: str = "timestamp"
+    df: pd.DataFrame, column: str = "timestamp", fmt: Optional[str] = "ISO8601"
 ) -> pd.DataFrame:
     """
     Safely parse timestamps in a DataFrame column
 
+    Only distinct timestamp strings are handed to the parser; the parsed
+    values are then broadcast back to every row. An explicit ``fmt`` keeps
+    pandas on its C strptime path; if nothing parses with it, the format is
+    inferred instead.
+
     Args:
         df: DataFrame containing timestamp column
         column: Name of the timestamp column
+        fmt: Timestamp format passed to pd.to_datetime (None to infer)
 
     Returns:
         DataFrame with parsed timestamps
@@ -54,8 +101,22 @@ def parse_dataframe_timestamps(
         logger.warning(f"Column '{column}' not found in DataFrame")
         return df
 
+    if pd.api.types.is_datetime64_any_dtype(df[column]):
+        return df
+
     try:
-        df[column] = pd.to_datetime(df[column], errors="coerce")
+        codes, uniques = pd.factorize(df[column])
+        parsed = pd.to_datetime(uniques, format=fmt, errors="coerce", cache=True)
+
+        if fmt is not None and len(parsed) and parsed.isna().all():
+            logger.debug(
+                f"No timestamps in column '{column}' matched format {fmt}, inferring"
+            )
+            parsed = pd.to_datetime(uniques, errors="coerce", cache=True)
+
+        df[column] = pd.Series(
+            parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=df.index
+        )
 
         # Count and log failed conversions
         failed_count = df[column].isna().sum()
@@ -70,8 +131,29 @@ def parse_dataframe_timestamps(
         return df
 
 
+def format_timestamps_for_plot(timestamps: pd.Series) -> pd.Series:
+    """
+    Pre-format parsed timestamps as ISO-8601 strings for Plotly traces
+
+    Plotly encodes datetime values one by one when serializing a figure;
+    handing it strings skips that work on every render.
+
+    Args:
+        timestamps: Series of parsed timestamps
+
+    Returns:
+        Series of ISO-8601 strings (unchanged if not datetime-typed)
+    """
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps
+    return timestamps.dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
 def convert_numeric_columns(
-    df: pd.DataFrame, columns: List[str], fillna: float = 0.0
+    df: pd.DataFrame,
+    columns: List[str],
+    fillna: float = 0.0,
+    dtypes: Optional[Dict[str, str]] = None,
 ) -> pd.DataFrame:
     """
     Safely convert specified columns to numeric types
@@ -80,6 +162,8 @@ def convert_numeric_columns(
         df: DataFrame to process
         columns: List of column names to convert
         fillna: Value to fill NaN with after conversion
+        dtypes: Optional column -> dtype map applied after filling NaN
+            (columns not listed keep pandas' inferred numeric dtype)
 
     Returns:
         DataFrame with numeric columns
@@ -87,13 +171,16 @@ def convert_numeric_columns(
     if df.empty:
         return df
 
-    for col in columns:
-        if col in df.columns:
-            try:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(fillna)
-                logger.debug(f"Converted column '{col}' to numeric")
-            except Exception as e:
-                logger.error(f"Failed to convert column '{col}' to numeric: {e}")
+    present = [col for col in columns if col in df.columns]
+    if not present:
+        return df
+
+    try:
+        df[present] = df[present].apply(pd.to_numeric, errors="coerce").fillna(fillna)
+        if dtypes:
+            df = df.astype({col: dtypes[col] for col in present if col in dtypes})
+    except (ValueError, TypeError) as e:
+        logger.error(f"Failed to convert columns {present} to numeric: {e}")
 
     return df
 
@@ -118,22 +205,25 @@ def validate_dataframe_range(
         return df
 
     try:
-        out_of_range = ((df[column] < min_val) | (df[column] > max_val)).sum()
+        values = df[column].to_numpy()
 
-        if out_of_range > 0:
-            logger.warning(
-                f"{out_of_range} values in column '{column}' are out of range "
-                f"({min_val}-{max_val})"
-            )
+        # The count only feeds the warning, so skip the scan when it's filtered out
+        if logger.isEnabledFor(logging.WARNING):
+            out_of_range = np.count_nonzero((values < min_val) | (values > max_val))
+            if out_of_range > 0:
+                logger.warning(
+                    f"{out_of_range} values in column '{column}' are out of range "
+                    f"({min_val}-{max_val})"
+                )
 
         if clip:
-            df[column] = df[column].clip(lower=min_val, upper=max_val)
+            df[column] = np.clip(values, min_val, max_val)
             logger.info(
                 f"Clipped values in column '{column}' to range {min_val}-{max_val}"
             )
 
         return df
-    except Exception as e:
+    except (ValueError, TypeError) as e:
         logger.error(f"Error validating range for column '{column}': {e}")
         return df
 
@@ -151,25 +241,22 @@ def prepare_historical_dataframe(
     Returns:
         Prepared DataFrame with validated data
     """
-    df = safe_create_dataframe(historical_data, f"historical data for {server_name}")
+    df = safe_create_dataframe(
+        historical_data,
+        f"historical data for {server_name}",
+        columns=HISTORICAL_COLUMNS,
+    )
 
     if df.empty:
         return df
 
-    # Parse timestamps
-    df = parse_dataframe_timestamps(df, "timestamp")
+    # Parse timestamps (API timestamps are ISO-8601)
+    df = parse_dataframe_timestamps(df, "timestamp", fmt="ISO8601")
 
     # Convert numeric columns
-    numeric_columns = [
-        "cpu_load_1min",
-        "cpu_load_5min",
-        "cpu_load_15min",
-        "ram_percentage",
-        "disk_percentage",
-        "logged_users",
-        "tcp_connections",
-    ]
-    df = convert_numeric_columns(df, numeric_columns, fillna=0.0)
+    df = convert_numeric_columns(
+        df, NUMERIC_METRIC_COLUMNS, fillna=0.0, dtypes=HISTORICAL_DTYPES
+    )
 
     # Validate ranges for percentage columns
     percentage_columns = ["ram_percentage", "disk_percentage"]
@@ -194,12 +281,79 @@ def prepare_historical_dataframe(
     return df
 
 
+def _to_number(value, default: float = 0.0) -> float:
+    """Convert a value to float the way pd.to_numeric(errors='coerce') would"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if number != number else number  # NaN check
+
+
+_SMALL_AGGREGATIONS = {
+    "mean": lambda values: sum(values) / len(values),
+    "sum": sum,
+    "max": max,
+    "min": min,
+}
+
+
+def _aggregate_metrics_small(
+    metrics_list: List[Dict], operation: str
+) -> Dict[str, float]:
+    """Aggregate a handful of servers in plain Python, skipping DataFrame setup"""
+    aggregate = _SMALL_AGGREGATIONS.get(operation)
+    if aggregate is None:
+        logger.error(f"Unknown aggregation operation: {operation}")
+        return {}
+
+    missing = [
+        col
+        for col in NUMERIC_METRIC_COLUMNS
+        if not any(col in metric for metric in metrics_list)
+    ]
+    if missing:
+        logger.error(f"Failed to aggregate metrics: missing columns {missing}")
+        return {}
+
+    return {
+        col: aggregate([_to_number(metric.get(col)) for metric in metrics_list])
+        for col in NUMERIC_METRIC_COLUMNS
+    }
+
+
+def _aggregate_metrics_large(
+    metrics_list: List[Dict], operation: str
+) -> Dict[str, float]:
+    """Aggregate many servers with a vectorized DataFrame reduction"""
+    df = safe_create_dataframe(metrics_list, "metrics for aggregation")
+    if df.empty:
+        return {}
+
+    df = convert_numeric_columns(df, NUMERIC_METRIC_COLUMNS)
+
+    if operation == "mean":
+        return df[NUMERIC_METRIC_COLUMNS].mean().to_dict()
+    elif operation == "sum":
+        return df[NUMERIC_METRIC_COLUMNS].sum().to_dict()
+    elif operation == "max":
+        return df[NUMERIC_METRIC_COLUMNS].max().to_dict()
+    elif operation == "min":
+        return df[NUMERIC_METRIC_COLUMNS].min().to_dict()
+
+    logger.error(f"Unknown aggregation operation: {operation}")
+    return {}
+
+
 def aggregate_metrics(
     metrics_list: List[Dict], operation: str = "mean"
 ) -> Dict[str, float]:
     """
     Aggregate metrics across multiple servers
 
+    Small inputs (fewer than ``_USE_VECTOR_PATH_THRESHOLD`` servers) are
+    reduced in plain Python; larger ones go through pandas.
+
     Args:
         metrics_list: List of server metrics dictionaries
         operation: Aggregation operation ('mean', 'sum', 'max', 'min')
@@ -211,38 +365,15 @@ def aggregate_metrics(
         return {}
 
     try:
-        df = safe_create_dataframe(metrics_list, "metrics for aggregation")
-        if df.empty:
-            return {}
-
-        # Convert numeric columns
-        numeric_columns = [
-            "cpu_load_1min",
-            "cpu_load_5min",
-            "cpu_load_15min",
-            "ram_percentage",
-            "disk_percentage",
-            "logged_users",
-            "tcp_connections",
-        ]
-        df = convert_numeric_columns(df, numeric_columns)
-
-        # Perform aggregation
-        if operation == "mean":
-            result = df[numeric_columns].mean().to_dict()
-        elif operation == "sum":
-            result = df[numeric_columns].sum().to_dict()
-        elif operation == "max":
-            result = df[numeric_columns].max().to_dict()
-        elif operation == "min":
-            result = df[numeric_columns].min().to_dict()
+        if len(metrics_list) < _USE_VECTOR_PATH_THRESHOLD:
+            result = _aggregate_metrics_small(metrics_list, operation)
         else:
-            logger.error(f"Unknown aggregation operation: {operation}")
-            return {}
+            result = _aggregate_metrics_large(metrics_list, operation)
 
-        logger.info(
-            f"Aggregated metrics using {operation} across {len(metrics_list)} servers"
-        )
+        if result:
+            logger.info(
+                f"Aggregated metrics using {operation} across {len(metrics_list)} servers"
+            )
         return result
 
     except Exception as e:
@@ -256,6 +387,11 @@ def filter_recent_data(
     """
     Filter DataFrame to include only recent data
 
+    Frames from ``prepare_historical_dataframe`` already carry parsed
+    timestamps, so the column is only parsed here when it isn't datetime64.
+    Naive timestamps are compared as raw datetime64 values, skipping
+    pandas' per-element Timestamp comparison.
+
     Args:
         df: DataFrame to filter
         timestamp_column: Name of timestamp column
@@ -268,7 +404,7 @@ def filter_recent_data(
         return df
 
     try:
-        # Ensure timestamps are parsed
+        # Only parse when the caller hasn't already (dtype check is O(1))
         if not pd.api.types.is_datetime64_any_dtype(df[timestamp_column]):
             df = parse_dataframe_timestamps(df, timestamp_column)
 
@@ -276,7 +412,12 @@ def filter_recent_data(
         cutoff_time = pd.Timestamp.now() - pd.Timedelta(hours=hours)
 
         # Filter data
-        filtered_df = df[df[timestamp_column] >= cutoff_time]
+        timestamps = df[timestamp_column]
+        if pd.api.types.is_datetime64_dtype(timestamps):
+            mask = timestamps.to_numpy() >= cutoff_time.to_datetime64()
+        else:
+            mask = timestamps >= cutoff_time
+        filtered_df = df[mask]
 
         logger.info(
             f"Filtered data to last {hours} hours: {len(df)} -> {len(filtered_df)} rows"
@@ -305,15 +446,22 @@ def calculate_trends(df: pd.DataFrame, column: str, window: int = 5) -> Optional
         return None
 
     try:
-        # Calculate moving average
-        ma = df[column].rolling(window=window).mean()
-
-        if ma.isna().all():
-            return None
-
-        # Compare first and last values of moving average
-        first_val = ma.dropna().iloc[0]
-        last_val = ma.dropna().iloc[-1]
+        # Compare the first and last complete windows of the moving average.
+        # When neither end window has gaps those are just the end slices, so
+        # skip the full rolling mean; otherwise a window containing NaN has no
+        # average and the comparison moves inward to the nearest full window.
+        values = df[column]
+        head = values.iloc[:window]
+        tail = values.iloc[-window:]
+        if head.notna().all() and tail.notna().all():
+            first_val = head.mean()
+            last_val = tail.mean()
+        else:
+            ma = values.rolling(window=window).mean().dropna()
+            if ma.empty:
+                return None
+            first_val = ma.iloc[0]
+            last_val = ma.iloc[-1]
 
         change_percent = (
             ((last_val - first_val) / first_val * 100) if first_val != 0 else 0
@@ -349,20 +497,15 @@ def detect_anomalies(
         return pd.Series(dtype=bool)
 
     try:
-        mean = df[column].mean()
-        std = df[column].std()
-
-        if pd.isna(std) or std == 0:
-            return pd.Series([False] * len(df))
-
-        anomalies = (df[column] - mean).abs() > (threshold_std * std)
+        # Sample std (ddof=1) and NaN-skipping to match pandas Series.mean/std
+        mask = anomaly_mask(df[column].to_numpy(dtype=np.float64), threshold_std)
 
-        anomaly_count = anomalies.sum()
+        anomaly_count = np.count_nonzero(mask)
         if anomaly_count > 0:
             logger.info(f"Detected {anomaly_count} anomalies in column '{column}'")
 
-        return anomalies
+        return pd.Series(mask, index=df.index, name=column)
 
     except Exception as e:
         logger.error(f"Failed to detect anomalies for column '{column}': {e}")
-        return pd.Series([False] * len(df))
+        return pd.Series(False, index=df.index)
@@ -0,0 +1,85 @@
+# Time-series downsampling utilities for the Server Monitoring Dashboard
+import numpy as np
+import pandas as pd
+from typing import Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket, which preserves the
+    visual shape of the series.
+
+    Args:
+        x: Monotonic x values (e.g. timestamps as int64)
+        y: Y values (NaN is treated as 0 when ranking points)
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    return selected
+
+
+def downsample_series(
+    x: pd.Series, y: pd.Series, n_out: int
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    Downsample a time series for plotting, leaving short series untouched
+
+    Args:
+        x: Timestamp series
+        y: Value series aligned with ``x``
+        n_out: Maximum number of points to return
+
+    Returns:
+        Tuple of (x, y) series with at most ``n_out`` points
+    """
+    if len(x) <= 2 * n_out:
+        return x, y
+
+    try:
+        indices = lttb_indices(
+            x.to_numpy(dtype="datetime64[ns]").astype("i8"),
+            pd.to_numeric(y, errors="coerce").to_numpy(dtype=np.float64),
+            n_out,
+        )
+        logger.debug(f"Downsampled series from {len(x)} to {len(indices)} points")
+        return x.iloc[indices], y.iloc[indices]
+    except Exception as e:
+        logger.warning(f"Failed to downsample series, plotting all points: {e}")
+        return x, y
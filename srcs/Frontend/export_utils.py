@@ -1,7 +1,19 @@
 # Export utility functions for the Server Monitoring Dashboard
+import csv
+import gzip
 import pandas as pd
+import pyarrow as pa
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.util import find_spec
+from itertools import chain, islice
 import logging
+import os
+from config import CACHE_CONFIG
+from cache_utils import cached
+from validation import validate_column
+from data_processing import HISTORICAL_COLUMNS
 from api_client import (
     get_latest_server_metrics,
     get_top_users,
@@ -12,13 +24,192 @@ from api_client import (
 
 logging.basicConfig(level=logging.INFO)
 
+# xlsxwriter is much faster than openpyxl for plain value dumps. Its
+# constant_memory mode is not usable: pandas writes cells column by column,
+# and that mode silently drops cells in rows it has already flushed.
+_EXCEL_ENGINE = "xlsxwriter" if find_spec("xlsxwriter") is not None else "openpyxl"
+
+# System overview rows: (label, key in the API response, unit)
+OVERVIEW_METRICS = (
+    ("Total Servers", "total_servers", "count"),
+    ("Active Servers", "active_servers", "count"),
+    ("Total Users", "total_users", "count"),
+    ("Average CPU Load", "avg_cpu_load", "load"),
+    ("Average Memory Usage", "avg_memory_usage", "%"),
+    ("Average Disk Usage", "avg_disk_usage", "%"),
+)
+
+# Exported tables: (export_data key, file name prefix, Excel sheet name)
+EXPORT_TABLES = (
+    ("server_metrics", "server_metrics", "Server Metrics"),
+    ("top_users", "top_users", "Top Users"),
+    ("system_overview", "system_overview", "System Overview"),
+    ("historical_metrics", "historical_metrics", "Historical Data"),
+)
 
-def generate_export_report(format="csv"):
+# Column checks applied before export: table -> ((column, validator), ...)
+EXPORT_COLUMN_RULES = {
+    "top_users": (
+        ("cpu", "positive_number"),
+        ("mem", "percentage"),
+        ("disk", "positive_number"),
+    ),
+    "historical_metrics": (
+        ("ram_percentage", "percentage"),
+        ("disk_percentage", "percentage"),
+    ),
+}
+
+# Exports fired in quick succession reuse the same snapshot instead of
+# re-fetching everything; get_historical_metrics is already cached in api_client
+_EXPORT_TTL = CACHE_CONFIG["export_ttl"]
+_fetch_server_metrics = cached(_EXPORT_TTL, key_prefix="export_servers_")(
+    get_latest_server_metrics
+)
+_fetch_top_users = cached(_EXPORT_TTL, key_prefix="export_users_")(get_top_users)
+_fetch_system_overview = cached(_EXPORT_TTL, key_prefix="export_overview_")(
+    get_system_overview
+)
+_fetch_server_list = cached(_EXPORT_TTL, key_prefix="export_server_list_")(
+    get_server_list
+)
+
+
+# Most history fetches in flight at once (matches api_client's connection pool)
+_HISTORY_FETCH_WINDOW = 32
+
+
+def _historical_batches(server_list, hours=24):
+    """
+    Yield each server's historical rows, in server order
+
+    The per-server requests are I/O bound, so they are issued concurrently,
+    but at most _HISTORY_FETCH_WINDOW are in flight or waiting to be consumed
+    at once; batches are still yielded one server at a time.
+
+    Args:
+        server_list: Server names (a list of strings, not dictionaries)
+        hours: Number of hours of history to fetch
+
+    Yields:
+        List of row dictionaries for one server (possibly empty)
+    """
+    server_names = [name for name in server_list or [] if name]
+    if not server_names:
+        return
+
+    def fetch(name):
+        # Positional, like every other caller, so the @cached key matches
+        # the entries the history prefetcher keeps warm
+        return get_historical_metrics(name, hours) or []
+
+    window = min(_HISTORY_FETCH_WINDOW, len(server_names))
+    names = iter(server_names)
+    with ThreadPoolExecutor(max_workers=window) as ex:
+        # Unlike ex.map, which submits everything up front, refill the window
+        # only as results are taken
+        pending = deque(ex.submit(fetch, name) for name in islice(names, window))
+        while pending:
+            rows = pending.popleft().result()
+            name = next(names, None)
+            if name is not None:
+                pending.append(ex.submit(fetch, name))
+            yield rows
+
+
+def _row_count(df):
+    """Number of rows in an export table; missing (None) tables count as 0"""
+    return 0 if df is None else df.shape[0]
+
+
+def _validate_export_columns(df, table):
+    """
+    Blank out invalid values in a table's checked columns, one pass per column
+
+    Args:
+        df: DataFrame to validate (modified in place)
+        table: Key into EXPORT_COLUMN_RULES
+
+    Returns:
+        The same DataFrame
+    """
+    for column, validator_name in EXPORT_COLUMN_RULES.get(table, ()):
+        if column not in df.columns:
+            continue
+        df[column], invalid = validate_column(df[column], validator_name)
+        if len(invalid):
+            logging.warning(
+                f"Dropped {len(invalid)} invalid {column} values from {table}"
+            )
+    return df
+
+
+def _downcast_integers(df):
+    """
+    Shrink int64 columns to the smallest integer dtype that holds them
+
+    Floats are left as float64: float32 would change exported values (12.3
+    would be written as 12.300000190734863).
+
+    Args:
+        df: DataFrame to downcast (modified in place)
+
+    Returns:
+        The same DataFrame
+    """
+    for column in df.select_dtypes("int64").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    return df
+
+
+def _arrow_table(rows):
+    """
+    Build an Arrow table from row dictionaries
+
+    pa.Table.from_pylist takes its columns from the first row only, so the
+    columns are collected from every row here; missing values become nulls.
+    """
+    columns = dict.fromkeys(chain.from_iterable(rows))
+    return pa.table({column: [row.get(column) for row in rows] for column in columns})
+
+
+def _historical_frame(batches):
+    """
+    Build one DataFrame from per-server batches of historical rows
+
+    Each batch becomes a columnar Arrow table and the tables are concatenated
+    once, which skips pandas' per-row dict inference. Columns are the union of
+    the rows' keys, as with the DataFrame constructor. If the batches' types
+    cannot be reconciled the rows go through a single DataFrame constructor
+    call instead.
+
+    Args:
+        batches: Iterable of row-dictionary lists, one per server
+
+    Returns:
+        DataFrame with every server's rows, or None if there are none
+    """
+    batches = [rows for rows in batches if rows]
+    if not batches:
+        return None
+
+    try:
+        tables = [_arrow_table(rows) for rows in batches]
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+    except pa.ArrowException as e:
+        logging.warning(f"Arrow conversion of historical rows failed: {e}")
+
+    return pd.DataFrame(list(chain.from_iterable(batches)))
+
+
+def generate_export_report(format="csv", include_historical=True):
     """
     Generate a comprehensive report of all dashboard data
 
     Args:
-        format: Export format ('csv', 'excel', 'json')
+        format: Export format (see EXPORTERS)
+        include_historical: Whether to load historical metrics into memory;
+            streaming writers such as stream_historical_to_csv skip this
 
     Returns:
         Dictionary with export data or None if failed
@@ -27,57 +218,44 @@ def generate_export_report(format="csv"):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Fetch all data
-        server_metrics = get_latest_server_metrics()
-        top_users = get_top_users()
-        system_overview = get_system_overview()
-        server_list = get_server_list()
-
-        # Create DataFrames
-        df_servers = pd.DataFrame(server_metrics) if server_metrics else pd.DataFrame()
-        df_users = pd.DataFrame(top_users) if top_users else pd.DataFrame()
-
-        # Create system overview DataFrame
-        overview_data = []
-        if system_overview:
-            overview_data = [
-                {
-                    "metric": "Total Servers",
-                    "value": system_overview.get("total_servers", 0),
-                },
-                {
-                    "metric": "Active Servers",
-                    "value": system_overview.get("active_servers", 0),
-                },
-                {
-                    "metric": "Total Users",
-                    "value": system_overview.get("total_users", 0),
-                },
-                {
-                    "metric": "Average CPU Load",
-                    "value": f"{system_overview.get('avg_cpu_load', 0):.2f}",
-                },
+        server_metrics = _fetch_server_metrics()
+        top_users = _fetch_top_users()
+        system_overview = _fetch_system_overview()
+        server_list = _fetch_server_list()
+
+        # Create DataFrames; tables with no data stay None rather than
+        # allocating empty DataFrames that every writer then has to skip
+        df_servers = pd.DataFrame(server_metrics) if server_metrics else None
+        df_users = pd.DataFrame(top_users) if top_users else None
+        if df_users is not None:
+            _downcast_integers(_validate_export_columns(df_users, "top_users"))
+
+        # Create system overview DataFrame; values stay numeric (the unit is
+        # its own column) and are only formatted when written out
+        df_overview = (
+            pd.DataFrame(
                 {
-                    "metric": "Average Memory Usage",
-                    "value": f"{system_overview.get('avg_memory_usage', 0):.2f}%",
-                },
-                {
-                    "metric": "Average Disk Usage",
-                    "value": f"{system_overview.get('avg_disk_usage', 0):.2f}%",
-                },
-            ]
-        df_overview = pd.DataFrame(overview_data)
+                    "metric": [label for label, _, _ in OVERVIEW_METRICS],
+                    "value": [
+                        system_overview.get(key, 0) for _, key, _ in OVERVIEW_METRICS
+                    ],
+                    "unit": [unit for _, _, unit in OVERVIEW_METRICS],
+                }
+            )
+            if system_overview
+            else None
+        )
 
         # Fetch historical data for all servers (last 24 hours)
-        historical_data = []
-        for server_name in server_list:
-            # server_list returns a list of strings (server names), not dictionaries
-            if server_name:
-                hist = get_historical_metrics(server_name, hours=24)
-                if hist:
-                    historical_data.extend(hist)
         df_historical = (
-            pd.DataFrame(historical_data) if historical_data else pd.DataFrame()
+            _historical_frame(_historical_batches(server_list, hours=24))
+            if include_historical
+            else None
         )
+        if df_historical is not None:
+            _downcast_integers(
+                _validate_export_columns(df_historical, "historical_metrics")
+            )
 
         export_data = {
             "timestamp": timestamp,
@@ -95,51 +273,79 @@ def generate_export_report(format="csv"):
         return None
 
 
+def _write_concurrently(jobs, write):
+    """
+    Write several DataFrames to disk in parallel
+
+    pandas' writers spend most of their time in C code that releases the
+    GIL, so threads bring the total down to roughly the slowest single file.
+
+    Args:
+        jobs: List of (DataFrame, filepath) tuples
+        write: Function taking (DataFrame, filepath)
+
+    Returns:
+        List of file paths created
+    """
+    if not jobs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        # list() re-raises the first writer exception, if any
+        list(ex.map(lambda job: write(*job), jobs))
+
+    file_paths = [filepath for _, filepath in jobs]
+    for filepath in file_paths:
+        logging.info(f"Exported {filepath}")
+    return file_paths
+
+
+def _export_files(export_data, extension, write):
+    """
+    Write each non-empty table in EXPORT_TABLES to its own file
+
+    Args:
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
+        extension: File extension without the dot
+        write: Function taking (DataFrame, filepath)
+
+    Returns:
+        List of file paths created
+    """
+    timestamp = export_data.get("timestamp", datetime.now().strftime("%Y%m%d_%H%M%S"))
+    jobs = []
+
+    for key, name, _ in EXPORT_TABLES:
+        df = export_data.get(key)
+        if not _row_count(df):
+            continue
+        jobs.append((df, f"/tmp/{name}_{timestamp}.{extension}"))
+
+    return _write_concurrently(jobs, write)
+
+
 def export_to_csv(export_data):
     """
-    Export data to CSV files
+    Export data to gzip-compressed CSV files
 
     Args:
-        export_data: Dictionary containing DataFrames and metadata
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
 
     Returns:
         List of file paths created
     """
     try:
-        timestamp = export_data.get(
-            "timestamp", datetime.now().strftime("%Y%m%d_%H%M%S")
-        )
-        file_paths = []
-
-        # Export server metrics
-        if not export_data["server_metrics"].empty:
-            filepath = f"/tmp/server_metrics_{timestamp}.csv"
-            export_data["server_metrics"].to_csv(filepath, index=False)
-            file_paths.append(filepath)
-            logging.info(f"Exported server metrics to {filepath}")
-
-        # Export top users
-        if not export_data["top_users"].empty:
-            filepath = f"/tmp/top_users_{timestamp}.csv"
-            export_data["top_users"].to_csv(filepath, index=False)
-            file_paths.append(filepath)
-            logging.info(f"Exported top users to {filepath}")
-
-        # Export system overview
-        if not export_data["system_overview"].empty:
-            filepath = f"/tmp/system_overview_{timestamp}.csv"
-            export_data["system_overview"].to_csv(filepath, index=False)
-            file_paths.append(filepath)
-            logging.info(f"Exported system overview to {filepath}")
-
-        # Export historical metrics
-        if not export_data["historical_metrics"].empty:
-            filepath = f"/tmp/historical_metrics_{timestamp}.csv"
-            export_data["historical_metrics"].to_csv(filepath, index=False)
-            file_paths.append(filepath)
-            logging.info(f"Exported historical metrics to {filepath}")
+        overview = export_data.get("system_overview")
 
-        return file_paths
+        def write(df, path):
+            float_format = "%.2f" if df is overview else None
+            df.to_csv(
+                path, index=False, float_format=float_format, compression="gzip"
+            )
+
+        return _export_files(export_data, "csv.gz", write)
 
     except Exception as e:
         logging.error(f"Error exporting to CSV: {e}")
@@ -151,7 +357,8 @@ def export_to_excel(export_data):
     Export data to a single Excel file with multiple sheets
 
     Args:
-        export_data: Dictionary containing DataFrames and metadata
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
 
     Returns:
         File path of created Excel file or None if failed
@@ -162,25 +369,17 @@ def export_to_excel(export_data):
         )
         filepath = f"/tmp/dashboard_report_{timestamp}.xlsx"
 
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            if not export_data["server_metrics"].empty:
-                export_data["server_metrics"].to_excel(
-                    writer, sheet_name="Server Metrics", index=False
-                )
-
-            if not export_data["top_users"].empty:
-                export_data["top_users"].to_excel(
-                    writer, sheet_name="Top Users", index=False
-                )
-
-            if not export_data["system_overview"].empty:
-                export_data["system_overview"].to_excel(
-                    writer, sheet_name="System Overview", index=False
-                )
-
-            if not export_data["historical_metrics"].empty:
-                export_data["historical_metrics"].to_excel(
-                    writer, sheet_name="Historical Data", index=False
+        with pd.ExcelWriter(filepath, engine=_EXCEL_ENGINE) as writer:
+            for key, _, sheet_name in EXPORT_TABLES:
+                df = export_data.get(key)
+                if not _row_count(df):
+                    continue
+                float_format = "%.2f" if key == "system_overview" else None
+                df.to_excel(
+                    writer,
+                    sheet_name=sheet_name,
+                    index=False,
+                    float_format=float_format,
                 )
 
         logging.info(f"Exported data to Excel file: {filepath}")
@@ -196,78 +395,191 @@ def export_to_json(export_data):
     Export data to JSON files
 
     Args:
-        export_data: Dictionary containing DataFrames and metadata
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
 
     Returns:
         List of file paths created
     """
     try:
-        timestamp = export_data.get(
-            "timestamp", datetime.now().strftime("%Y%m%d_%H%M%S")
-        )
-        file_paths = []
-
-        # Export server metrics
-        if not export_data["server_metrics"].empty:
-            filepath = f"/tmp/server_metrics_{timestamp}.json"
-            export_data["server_metrics"].to_json(filepath, orient="records", indent=2)
-            file_paths.append(filepath)
-            logging.info(f"Exported server metrics to {filepath}")
-
-        # Export top users
-        if not export_data["top_users"].empty:
-            filepath = f"/tmp/top_users_{timestamp}.json"
-            export_data["top_users"].to_json(filepath, orient="records", indent=2)
-            file_paths.append(filepath)
-            logging.info(f"Exported top users to {filepath}")
-
-        # Export system overview
-        if not export_data["system_overview"].empty:
-            filepath = f"/tmp/system_overview_{timestamp}.json"
-            export_data["system_overview"].to_json(filepath, orient="records", indent=2)
-            file_paths.append(filepath)
-            logging.info(f"Exported system overview to {filepath}")
-
-        # Export historical metrics
-        if not export_data["historical_metrics"].empty:
-            filepath = f"/tmp/historical_metrics_{timestamp}.json"
-            export_data["historical_metrics"].to_json(
-                filepath, orient="records", indent=2
-            )
-            file_paths.append(filepath)
-            logging.info(f"Exported historical metrics to {filepath}")
+        # No pretty-printing for historical metrics: it is the large
+        # machine-consumed table and indenting roughly doubles its size
+        historical = export_data.get("historical_metrics")
 
-        return file_paths
+        def write(df, path):
+            indent = None if df is historical else 2
+            df.to_json(path, orient="records", indent=indent)
+
+        return _export_files(export_data, "json", write)
 
     except Exception as e:
         logging.error(f"Error exporting to JSON: {e}")
         return []
 
 
+def export_to_parquet(export_data):
+    """
+    Export data to snappy-compressed Parquet files
+
+    Args:
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
+
+    Returns:
+        List of file paths created
+    """
+    try:
+        return _export_files(
+            export_data,
+            "parquet",
+            lambda df, path: df.to_parquet(
+                path, engine="pyarrow", compression="snappy", index=False
+            ),
+        )
+
+    except Exception as e:
+        logging.error(f"Error exporting to Parquet: {e}")
+        return []
+
+
+def export_to_feather(export_data):
+    """
+    Export data to Feather files
+
+    Args:
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
+
+    Returns:
+        List of file paths created
+    """
+    try:
+        return _export_files(
+            export_data,
+            "feather",
+            lambda df, path: df.reset_index(drop=True).to_feather(path),
+        )
+
+    except Exception as e:
+        logging.error(f"Error exporting to Feather: {e}")
+        return []
+
+
+def stream_historical_to_csv(timestamp=None, hours=24):
+    """
+    Write every server's historical metrics to one gzipped CSV as they arrive
+
+    Rows go from each API response to disk without building a DataFrame. The
+    writer holds at most _HISTORY_FETCH_WINDOW servers' responses at a time,
+    but each response is also kept in the shared history cache for its TTL.
+    Columns are HISTORICAL_COLUMNS; keys outside it are ignored and missing
+    ones are left blank. The file is written under a temporary name and only
+    moved into place once complete, so a failed export leaves no partial CSV.
+
+    Args:
+        timestamp: Timestamp used in the file name (defaults to now)
+        hours: Number of hours of history to export
+
+    Returns:
+        File path, or None if there was nothing to write or the export failed
+    """
+    try:
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"/tmp/historical_metrics_{timestamp}.csv.gz"
+        partial_path = f"{filepath}.part"
+        wrote_rows = False
+
+        try:
+            with gzip.open(partial_path, "wt", newline="") as f:
+                writer = csv.DictWriter(
+                    f, fieldnames=HISTORICAL_COLUMNS, extrasaction="ignore"
+                )
+                writer.writeheader()
+                for rows in _historical_batches(_fetch_server_list(), hours=hours):
+                    if rows:
+                        writer.writerows(rows)
+                        wrote_rows = True
+            if wrote_rows:
+                os.replace(partial_path, filepath)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+        if not wrote_rows:
+            return None
+
+        logging.info(f"Exported historical metrics to {filepath}")
+        return filepath
+
+    except Exception as e:
+        logging.error(f"Error streaming historical metrics to CSV: {e}")
+        return None
+
+
+# Writers by export format
+EXPORTERS = {
+    "csv": export_to_csv,
+    "parquet": export_to_parquet,
+    "feather": export_to_feather,
+    "excel": export_to_excel,
+    "json": export_to_json,
+}
+
+
+def export_report(format="excel"):
+    """
+    Generate the export report and write it in the requested format
+
+    Excel is the default because it is what the dashboard's export button
+    downloads. Parquet and Feather are the compact formats for scripted use.
+
+    Args:
+        format: One of the EXPORTERS keys
+
+    Returns:
+        Whatever the format's writer returns (list of paths or a single
+        path), or None if the report could not be generated
+    """
+    exporter = EXPORTERS.get(format)
+    if exporter is None:
+        logging.error(f"Unsupported export format: {format}")
+        return None
+
+    if format == "csv":
+        # Historical rows are streamed to disk rather than built into a DataFrame
+        export_data = generate_export_report(format, include_historical=False)
+        if not export_data:
+            return None
+        file_paths = exporter(export_data)
+        historical_path = stream_historical_to_csv(export_data["timestamp"])
+        if historical_path:
+            file_paths.append(historical_path)
+        return file_paths
+
+    export_data = generate_export_report(format)
+    if not export_data:
+        return None
+    return exporter(export_data)
+
+
 def create_export_summary(export_data):
     """
     Create a summary of the exported data
 
     Args:
-        export_data: Dictionary containing DataFrames and metadata
+        export_data: Dictionary containing DataFrames (None for tables
+            without data) and metadata
 
     Returns:
         Dictionary with summary statistics
     """
     try:
-        summary = {
+        return {
             "timestamp": export_data.get("timestamp"),
-            "server_count": len(export_data["server_metrics"])
-            if not export_data["server_metrics"].empty
-            else 0,
-            "user_count": len(export_data["top_users"])
-            if not export_data["top_users"].empty
-            else 0,
-            "historical_records": len(export_data["historical_metrics"])
-            if not export_data["historical_metrics"].empty
-            else 0,
+            "server_count": _row_count(export_data.get("server_metrics")),
+            "user_count": _row_count(export_data.get("top_users")),
+            "historical_records": _row_count(export_data.get("historical_metrics")),
         }
-        return summary
     except Exception as e:
         logging.error(f"Error creating export summary: {e}")
         return {}
@@ -123,6 +123,62 @@ ENHANCED_YAXIS = {
     "automargin": True,
 }
 
+# Static per-metric trace pieces, built once at import instead of on every
+# graph render. Functions below hand out shallow copies, so the nested dicts
+# are shared between traces and must be treated as read-only.
+_METRIC_COLORS = {key: c for key, c in GRAPH_COLORS.items() if isinstance(c, dict)}
+
+_LINE_STYLES = {
+    key: {
+        "color": colors["line"],
+        "width": 2.5,
+        "shape": "spline",  # Smooth curves instead of sharp angles
+        "smoothing": 1.0,  # Maximum smoothing
+    }
+    for key, colors in _METRIC_COLORS.items()
+}
+
+_TRACE_TEMPLATES = {
+    key: {
+        "mode": "lines",
+        "line": _LINE_STYLES[key],
+        "hovertemplate": "%{y:.2f}%<extra></extra>",  # Clean hover text
+        "hoverlabel": {
+            "bgcolor": colors["hover"],
+            "bordercolor": colors["line"],
+        },
+    }
+    for key, colors in _METRIC_COLORS.items()
+    if "hover" in colors
+}
+
+_PERCENTAGE_TEMPLATES = {
+    key: {
+        "mode": "lines+text",
+        "line": _LINE_STYLES[key],
+        "fill": "tozeroy",
+        "fillcolor": colors["fill"],
+        "hoverlabel": {
+            "bgcolor": "white",
+            "bordercolor": colors["line"],
+            "font": {"size": 12},
+        },
+        "textfont": {
+            "size": 10,
+            "color": colors["line"],
+            "weight": 500,
+        },
+        "textposition": "top left",
+    }
+    for key, colors in _METRIC_COLORS.items()
+}
+
+_THRESHOLD_FONTS = {
+    key: {"size": 10, "color": colors["line"], "weight": 500}
+    for key, colors in _METRIC_COLORS.items()
+}
+
+
 # Enhanced trace configuration for smooth, polished lines
 def get_enhanced_trace_config(metric_type="cpu", show_fill=True):
     """
@@ -135,28 +191,16 @@ def get_enhanced_trace_config(metric_type="cpu", show_fill=True):
     Returns:
         dict: Plotly trace configuration
     """
-    colors = GRAPH_COLORS.get(metric_type, GRAPH_COLORS["cpu"])
-
-    config = {
-        "mode": "lines",
-        "line": {
-            "color": colors["line"],
-            "width": 2.5,
-            "shape": "spline",  # Smooth curves instead of sharp angles
-            "smoothing": 1.0,  # Maximum smoothing
-        },
-        "hovertemplate": "%{y:.2f}%<extra></extra>",  # Clean hover text
-        "hoverlabel": {
-            "bgcolor": colors["hover"],
-            "bordercolor": colors["line"],
-        },
-    }
+    if metric_type not in _TRACE_TEMPLATES:
+        metric_type = "cpu"
 
     if show_fill:
-        config["fill"] = "tozeroy"
-        config["fillcolor"] = colors["fill"]
-
-    return config
+        return {
+            **_TRACE_TEMPLATES[metric_type],
+            "fill": "tozeroy",
+            "fillcolor": GRAPH_COLORS[metric_type]["fill"],
+        }
+    return dict(_TRACE_TEMPLATES[metric_type])
 
 
 # Enhanced trace for percentage metrics (CPU, RAM, Disk)
@@ -173,37 +217,21 @@ def get_percentage_trace_config(metric_name, color_key, timestamp, values):
     Returns:
         dict: Complete trace configuration
     """
-    colors = GRAPH_COLORS.get(color_key, GRAPH_COLORS["cpu"])
+    template = _PERCENTAGE_TEMPLATES.get(color_key, _PERCENTAGE_TEMPLATES["cpu"])
+    # Only the last point carries a label
+    n_points = len(values)
+    text = [""] * (n_points - 1) + [metric_name] if n_points else []
 
     return {
+        **template,
         "x": timestamp,
         "y": values,
-        "mode": "lines+text",
         "name": metric_name,
-        "line": {
-            "color": colors["line"],
-            "width": 2.5,
-            "shape": "spline",
-            "smoothing": 1.0,
-        },
-        "fill": "tozeroy",
-        "fillcolor": colors["fill"],
         "hovertemplate": f"<b>{metric_name}</b><br>" +
                         "Time: %{x|%H:%M}<br>" +
                         "Value: %{y:.1f}%<br>" +
                         "<extra></extra>",
-        "hoverlabel": {
-            "bgcolor": "white",
-            "bordercolor": colors["line"],
-            "font": {"size": 12},
-        },
-        "text": [f"{metric_name}" if i == len(values) - 1 else "" for i in range(len(values))],
-        "textfont": {
-			"size": 10,
-			"color": colors["line"],
-			"weight": 500,
-		},
-        "textposition": "top left",
+        "text": text,
     }
 
 
@@ -220,20 +248,16 @@ def get_threshold_line_config(value, label, line_type="warning"):
     Returns:
         dict: Threshold line configuration
     """
-    colors = GRAPH_COLORS.get(line_type, GRAPH_COLORS["warning"])
+    color_key = line_type if line_type in _METRIC_COLORS else "warning"
 
     return {
         "y": value,
         "line_dash": "dash" if line_type == "warning" else "dot",
-        "line_color": colors["line"],
+        "line_color": GRAPH_COLORS[color_key]["line"],
         "line_width": 1.5,
         "annotation": {
             "text": label,
-            "font": {
-                "size": 10,
-                "color": colors["line"],
-                "weight": 500,
-            },
+            "font": _THRESHOLD_FONTS[color_key],
             "showarrow": False,
             "xref": "paper",
             "x": 1.02,
@@ -3,10 +3,78 @@ Loading Components for Server Monitoring Dashboard
 Provides skeleton screens, loaders, and empty states for better UX
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from dash import html
 from config import KU_COLORS
 
+# Static component trees are built once and shared between callers (Dash only
+# reads them when serializing), so callers must not mutate what they get back.
 
+# Lookup tables (read-only)
+_SPINNER_SIZE_CLASSES = MappingProxyType(
+    {
+        "small": "spinner-small",
+        "medium": "spinner-medium",
+        "large": "spinner-large",
+    }
+)
+
+_PULSE_SIZE_CLASSES = MappingProxyType(
+    {
+        "small": "pulse-small",
+        "medium": "pulse-medium",
+        "large": "pulse-large",
+    }
+)
+
+_STATUS_COLORS = MappingProxyType(
+    {
+        "online": KU_COLORS["success"],
+        "warning": KU_COLORS["warning"],
+        "offline": KU_COLORS["danger"],
+        "unknown": KU_COLORS["muted"],
+    }
+)
+
+# Pulse indicator styles by status, shared by every indicator with that status
+_PULSE_STYLES = MappingProxyType(
+    {status: {"--pulse-color": color} for status, color in _STATUS_COLORS.items()}
+)
+
+# Pulse indicator class names for every known status/size
+_PULSE_DOT_CLASSES = MappingProxyType(
+    {status: f"pulse-dot {status}" for status in _STATUS_COLORS}
+)
+_PULSE_RING_CLASSES = MappingProxyType(
+    {status: f"pulse-ring {status}" for status in _STATUS_COLORS}
+)
+_PULSE_CONTAINER_CLASSES = MappingProxyType(
+    {size: f"pulse-indicator {cls}" for size, cls in _PULSE_SIZE_CLASSES.items()}
+)
+
+_BADGE_CLASSES = MappingProxyType(
+    {
+        badge_type: f"badge badge-{badge_type}"
+        for badge_type in ("success", "warning", "danger", "info")
+    }
+)
+
+# Counter value classes, indexed by the animate flag
+_COUNTER_CLASSES = ("counter-value", "counter-value animated")
+
+
+@lru_cache(maxsize=128)
+def _leaf(class_name):
+    """Shared childless html.Div for a className (one object per class)"""
+    return html.Div(className=class_name)
+
+
+# Every skeleton table row shares this child list; Dash only reads it
+_ROW_CHILDREN = [_leaf("skeleton skeleton-cell")] * 4
+
+
+@lru_cache(maxsize=None)
 def create_skeleton_card():
     """
     Create a skeleton loading card for server cards
@@ -16,14 +84,14 @@ def create_skeleton_card():
     """
     return html.Div(
         [
-            html.Div(className="skeleton skeleton-header"),
-            html.Div(className="skeleton skeleton-badge"),
+            _leaf("skeleton skeleton-header"),
+            _leaf("skeleton skeleton-badge"),
             html.Div(
                 [
-                    html.Div(className="skeleton skeleton-metric"),
-                    html.Div(className="skeleton skeleton-metric"),
-                    html.Div(className="skeleton skeleton-metric"),
-                    html.Div(className="skeleton skeleton-metric"),
+                    _leaf("skeleton skeleton-metric"),
+                    _leaf("skeleton skeleton-metric"),
+                    _leaf("skeleton skeleton-metric"),
+                    _leaf("skeleton skeleton-metric"),
                 ],
                 className="skeleton-metrics-row",
             ),
@@ -32,6 +100,7 @@ def create_skeleton_card():
     )
 
 
+@lru_cache(maxsize=None)
 def create_skeleton_table(rows=5):
     """
     Create a skeleton loading table
@@ -42,29 +111,20 @@ def create_skeleton_table(rows=5):
     Returns:
         html.Div: Skeleton table component
     """
-    skeleton_rows = []
-    for i in range(rows):
-        skeleton_rows.append(
-            html.Div(
-                [
-                    html.Div(className="skeleton skeleton-cell"),
-                    html.Div(className="skeleton skeleton-cell"),
-                    html.Div(className="skeleton skeleton-cell"),
-                    html.Div(className="skeleton skeleton-cell"),
-                ],
-                className="skeleton-row",
-            )
-        )
+    skeleton_rows = [
+        html.Div(_ROW_CHILDREN, className="skeleton-row") for _ in range(rows)
+    ]
 
     return html.Div(
         [
-            html.Div(className="skeleton skeleton-table-header"),
+            _leaf("skeleton skeleton-table-header"),
             html.Div(skeleton_rows, className="skeleton-table-body"),
         ],
         className="skeleton-table",
     )
 
 
+@lru_cache(maxsize=None)
 def create_skeleton_graph():
     """
     Create a skeleton loading graph
@@ -74,14 +134,15 @@ def create_skeleton_graph():
     """
     return html.Div(
         [
-            html.Div(className="skeleton skeleton-graph-title"),
-            html.Div(className="skeleton skeleton-graph-chart"),
-            html.Div(className="skeleton skeleton-graph-legend"),
+            _leaf("skeleton skeleton-graph-title"),
+            _leaf("skeleton skeleton-graph-chart"),
+            _leaf("skeleton skeleton-graph-legend"),
         ],
         className="skeleton-graph",
     )
 
 
+@lru_cache(maxsize=32)
 def create_loading_spinner(size="medium", message="Loading..."):
     """
     Create a KU-branded loading spinner
@@ -93,29 +154,23 @@ def create_loading_spinner(size="medium", message="Loading..."):
     Returns:
         html.Div: Loading spinner component
     """
-    size_classes = {
-        "small": "spinner-small",
-        "medium": "spinner-medium",
-        "large": "spinner-large",
-    }
+    size_class = _SPINNER_SIZE_CLASSES.get(size, "spinner-medium")
+
+    children = [
+        html.Div(
+            [
+                _leaf("spinner-ring"),
+                _leaf("spinner-ring"),
+                _leaf("spinner-ring"),
+                _leaf("spinner-ring"),
+            ],
+            className=f"spinner {size_class}",
+        )
+    ]
+    if message:
+        children.append(html.P(message, className="spinner-message"))
 
-    return html.Div(
-        [
-            html.Div(
-                [
-                    html.Div(className="spinner-ring"),
-                    html.Div(className="spinner-ring"),
-                    html.Div(className="spinner-ring"),
-                    html.Div(className="spinner-ring"),
-                ],
-                className=f"spinner {size_classes.get(size, 'spinner-medium')}",
-            ),
-            html.P(message, className="spinner-message")
-            if message
-            else None,
-        ],
-        className="loading-container",
-    )
+    return html.Div(children, className="loading-container")
 
 
 def create_empty_state(icon="fas fa-database", title="No Data Available", message="", action_button=None):
@@ -131,22 +186,22 @@ def create_empty_state(icon="fas fa-database", title="No Data Available", messag
     Returns:
         html.Div: Empty state component
     """
+    children = [
+        html.I(className=icon, style={"fontSize": "64px", "marginBottom": "20px"}),
+        html.H3(title, className="empty-state-title"),
+    ]
+    if message:
+        children.append(html.P(message, className="empty-state-message"))
+    if action_button:
+        children.append(action_button)
+
     return html.Div(
-        [
-            html.Div(
-                [
-                    html.I(className=icon, style={"fontSize": "64px", "marginBottom": "20px"}),
-                    html.H3(title, className="empty-state-title"),
-                    html.P(message, className="empty-state-message") if message else None,
-                    action_button if action_button else None,
-                ],
-                className="empty-state-content",
-            )
-        ],
+        [html.Div(children, className="empty-state-content")],
         className="empty-state",
     )
 
 
+@lru_cache(maxsize=None)
 def create_empty_server_state():
     """Create empty state for server data"""
     return create_empty_state(
@@ -161,6 +216,7 @@ def create_empty_server_state():
     )
 
 
+@lru_cache(maxsize=None)
 def create_empty_user_state():
     """Create empty state for user data"""
     return create_empty_state(
@@ -170,6 +226,7 @@ def create_empty_user_state():
     )
 
 
+@lru_cache(maxsize=None)
 def create_empty_network_state():
     """Create empty state for network data"""
     return create_empty_state(
@@ -199,34 +256,32 @@ def create_progress_bar(percentage, label="", show_percentage=True):
     else:
         color_class = "progress-danger"
 
-    return html.Div(
-        [
-            html.Div(
-                [
-                    html.Span(label, className="progress-label") if label else None,
-                    html.Span(f"{percentage:.0f}%", className="progress-percentage")
-                    if show_percentage
-                    else None,
-                ],
-                className="progress-header",
-            )
-            if label or show_percentage
-            else None,
-            html.Div(
-                [
-                    html.Div(
-                        className=f"progress-fill {color_class}",
-                        style={"width": f"{min(percentage, 100)}%"},
-                        **{"data-percentage": f"{percentage:.0f}"},
-                    )
-                ],
-                className="progress-bar",
-            ),
-        ],
-        className="progress-container",
+    header = []
+    if label:
+        header.append(html.Span(label, className="progress-label"))
+    if show_percentage:
+        header.append(
+            html.Span(f"{percentage:.0f}%", className="progress-percentage")
+        )
+
+    children = [html.Div(header, className="progress-header")] if header else []
+    children.append(
+        html.Div(
+            [
+                html.Div(
+                    className=f"progress-fill {color_class}",
+                    style={"width": f"{min(percentage, 100)}%"},
+                    **{"data-percentage": f"{percentage:.0f}"},
+                )
+            ],
+            className="progress-bar",
+        )
     )
 
+    return html.Div(children, className="progress-container")
 
+
+@lru_cache(maxsize=16)
 def create_loading_overlay(message="Loading..."):
     """
     Create a full-screen loading overlay
@@ -252,6 +307,7 @@ def create_loading_overlay(message="Loading..."):
     )
 
 
+@lru_cache(maxsize=64)
 def create_pulse_indicator(status="online", size="small"):
     """
     Create a pulsing status indicator
@@ -263,26 +319,21 @@ def create_pulse_indicator(status="online", size="small"):
     Returns:
         html.Div: Pulse indicator component
     """
-    status_colors = {
-        "online": KU_COLORS["success"],
-        "warning": KU_COLORS["warning"],
-        "offline": KU_COLORS["danger"],
-        "unknown": KU_COLORS["muted"],
-    }
-
-    size_classes = {
-        "small": "pulse-small",
-        "medium": "pulse-medium",
-        "large": "pulse-large",
-    }
-
     return html.Div(
         [
-            html.Div(className=f"pulse-dot {status}", **{"data-status": status}),
-            html.Div(className=f"pulse-ring {status}", **{"data-status": status}),
+            html.Div(
+                className=_PULSE_DOT_CLASSES.get(status) or f"pulse-dot {status}",
+                **{"data-status": status},
+            ),
+            html.Div(
+                className=_PULSE_RING_CLASSES.get(status) or f"pulse-ring {status}",
+                **{"data-status": status},
+            ),
         ],
-        className=f"pulse-indicator {size_classes.get(size, 'pulse-small')}",
-        style={"--pulse-color": status_colors.get(status, KU_COLORS["muted"])},
+        className=_PULSE_CONTAINER_CLASSES.get(
+            size, _PULSE_CONTAINER_CLASSES["small"]
+        ),
+        style=_PULSE_STYLES.get(status, _PULSE_STYLES["unknown"]),
     )
 
 
@@ -300,24 +351,26 @@ def create_number_counter(value, label="", prefix="", suffix="", animate=True):
     Returns:
         html.Div: Number counter component
     """
-    return html.Div(
-        [
-            html.Div(
-                [
-                    html.Span(prefix, className="counter-prefix") if prefix else None,
-                    html.Span(
-                        f"{value:.1f}" if isinstance(value, float) else str(value),
-                        className="counter-value" + (" animated" if animate else ""),
-                        **{"data-target": str(value)},
-                    ),
-                    html.Span(suffix, className="counter-suffix") if suffix else None,
-                ],
-                className="counter-number",
-            ),
-            html.Div(label, className="counter-label") if label else None,
-        ],
-        className="number-counter",
-    )
+    # Format once; the displayed text doubles as the animation target
+    text = format(value, ".1f") if isinstance(value, float) else str(value)
+
+    number = [
+        html.Span(
+            text,
+            className=_COUNTER_CLASSES[bool(animate)],
+            **{"data-target": text},
+        )
+    ]
+    if prefix:
+        number.insert(0, html.Span(prefix, className="counter-prefix"))
+    if suffix:
+        number.append(html.Span(suffix, className="counter-suffix"))
+
+    children = [html.Div(number, className="counter-number")]
+    if label:
+        children.append(html.Div(label, className="counter-label"))
+
+    return html.Div(children, className="number-counter")
 
 
 def create_trend_indicator(current, previous, metric_name="", reverse_colors=False):
@@ -369,6 +422,12 @@ def create_trend_indicator(current, previous, metric_name="", reverse_colors=Fal
     )
 
 
+@lru_cache(maxsize=64)
+def _badge_icon(icon):
+    """Shared badge icon element (text varies per badge, icons rarely do)"""
+    return html.I(className=icon, style={"marginRight": "6px"})
+
+
 def create_badge(text, badge_type="info", icon=None):
     """
     Create a status badge
@@ -381,12 +440,13 @@ def create_badge(text, badge_type="info", icon=None):
     Returns:
         html.Span: Badge component
     """
+    children = [text]
+    if icon:
+        children.insert(0, _badge_icon(icon))
+
     return html.Span(
-        [
-            html.I(className=icon, style={"marginRight": "6px"}) if icon else None,
-            text,
-        ],
-        className=f"badge badge-{badge_type}",
+        children,
+        className=_BADGE_CLASSES.get(badge_type) or f"badge badge-{badge_type}",
     )
 
 
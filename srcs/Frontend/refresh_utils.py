@@ -1,50 +1,88 @@
 # Refresh utility functions for the Server Monitoring Dashboard
-from datetime import datetime
+from functools import lru_cache
 import logging
-from typing import Dict
+import time
+from typing import Dict, NamedTuple, Optional
+from config import CACHE_CONFIG
 from api_client import check_api_health
+from cache_utils import invalidate_all_caches, get_cache_stats
 
 logger = logging.getLogger(__name__)
 
 
-def trigger_dashboard_refresh() -> Dict:
+class RefreshResult(NamedTuple):
+    """Outcome of trigger_dashboard_refresh()"""
+
+    success: bool
+    timestamp: str
+    message: str
+    cache_stats: Optional[Dict] = None
+
+    def as_dict(self) -> Dict:
+        """Plain-dict form for callbacks that return JSON"""
+        result = self._asdict()
+        if self.cache_stats is None:
+            del result["cache_stats"]
+        return result
+
+
+@lru_cache(maxsize=1)
+def _api_health_for_window(window: int) -> bool:
+    """Probe the API once per time window; later calls in the window reuse it"""
+    return check_api_health()
+
+
+def _cached_api_health() -> bool:
     """
-    Trigger a manual refresh of all dashboard data
+    API health, probed at most once per CACHE_CONFIG["health_ttl"] seconds
 
-    This function checks API health.
+    Kept out of the shared cache on purpose: a refresh clears that cache,
+    which would otherwise force a new probe on every click.
+    """
+    return _api_health_for_window(int(time.monotonic() // CACHE_CONFIG["health_ttl"]))
+
+
+def trigger_dashboard_refresh() -> RefreshResult:
+    """
+    Trigger a refresh of all dashboard data
+
+    This function checks API health and clears cached API responses so the
+    next render fetches fresh data. It backs the manual refresh button;
+    interval ticks don't call it, so cache entries expire on their own TTLs.
 
     Returns:
-        Dictionary with refresh status and timestamp
+        RefreshResult with refresh status and timestamp
     """
+    # One local-time timestamp for every return path, without a datetime object
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+
     try:
         # Check API health before refreshing
-        api_healthy = check_api_health()
+        api_healthy = _cached_api_health()
 
         if not api_healthy:
             logger.warning("API health check failed during refresh")
-            return {
-                "success": False,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "message": "API is not responding. Please check the backend service.",
-            }
+            return RefreshResult(
+                False,
+                timestamp,
+                "API is not responding. Please check the backend service.",
+            )
+
+        invalidate_all_caches()
 
         # Return success with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(f"Dashboard refresh triggered at {timestamp}")
 
-        return {
-            "success": True,
-            "timestamp": timestamp,
-            "message": f"Dashboard refreshed successfully at {timestamp}",
-        }
+        return RefreshResult(
+            True,
+            timestamp,
+            f"Dashboard refreshed successfully at {timestamp}",
+            get_cache_stats(),
+        )
 
     except Exception as e:
         logger.error(f"Error during dashboard refresh: {e}", exc_info=True)
-        return {
-            "success": False,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "message": f"Refresh failed: {str(e)}",
-        }
+        return RefreshResult(False, timestamp, f"Refresh failed: {str(e)}")
 
 
 def get_refresh_status_message(refresh_result):
@@ -52,15 +90,15 @@ def get_refresh_status_message(refresh_result):
     Generate a user-friendly status message for the refresh operation
 
     Args:
-        refresh_result: Dictionary returned by trigger_dashboard_refresh()
+        refresh_result: RefreshResult returned by trigger_dashboard_refresh()
 
     Returns:
         String message for display
     """
-    if refresh_result.get("success"):
-        return f"✓ Last updated: {refresh_result.get('timestamp')}"
+    if refresh_result.success:
+        return f"✓ Last updated: {refresh_result.timestamp}"
     else:
-        return f"⚠ Update failed: {refresh_result.get('message', 'Unknown error')}"
+        return f"⚠ Update failed: {refresh_result.message or 'Unknown error'}"
 
 
 def validate_refresh_interval(n_intervals):
@@ -77,5 +115,5 @@ def validate_refresh_interval(n_intervals):
         # Always allow refresh
         return True
     except Exception as e:
-        logging.error(f"Error validating refresh interval: {e}")
+        logger.error(f"Error validating refresh interval: {e}")
         return False
@@ -3,15 +3,23 @@ Enhanced Table and Card Configuration for Server Monitoring Dashboard
 Provides modern, polished styling for tables and card components
 """
 
-from config import KU_COLORS
+from types import MappingProxyType
+from config import KU_COLORS, KU_PRIMARY, KU_SUCCESS, KU_WARNING, KU_DANGER
+
+# Style values shared by several style dicts (one string object each)
+_BORDER_STD = f"1px solid {KU_COLORS['border']}"
+_SHADOW_SM = "0 2px 8px rgba(0, 61, 165, 0.08)"
+
+# The top-level style tables below are read-only; their inner dicts stay
+# plain dicts because Dash serializes them directly.
 
 # Enhanced Table Styling Configuration
-ENHANCED_TABLE_STYLE = {
+ENHANCED_TABLE_STYLE = MappingProxyType({
     "table": {
         "overflowX": "auto",
         "borderRadius": "12px",
-        "boxShadow": "0 2px 8px rgba(0, 61, 165, 0.08)",
-        "border": f"1px solid {KU_COLORS['border']}",
+        "boxShadow": _SHADOW_SM,
+        "border": _BORDER_STD,
     },
     "cell": {
         "textAlign": "left",
@@ -20,7 +28,7 @@ ENHANCED_TABLE_STYLE = {
         "fontSize": "14px",
         "lineHeight": "1.5",
         "color": KU_COLORS["text_primary"],
-        "borderBottom": f"1px solid {KU_COLORS['border']}",
+        "borderBottom": _BORDER_STD,
         "transition": "background-color 0.2s ease",
     },
     "header": {
@@ -38,214 +46,246 @@ ENHANCED_TABLE_STYLE = {
         "backgroundColor": "white",
         "border": "none",
     },
-}
+})
 
-# Enhanced conditional styling for table cells
-def get_enhanced_table_conditional_styles():
+
+def _threshold_rules(
+    column_id, warn_query, crit_query, alpha="0.08", accent=True, crit_weight="700"
+):
     """
-    Get enhanced conditional styles for tables with modern design
+    Build the warning and critical highlight rules for one numeric column
+
+    Args:
+        column_id: Column the rules apply to
+        warn_query: DataTable filter_query selecting warning cells
+        crit_query: DataTable filter_query selecting critical cells
+        alpha: Background tint opacity
+        accent: Whether to add a colored left border
+        crit_weight: Font weight for critical cells
+
+    Returns:
+        List of [warning rule, critical rule]
     """
-    return [
-        # Zebra striping with subtle color
-        {
-            "if": {"row_index": "odd"},
-            "backgroundColor": "rgba(248, 249, 250, 0.6)",
-        },
-        # Hover effect
-        {
-            "if": {"state": "active"},
-            "backgroundColor": "rgba(0, 61, 165, 0.04)",
-            "border": f"1px solid {KU_COLORS['primary']}",
-        },
-        # CPU Warning (50-70%)
-        {
-            "if": {
-                "column_id": "cpu",
-                "filter_query": "{cpu} > 50 && {cpu} <= 70"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
-            "borderLeft": f"3px solid {KU_COLORS['warning']}",
-        },
-        # CPU Critical (>70%)
-        {
-            "if": {
-                "column_id": "cpu",
-                "filter_query": "{cpu} > 70"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "700",
-            "borderLeft": f"3px solid {KU_COLORS['danger']}",
-        },
-        # Memory Warning (50-70%)
-        {
-            "if": {
-                "column_id": "mem",
-                "filter_query": "{mem} > 50 && {mem} <= 70"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
-            "borderLeft": f"3px solid {KU_COLORS['warning']}",
-        },
-        # Memory Critical (>70%)
-        {
-            "if": {
-                "column_id": "mem",
-                "filter_query": "{mem} > 70"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "700",
-            "borderLeft": f"3px solid {KU_COLORS['danger']}",
-        },
-        # Disk Warning (>10GB)
-        {
-            "if": {
-                "column_id": "disk",
-                "filter_query": "{disk} > 10"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
-            "borderLeft": f"3px solid {KU_COLORS['warning']}",
-        },
-        # Status: Offline
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} contains Offline"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "600",
-        },
-        # Status: Warning
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} contains Warning"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
+    rules = []
+    for query, rgb, color, weight in (
+        (warn_query, "245, 127, 41", KU_WARNING, "600"),
+        (crit_query, "227, 30, 36", KU_DANGER, crit_weight),
+    ):
+        rule = {
+            "if": {"column_id": column_id, "filter_query": query},
+            "backgroundColor": f"rgba({rgb}, {alpha})",
+            "color": color,
+            "fontWeight": weight,
+        }
+        if accent:
+            rule["borderLeft"] = f"3px solid {color}"
+        rules.append(rule)
+    return rules
+
+
+# Enhanced conditional styling for table cells
+_ENHANCED_TABLE_CONDITIONAL_STYLES = (
+    # Zebra striping with subtle color
+    {
+        "if": {"row_index": "odd"},
+        "backgroundColor": "rgba(248, 249, 250, 0.6)",
+    },
+    # Hover effect
+    {
+        "if": {"state": "active"},
+        "backgroundColor": "rgba(0, 61, 165, 0.04)",
+        "border": f"1px solid {KU_PRIMARY}",
+    },
+    # CPU and memory: bands are precomputed server-side so the browser
+    # does an equality check instead of a range expression
+    *_threshold_rules("cpu", '{cpu_band} = "warn"', '{cpu_band} = "danger"'),
+    *_threshold_rules("mem", '{mem_band} = "warn"', '{mem_band} = "danger"'),
+    # Disk Warning (>10GB)
+    {
+        "if": {
+            "column_id": "disk",
+            "filter_query": '{disk_band} = "warn"'
         },
-        # Status: Online/Normal
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} contains Online"
-            },
-            "color": KU_COLORS["success"],
-            "fontWeight": "500",
+        "backgroundColor": "rgba(245, 127, 41, 0.08)",
+        "color": KU_WARNING,
+        "fontWeight": "600",
+        "borderLeft": f"3px solid {KU_WARNING}",
+    },
+    # Status: Offline
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} contains Offline"
         },
-        # High Usage Status
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} contains High"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "600",
-            "padding": "8px 12px",
+        "backgroundColor": "rgba(227, 30, 36, 0.08)",
+        "color": KU_DANGER,
+        "fontWeight": "600",
+    },
+    # Status: Warning
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} contains Warning"
         },
-        # TCP Connections Critical (>100)
-        {
-            "if": {
-                "column_id": "tcp_connections",
-                "filter_query": "{tcp_connections} > 100"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "600",
-            "borderLeft": f"3px solid {KU_COLORS['danger']}",
+        "backgroundColor": "rgba(245, 127, 41, 0.08)",
+        "color": KU_WARNING,
+        "fontWeight": "600",
+    },
+    # Status: Online/Normal
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} contains Online"
         },
-        # TCP Connections Warning (>50)
-        {
-            "if": {
-                "column_id": "tcp_connections",
-                "filter_query": "{tcp_connections} > 50 && {tcp_connections} <= 100"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
-            "borderLeft": f"3px solid {KU_COLORS['warning']}",
+        "color": KU_SUCCESS,
+        "fontWeight": "500",
+    },
+    # High Usage Status
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} contains High"
         },
-    ]
+        "backgroundColor": "rgba(227, 30, 36, 0.08)",
+        "color": KU_DANGER,
+        "fontWeight": "600",
+        "padding": "8px 12px",
+    },
+    # TCP connections: warning above 50, critical above 100
+    *_threshold_rules(
+        "tcp_connections",
+        '{tcp_connections_band} = "warn"',
+        '{tcp_connections_band} = "danger"',
+        crit_weight="600",
+    ),
+)
+
+
+def get_enhanced_table_conditional_styles():
+    """
+    Get enhanced conditional styles for tables with modern design
+
+    The tuple is built once at import and every call returns that same
+    object.
+    """
+    return _ENHANCED_TABLE_CONDITIONAL_STYLES
 
 
 # Network table specific conditional styles
-def get_network_table_conditional_styles():
-    """Get conditional styles specifically for network monitoring table"""
-    return [
-        {
-            "if": {"row_index": "odd"},
-            "backgroundColor": "rgba(248, 249, 250, 0.6)",
-        },
-        {
-            "if": {"state": "active"},
-            "backgroundColor": "rgba(0, 61, 165, 0.04)",
-        },
-        {
-            "if": {
-                "column_id": "tcp_connections",
-                "filter_query": "{tcp_connections} > 100"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "600",
-            "borderLeft": f"3px solid {KU_COLORS['danger']}",
+_NETWORK_TABLE_CONDITIONAL_STYLES = (
+    {
+        "if": {"row_index": "odd"},
+        "backgroundColor": "rgba(248, 249, 250, 0.6)",
+    },
+    {
+        "if": {"state": "active"},
+        "backgroundColor": "rgba(0, 61, 165, 0.04)",
+    },
+    {
+        "if": {
+            "column_id": "tcp_connections",
+            "filter_query": '{tcp_connections_band} = "danger"'
         },
-        {
-            "if": {
-                "column_id": "tcp_connections",
-                "filter_query": "{tcp_connections} > 50 && {tcp_connections} <= 100"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
+        "backgroundColor": "rgba(227, 30, 36, 0.08)",
+        "color": KU_DANGER,
+        "fontWeight": "600",
+        "borderLeft": f"3px solid {KU_DANGER}",
+    },
+    {
+        "if": {
+            "column_id": "tcp_connections",
+            "filter_query": '{tcp_connections_band} = "warn"'
         },
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} = Offline"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.08)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "600",
+        "backgroundColor": "rgba(245, 127, 41, 0.08)",
+        "color": KU_WARNING,
+        "fontWeight": "600",
+    },
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} = Offline"
         },
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} = Warning"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.08)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
+        "backgroundColor": "rgba(227, 30, 36, 0.08)",
+        "color": KU_DANGER,
+        "fontWeight": "600",
+    },
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} = Warning"
         },
-        {
-            "if": {
-                "column_id": "status",
-                "filter_query": "{status} = Online"
-            },
-            "color": KU_COLORS["success"],
-            "fontWeight": "500",
+        "backgroundColor": "rgba(245, 127, 41, 0.08)",
+        "color": KU_WARNING,
+        "fontWeight": "600",
+    },
+    {
+        "if": {
+            "column_id": "status",
+            "filter_query": "{status} = Online"
         },
-    ]
+        "color": KU_SUCCESS,
+        "fontWeight": "500",
+    },
+)
+
+
+def get_network_table_conditional_styles():
+    """
+    Get conditional styles specifically for network monitoring table
+
+    The tuple is built once at import and every call returns that same
+    object.
+    """
+    return _NETWORK_TABLE_CONDITIONAL_STYLES
+
+
+def build_column_indexed_styles(styles):
+    """
+    Group conditional style rules by the column they target
+
+    Args:
+        styles: Flat list of DataTable conditional style rules
+
+    Returns:
+        Dict of column_id -> rules; rules without a column_id (row striping,
+        active state) are stored under None
+    """
+    by_column = {}
+    for rule in styles:
+        by_column.setdefault(rule["if"].get("column_id"), []).append(rule)
+    return by_column
+
+
+def get_conditional_styles_for_columns(styles, column_ids):
+    """
+    Keep only the conditional style rules that can match the given columns
+
+    DataTable checks every rule against every cell, so rules for columns a
+    table does not have are pure overhead.
+
+    Args:
+        styles: Flat list of DataTable conditional style rules
+        column_ids: Column ids the table actually renders
+
+    Returns:
+        List of the shared rules followed by each column's rules
+    """
+    by_column = build_column_indexed_styles(styles)
+    rules = list(by_column.get(None, ()))
+    for column_id in column_ids:
+        rules.extend(by_column.get(column_id, ()))
+    return rules
 
 
 # Enhanced Card Styling
-ENHANCED_CARD_STYLE = {
+ENHANCED_CARD_STYLE = MappingProxyType({
     "default": {
         "backgroundColor": "white",
         "borderRadius": "16px",
         "boxShadow": "0 4px 12px rgba(0, 61, 165, 0.08)",
         "padding": "28px",
         "marginBottom": "24px",
-        "border": f"1px solid {KU_COLORS['border']}",
+        "border": _BORDER_STD,
         "transition": "all 0.3s cubic-bezier(0.4, 0, 0.2, 1)",
         "position": "relative",
         "overflow": "hidden",
@@ -277,16 +317,16 @@ ENHANCED_CARD_STYLE = {
         "fontWeight": "400",
         "marginTop": "4px",
     },
-}
+})
 
 # Stat Card Styling (for overview statistics)
-STAT_CARD_STYLE = {
+STAT_CARD_STYLE = MappingProxyType({
     "container": {
         "backgroundColor": "white",
         "borderRadius": "12px",
         "padding": "20px 24px",
         "boxShadow": "0 2px 8px rgba(0, 61, 165, 0.06)",
-        "border": f"1px solid {KU_COLORS['border']}",
+        "border": _BORDER_STD,
         "transition": "all 0.2s ease",
         "cursor": "default",
         "minWidth": "180px",
@@ -319,91 +359,66 @@ STAT_CARD_STYLE = {
         "right": "20px",
         "top": "20px",
     },
-}
+})
 
 # Alert/Badge Styling
-BADGE_STYLES = {
-    "success": {
-        "backgroundColor": "rgba(0, 61, 165, 0.1)",
-        "color": KU_COLORS["success"],
-        "padding": "6px 12px",
-        "borderRadius": "20px",
-        "fontSize": "12px",
-        "fontWeight": "600",
-        "display": "inline-block",
-        "textTransform": "uppercase",
-        "letterSpacing": "0.5px",
-    },
-    "warning": {
-        "backgroundColor": "rgba(245, 127, 41, 0.1)",
-        "color": KU_COLORS["warning"],
-        "padding": "6px 12px",
-        "borderRadius": "20px",
-        "fontSize": "12px",
-        "fontWeight": "600",
-        "display": "inline-block",
-        "textTransform": "uppercase",
-        "letterSpacing": "0.5px",
-    },
-    "danger": {
-        "backgroundColor": "rgba(227, 30, 36, 0.1)",
-        "color": KU_COLORS["danger"],
-        "padding": "6px 12px",
-        "borderRadius": "20px",
-        "fontSize": "12px",
-        "fontWeight": "600",
-        "display": "inline-block",
-        "textTransform": "uppercase",
-        "letterSpacing": "0.5px",
-    },
-    "info": {
-        "backgroundColor": "rgba(0, 169, 206, 0.1)",
-        "color": KU_COLORS["info"],
-        "padding": "6px 12px",
-        "borderRadius": "20px",
-        "fontSize": "12px",
-        "fontWeight": "600",
-        "display": "inline-block",
-        "textTransform": "uppercase",
-        "letterSpacing": "0.5px",
-    },
+_BADGE_BASE = {
+    "padding": "6px 12px",
+    "borderRadius": "20px",
+    "fontSize": "12px",
+    "fontWeight": "600",
+    "display": "inline-block",
+    "textTransform": "uppercase",
+    "letterSpacing": "0.5px",
+}
+
+# Badge type -> (background tint, text color)
+_BADGE_VARIANTS = {
+    "success": ("rgba(0, 61, 165, 0.1)", KU_COLORS["success"]),
+    "warning": ("rgba(245, 127, 41, 0.1)", KU_COLORS["warning"]),
+    "danger": ("rgba(227, 30, 36, 0.1)", KU_COLORS["danger"]),
+    "info": ("rgba(0, 169, 206, 0.1)", KU_COLORS["info"]),
 }
 
+BADGE_STYLES = MappingProxyType({
+    name: {"backgroundColor": background, "color": color, **_BADGE_BASE}
+    for name, (background, color) in _BADGE_VARIANTS.items()
+})
+
 # Button/Action Styling
-BUTTON_STYLES = {
+_BUTTON_BASE = {
+    "padding": "10px 20px",
+    "borderRadius": "8px",
+    "fontSize": "14px",
+    "fontWeight": "600",
+    "cursor": "pointer",
+    "transition": "all 0.2s ease",
+}
+
+BUTTON_STYLES = MappingProxyType({
     "primary": {
+        **_BUTTON_BASE,
         "backgroundColor": KU_COLORS["primary"],
         "color": "white",
-        "padding": "10px 20px",
-        "borderRadius": "8px",
         "border": "none",
-        "fontSize": "14px",
-        "fontWeight": "600",
-        "cursor": "pointer",
-        "transition": "all 0.2s ease",
         "boxShadow": "0 2px 4px rgba(0, 61, 165, 0.2)",
     },
     "secondary": {
+        **_BUTTON_BASE,
         "backgroundColor": "white",
         "color": KU_COLORS["primary"],
-        "padding": "10px 20px",
-        "borderRadius": "8px",
         "border": f"2px solid {KU_COLORS['primary']}",
-        "fontSize": "14px",
-        "fontWeight": "600",
-        "cursor": "pointer",
-        "transition": "all 0.2s ease",
     },
-}
+})
 
 # Enhanced Table Pagination Styling
-PAGINATION_STYLE = {
+PAGINATION_STYLE = MappingProxyType({
     "previous-next-container": {
         "display": "flex",
         "justifyContent": "space-between",
         "padding": "12px 16px",
         "backgroundColor": "rgba(248, 249, 250, 0.6)",
-        "borderTop": f"1px solid {KU_COLORS['border']}",
+        "borderTop": _BORDER_STD,
     },
     "button": {
         "backgroundColor": KU_COLORS["primary"],
@@ -416,15 +431,15 @@ PAGINATION_STYLE = {
         "cursor": "pointer",
         "transition": "all 0.2s ease",
     },
-}
+})
 
 # Mobile-Responsive Table Styling
-MOBILE_TABLE_STYLE = {
+MOBILE_TABLE_STYLE = MappingProxyType({
     "table": {
         "overflowX": "auto",
         "borderRadius": "8px",
         "boxShadow": "0 1px 4px rgba(0, 61, 165, 0.06)",
-        "border": f"1px solid {KU_COLORS['border']}",
+        "border": _BORDER_STD,
         "minWidth": "100%",
     },
     "cell": {
@@ -434,7 +449,7 @@ MOBILE_TABLE_STYLE = {
         "fontSize": "12px",
         "lineHeight": "1.4",
         "color": KU_COLORS["text_primary"],
-        "borderBottom": f"1px solid {KU_COLORS['border']}",
+        "borderBottom": _BORDER_STD,
         "whiteSpace": "normal",  # Allow text wrapping on mobile
         "wordBreak": "break-word",  # Break long words
     },
@@ -456,59 +471,48 @@ MOBILE_TABLE_STYLE = {
         "backgroundColor": "white",
         "border": "none",
     },
-}
+})
 
 # Mobile-specific conditional styles (simplified for better performance)
+_MOBILE_TABLE_CONDITIONAL_STYLES = (
+    # Zebra striping
+    {
+        "if": {"row_index": "odd"},
+        "backgroundColor": "rgba(248, 249, 250, 0.5)",
+    },
+    # Warning and critical values (simplified - no border accent for mobile)
+    *_threshold_rules(
+        "cpu",
+        '{cpu_band} = "warn"',
+        '{cpu_band} = "danger"',
+        alpha="0.1",
+        accent=False,
+    ),
+    *_threshold_rules(
+        "mem",
+        '{mem_band} = "warn"',
+        '{mem_band} = "danger"',
+        alpha="0.1",
+        accent=False,
+    ),
+)
+
+
 def get_mobile_table_conditional_styles():
-    """Get simplified conditional styles for mobile tables"""
-    return [
-        # Zebra striping
-        {
-            "if": {"row_index": "odd"},
-            "backgroundColor": "rgba(248, 249, 250, 0.5)",
-        },
-        # Critical values (simplified - no border accent for mobile)
-        {
-            "if": {
-                "column_id": "cpu",
-                "filter_query": "{cpu} > 70"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.1)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "700",
-        },
-        {
-            "if": {
-                "column_id": "mem",
-                "filter_query": "{mem} > 70"
-            },
-            "backgroundColor": "rgba(227, 30, 36, 0.1)",
-            "color": KU_COLORS["danger"],
-            "fontWeight": "700",
-        },
-        # Warning values
-        {
-            "if": {
-                "column_id": "cpu",
-                "filter_query": "{cpu} > 50 && {cpu} <= 70"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.1)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
-        },
-        {
-            "if": {
-                "column_id": "mem",
-                "filter_query": "{mem} > 50 && {mem} <= 70"
-            },
-            "backgroundColor": "rgba(245, 127, 41, 0.1)",
-            "color": KU_COLORS["warning"],
-            "fontWeight": "600",
-        },
-    ]
+    """
+    Get simplified conditional styles for mobile tables
+
+    The rules match on precomputed band columns, not on the raw values: every
+    row must carry ``cpu_band`` and ``mem_band`` keys set to ``"ok"``,
+    ``"warn"`` or ``"danger"``, as added by ``components._add_usage_bands``.
+    Rows without them render unhighlighted. The tuple is built once at import
+    and every call returns that same object.
+    """
+    return _MOBILE_TABLE_CONDITIONAL_STYLES
+
 
 # Touch-Friendly Table Configuration
-TOUCH_FRIENDLY_TABLE_CONFIG = {
+TOUCH_FRIENDLY_TABLE_CONFIG = MappingProxyType({
     "page_size": 10,  # Fewer rows per page on mobile
     "style_table": {
         "overflowX": "auto",
@@ -522,4 +526,4 @@ TOUCH_FRIENDLY_TABLE_CONFIG = {
     },
     "tooltip_delay": 0,  # Instant tooltips on touch
     "tooltip_duration": None,  # Keep tooltip until dismissed
-}
+})
@@ -3,15 +3,29 @@ import pytest
 import sys
 import os
 from datetime import datetime, timedelta
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
-@pytest.fixture
+from types import MappingProxyType
+
+# Add parent directory to path for imports (once, for every test module)
+_FRONTEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _FRONTEND_DIR not in sys.path:
+    sys.path.insert(0, _FRONTEND_DIR)
+
+# One reference time for the whole session. It is taken from the real clock
+# (not a fixed date) because the code under test judges freshness against
+# datetime.now(); a session is far shorter than the offline threshold.
+BASELINE_NOW = datetime.now()
+NOW_ISO = BASELINE_NOW.isoformat()
+TWO_HOURS_AGO_ISO = (BASELINE_NOW - timedelta(hours=2)).isoformat()
+ONE_DAY_AGO_ISO = (BASELINE_NOW - timedelta(days=1)).isoformat()
+THIRTY_DAYS_AGO_ISO = (BASELINE_NOW - timedelta(days=30)).isoformat()
+
+
+# Read-only sample data is built once per session and frozen with
+# MappingProxyType; fixtures that need changes take a .copy() (a plain dict).
+@pytest.fixture(scope="session")
 def sample_server_metrics():
-    """Fixture providing sample server metrics data"""
-    return {
+    """Fixture providing sample server metrics data (read-only)"""
+    return MappingProxyType({
         "server_name": "TestServer1",
         "cpu_load_1min": 2.5,
         "cpu_load_5min": 3.0,
@@ -27,36 +41,33 @@ def sample_server_metrics():
         "disk_total": "1TB",
         "disk_used": "452GB",
         "operating_system": "Linux 5.14",
-        "last_boot": (datetime.now() - timedelta(days=30)).isoformat(),
-        "timestamp": datetime.now().isoformat(),
+        "last_boot": THIRTY_DAYS_AGO_ISO,
+        "timestamp": NOW_ISO,
         "active_ssh_users": 3,
         "active_vnc_users": 2,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_historical_data():
-    """Fixture providing sample historical metrics"""
-    base_time = datetime.now() - timedelta(hours=24)
-    data = []
-
-    for i in range(24):
-        timestamp = base_time + timedelta(hours=i)
-        data.append(
-            {
-                "server_name": "TestServer1",
-                "cpu_load_1min": 2.0 + (i % 5),
-                "cpu_load_5min": 2.5 + (i % 5),
-                "cpu_load_15min": 3.0 + (i % 5),
-                "ram_percentage": 50 + (i % 20),
-                "disk_percentage": 40 + (i % 10),
-                "logged_users": 3 + (i % 3),
-                "tcp_connections": 100 + (i % 50),
-                "timestamp": timestamp.isoformat(),
-            }
-        )
-
-    return data
+    """Fixture providing sample historical metrics (read-only rows)"""
+    base_time = BASELINE_NOW - timedelta(hours=24)
+    hour = timedelta(hours=1)
+
+    return tuple(
+        MappingProxyType({
+            "server_name": "TestServer1",
+            "cpu_load_1min": 2.0 + (i % 5),
+            "cpu_load_5min": 2.5 + (i % 5),
+            "cpu_load_15min": 3.0 + (i % 5),
+            "ram_percentage": 50 + (i % 20),
+            "disk_percentage": 40 + (i % 10),
+            "logged_users": 3 + (i % 3),
+            "tcp_connections": 100 + (i % 50),
+            "timestamp": (base_time + hour * i).isoformat(),
+        })
+        for i in range(24)
+    )
 
 
 @pytest.fixture
@@ -71,7 +82,7 @@ def sample_user_data():
             "disk": 5.0,
             "process_count": 12,
             "top_process": "python",
-            "last_login": datetime.now().isoformat(),
+            "last_login": NOW_ISO,
             "full_name": "Test User 1",
         },
         {
@@ -82,7 +93,7 @@ def sample_user_data():
             "disk": 12.5,
             "process_count": 25,
             "top_process": "matlab",
-            "last_login": (datetime.now() - timedelta(hours=2)).isoformat(),
+            "last_login": TWO_HOURS_AGO_ISO,
             "full_name": "Test User 2",
         },
         {
@@ -93,7 +104,7 @@ def sample_user_data():
             "disk": 2.0,
             "process_count": 5,
             "top_process": "bash",
-            "last_login": (datetime.now() - timedelta(days=1)).isoformat(),
+            "last_login": ONE_DAY_AGO_ISO,
             "full_name": "Test User 3",
         },
     ]
@@ -105,18 +116,19 @@ def empty_metrics():
     return {}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_servers_metrics(sample_server_metrics):
-    """Fixture providing metrics for multiple servers"""
-    servers = []
-    for i in range(1, 6):
-        server = sample_server_metrics.copy()
-        server["server_name"] = f"Server{i}"
-        server["cpu_load_5min"] = 2.0 + i
-        server["ram_percentage"] = 50 + (i * 5)
-        server["disk_percentage"] = 40 + (i * 3)
-        servers.append(server)
-    return servers
+    """Fixture providing metrics for multiple servers (read-only)"""
+    return tuple(
+        MappingProxyType({
+            **sample_server_metrics,
+            "server_name": f"Server{i}",
+            "cpu_load_5min": 2.0 + i,
+            "ram_percentage": 50 + (i * 5),
+            "disk_percentage": 40 + (i * 3),
+        })
+        for i in range(1, 6)
+    )
 
 
 @pytest.fixture
@@ -143,20 +155,22 @@ def offline_server_metrics(sample_server_metrics):
     """Fixture providing metrics for an offline server"""
     metrics = sample_server_metrics.copy()
     # Old timestamp indicating server is offline
-    metrics["timestamp"] = (datetime.now() - timedelta(hours=2)).isoformat()
+    metrics["timestamp"] = TWO_HOURS_AGO_ISO
     return metrics
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_response_success():
-    """Fixture for successful API response structure"""
-    return {"success": True, "data": [], "message": "Success"}
+    """Fixture for successful API response structure (read-only)"""
+    return MappingProxyType({"success": True, "data": (), "message": "Success"})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_response_error():
-    """Fixture for error API response structure"""
-    return {"success": False, "data": None, "message": "Error occurred"}
+    """Fixture for error API response structure (read-only)"""
+    return MappingProxyType(
+        {"success": False, "data": None, "message": "Error occurred"}
+    )
 
 
 # Markers for test categorization
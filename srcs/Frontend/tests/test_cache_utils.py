@@ -0,0 +1,276 @@
+# Unit tests for cache_utils module
+import pytest
+import time
+import threading
+import pandas as pd
+
+from cache_utils import (
+    SimpleCache,
+    get_cache,
+    cached,
+    invalidate_cache_pattern,
+    invalidate_all_caches,
+    get_cache_stats,
+    start_cache_warmer,
+)
+
+
+class FakeClock:
+    """Manually advanced nanosecond clock for expiry tests"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    """Start every test with an empty shared cache"""
+    invalidate_all_caches()
+    yield
+    invalidate_all_caches()
+
+
+class TestSimpleCache:
+    """Tests for SimpleCache class"""
+
+    def test_set_and_get(self):
+        cache = SimpleCache()
+        cache.set("key", {"value": 1})
+        assert cache.get("key") == {"value": 1}
+
+    def test_missing_key_returns_none(self):
+        assert SimpleCache().get("missing") is None
+
+    def test_cache_expiration(self):
+        clock = FakeClock()
+        cache = SimpleCache(clock=clock)
+        cache.set("key", "value", ttl_seconds=1)
+        clock.advance(1)
+        assert cache.get("key") is None
+
+    def test_invalidate(self):
+        cache = SimpleCache()
+        cache.set("key", "value")
+        cache.invalidate("key")
+        assert cache.get("key") is None
+
+    def test_cleanup_expired(self):
+        clock = FakeClock()
+        cache = SimpleCache(clock=clock)
+        cache.set("old", "value", ttl_seconds=1)
+        cache.set("new", "value", ttl_seconds=60)
+        clock.advance(2)
+        assert cache.cleanup_expired() == 1
+        assert cache.get("new") == "value"
+
+    def test_stats(self):
+        cache = SimpleCache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["total_requests"] == 2
+        assert stats["hit_rate"] == 50.0
+        assert stats["cached_items"] == 1
+
+    def test_stats_empty_cache(self):
+        assert SimpleCache().get_stats()["hit_rate"] == 0.0
+
+
+class TestGetCache:
+    """Tests for get_cache function"""
+
+    def test_get_cache_returns_same_instance(self):
+        assert get_cache() is get_cache()
+
+
+class TestCachedDecorator:
+    """Tests for cached decorator"""
+
+    def test_caches_result(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch(name):
+            calls.append(name)
+            return [name]
+
+        assert fetch("a") == ["a"]
+        assert fetch("a") == ["a"]
+        assert calls == ["a"]
+
+    def test_different_args_cached_separately(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch(name, hours=24):
+            calls.append((name, hours))
+            return [name, hours]
+
+        fetch("a", hours=6)
+        fetch("a", hours=24)
+        assert len(calls) == 2
+
+    def test_positional_keyword_and_default_share_entry(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch(name, hours=24):
+            calls.append((name, hours))
+            return [name, hours]
+
+        fetch("a", 24)
+        fetch("a", hours=24)
+        fetch("a")
+        fetch(name="a")
+        assert calls == [("a", 24)]
+
+    def test_refresh_uses_normalized_key(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch(name, hours=24):
+            calls.append((name, hours))
+            return [name, hours, len(calls)]
+
+        fetch.refresh("a", hours=24)
+        assert fetch("a") == ["a", 24, 1]
+        assert len(calls) == 1
+
+    def test_respects_ttl(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(get_cache(), "_clock", clock)
+        calls = []
+
+        @cached(ttl_seconds=1)
+        def fetch():
+            calls.append(1)
+            return [1]
+
+        fetch()
+        clock.advance(0.5)
+        fetch()
+        assert len(calls) == 1
+        clock.advance(1)
+        fetch()
+        assert len(calls) == 2
+
+    def test_empty_result_not_cached(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch():
+            calls.append(1)
+            return []
+
+        fetch()
+        fetch()
+        assert len(calls) == 2
+
+    def test_exception_not_cached(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch():
+            calls.append(1)
+            raise ValueError("boom")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                fetch()
+        assert len(calls) == 2
+
+    def test_empty_dataframe_not_cached(self):
+        calls = []
+
+        @cached(ttl_seconds=60)
+        def fetch():
+            calls.append(1)
+            return pd.DataFrame()
+
+        fetch()
+        fetch()
+        assert len(calls) == 2
+
+    def test_refresh_bypasses_cache(self):
+        values = iter([[1], [2]])
+
+        @cached(ttl_seconds=60)
+        def fetch():
+            return next(values)
+
+        assert fetch() == [1]
+        assert fetch.refresh() == [2]
+        assert fetch() == [2]
+
+    def test_custom_key_prefix(self):
+        @cached(ttl_seconds=60, key_prefix="custom_")
+        def fetch():
+            return [1]
+
+        fetch()
+        assert any(key[0] == "custom_" for key in get_cache()._cache)
+
+
+class TestInvalidateCachePattern:
+    """Tests for invalidate_cache_pattern function"""
+
+    def test_invalidate_matching_pattern(self):
+        cache = get_cache()
+        cache.set("historical_server1", [1])
+        cache.set("latest_metrics", [2])
+        assert invalidate_cache_pattern("historical_") == 1
+        assert cache.get("historical_server1") is None
+        assert cache.get("latest_metrics") == [2]
+
+    def test_invalidate_cached_function_by_prefix(self):
+        @cached(ttl_seconds=60, key_prefix="historical_")
+        def fetch(name):
+            return [name]
+
+        fetch("server1")
+        fetch("server2")
+        assert invalidate_cache_pattern("historical_") == 2
+        assert get_cache_stats()["cached_items"] == 0
+
+    def test_invalidate_all_with_empty_pattern(self):
+        cache = get_cache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert invalidate_cache_pattern("") == 2
+        assert get_cache_stats()["cached_items"] == 0
+
+
+class TestStartCacheWarmer:
+    """Tests for start_cache_warmer function"""
+
+    def test_runs_immediately_and_stops(self):
+        ran = threading.Event()
+        stop = start_cache_warmer(ran.set, interval_seconds=60, name="test-warmer")
+        assert ran.wait(1)
+        stop.set()
+
+    @pytest.mark.slow
+    def test_survives_errors(self):
+        calls = []
+
+        def warm():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        stop = start_cache_warmer(warm, interval_seconds=0.01, name="test-warmer")
+        time.sleep(0.05)
+        stop.set()
+        assert len(calls) >= 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,314 @@
+# Unit tests for data_processing module
+import pytest
+import numpy as np
+import pandas as pd
+
+import data_processing
+from data_processing import (
+    HISTORICAL_COLUMNS,
+    HISTORICAL_DTYPES,
+    calculate_trends,
+    convert_numeric_columns,
+    detect_anomalies,
+    parse_dataframe_timestamps,
+    prepare_historical_dataframe,
+    validate_dataframe_range,
+)
+
+
+def _rolling_trend(values, window=5):
+    """Reference: compare the first and last full windows of a rolling mean"""
+    ma = pd.Series(values, dtype="float64").rolling(window=window).mean()
+    if ma.isna().all():
+        return None
+    first_val = ma.dropna().iloc[0]
+    last_val = ma.dropna().iloc[-1]
+    change = ((last_val - first_val) / first_val * 100) if first_val != 0 else 0
+    if change > 5:
+        return "increasing"
+    if change < -5:
+        return "decreasing"
+    return "stable"
+
+
+class TestCalculateTrends:
+    """Tests for calculate_trends function"""
+
+    def test_increasing(self):
+        df = pd.DataFrame({"cpu": np.linspace(10, 50, 20)})
+        assert calculate_trends(df, "cpu") == "increasing"
+
+    def test_decreasing(self):
+        df = pd.DataFrame({"cpu": np.linspace(50, 10, 20)})
+        assert calculate_trends(df, "cpu") == "decreasing"
+
+    def test_stable(self):
+        df = pd.DataFrame({"cpu": [20.0] * 20})
+        assert calculate_trends(df, "cpu") == "stable"
+
+    def test_missing_column_returns_none(self):
+        df = pd.DataFrame({"cpu": [1.0] * 10})
+        assert calculate_trends(df, "ram") is None
+
+    def test_shorter_than_window_returns_none(self):
+        df = pd.DataFrame({"cpu": [1.0, 2.0]})
+        assert calculate_trends(df, "cpu") is None
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            # A gap in the first window moves the baseline inward to the
+            # first full window, which includes the spike: a decrease
+            [np.nan, 10, 10, 10, 10, 30, 12, 12, 12, 12, 12],
+            # A gap in the last window moves the end point inward
+            [12, 12, 12, 12, 12, 30, 10, 10, 10, 10, np.nan],
+            # No complete window at all
+            [1, np.nan, 2, np.nan, 3, np.nan, 4, np.nan, 5, np.nan],
+        ],
+    )
+    def test_nan_matches_rolling_mean(self, values):
+        df = pd.DataFrame({"cpu": values})
+        assert calculate_trends(df, "cpu") == _rolling_trend(values)
+
+    def test_all_nan_returns_none(self):
+        df = pd.DataFrame({"cpu": [np.nan] * 10})
+        assert calculate_trends(df, "cpu") is None
+
+
+def _server_rows(count):
+    """Server metric dicts with a mix of numbers, numeric strings and gaps"""
+    rows = []
+    for i in range(count):
+        rows.append({
+            "server_name": f"Server{i}",
+            "cpu_load_1min": 1.5 + i,
+            "cpu_load_5min": str(2.0 + i / 4),
+            "cpu_load_15min": None if i % 3 == 0 else 0.5 * i,
+            "ram_percentage": 40 + (i * 7) % 55,
+            "disk_percentage": "n/a" if i % 5 == 0 else 30.25 + i,
+            "logged_users": i % 4,
+            "tcp_connections": 100 + 13 * i,
+        })
+    return rows
+
+
+class TestAggregateMetrics:
+    """Tests for aggregate_metrics function"""
+
+    @pytest.mark.parametrize("operation", ["mean", "sum", "max", "min"])
+    @pytest.mark.parametrize("count", [3, 15, 16, 40])
+    def test_small_and_large_paths_agree(self, monkeypatch, operation, count):
+        rows = _server_rows(count)
+        monkeypatch.setattr(data_processing, "_USE_VECTOR_PATH_THRESHOLD", 10**6)
+        small = data_processing.aggregate_metrics(rows, operation)
+        monkeypatch.setattr(data_processing, "_USE_VECTOR_PATH_THRESHOLD", 0)
+        large = data_processing.aggregate_metrics(rows, operation)
+
+        assert small.keys() == large.keys()
+        for column, value in small.items():
+            assert value == pytest.approx(large[column]), column
+
+    def test_threshold_selects_path(self, monkeypatch):
+        calls = []
+
+        def record(path):
+            return lambda rows, operation: calls.append(path) or {"x": 1.0}
+
+        monkeypatch.setattr(
+            data_processing, "_aggregate_metrics_small", record("small")
+        )
+        monkeypatch.setattr(
+            data_processing, "_aggregate_metrics_large", record("large")
+        )
+        threshold = data_processing._USE_VECTOR_PATH_THRESHOLD
+        data_processing.aggregate_metrics(_server_rows(threshold - 1))
+        data_processing.aggregate_metrics(_server_rows(threshold))
+        assert calls == ["small", "large"]
+
+    def test_empty_list_returns_empty(self):
+        assert data_processing.aggregate_metrics([]) == {}
+
+    def test_unknown_operation_returns_empty(self):
+        assert data_processing.aggregate_metrics(_server_rows(3), "median") == {}
+        assert data_processing.aggregate_metrics(_server_rows(20), "median") == {}
+
+
+class TestParseDataframeTimestamps:
+    """Tests for parse_dataframe_timestamps function"""
+
+    def test_mixed_separators_and_fractions(self):
+        df = pd.DataFrame({"timestamp": [
+            "2025-01-01T10:00:00",
+            "2025-01-01 11:00:00",
+            "2025-01-01T12:00:00.123456",
+            "2025-01-01 13:00:00.5",
+            "2025-01-01T10:00:00",  # repeated value reuses the parse
+        ]})
+
+        result = parse_dataframe_timestamps(df)
+
+        assert result["timestamp"].tolist() == [
+            pd.Timestamp("2025-01-01 10:00:00"),
+            pd.Timestamp("2025-01-01 11:00:00"),
+            pd.Timestamp("2025-01-01 12:00:00.123456"),
+            pd.Timestamp("2025-01-01 13:00:00.500000"),
+            pd.Timestamp("2025-01-01 10:00:00"),
+        ]
+
+    def test_z_suffix_parses_as_utc(self):
+        df = pd.DataFrame({"timestamp": [
+            "2025-01-01T10:00:00Z",
+            "2025-01-01 11:00:00.250000Z",
+            "2025-01-01T12:00:00.5Z",
+        ]})
+
+        result = parse_dataframe_timestamps(df)
+
+        assert str(result["timestamp"].dt.tz) == "UTC"
+        assert result["timestamp"].tolist() == [
+            pd.Timestamp("2025-01-01 10:00:00", tz="UTC"),
+            pd.Timestamp("2025-01-01 11:00:00.25", tz="UTC"),
+            pd.Timestamp("2025-01-01 12:00:00.5", tz="UTC"),
+        ]
+
+    def test_invalid_and_missing_become_nat(self):
+        df = pd.DataFrame({"timestamp": ["2025-01-01T10:00:00", "garbage", None]})
+
+        result = parse_dataframe_timestamps(df)
+
+        assert result["timestamp"].isna().tolist() == [False, True, True]
+
+    def test_non_iso_falls_back_to_inference(self):
+        df = pd.DataFrame({"timestamp": ["01/02/2025 10:00", "01/03/2025 11:00"]})
+
+        result = parse_dataframe_timestamps(df)
+
+        assert result["timestamp"].tolist() == [
+            pd.Timestamp("2025-01-02 10:00"),
+            pd.Timestamp("2025-01-03 11:00"),
+        ]
+
+    def test_already_parsed_column_is_untouched(self):
+        parsed = pd.to_datetime(["2025-01-01 10:00:00"])
+        df = pd.DataFrame({"timestamp": parsed})
+        assert parse_dataframe_timestamps(df)["timestamp"].equals(df["timestamp"])
+
+
+class TestConvertNumericColumns:
+    """Tests for convert_numeric_columns function"""
+
+    def test_invalid_values_coerce_to_nan(self):
+        df = pd.DataFrame({"cpu": ["1.5", "bad", None, 4], "name": ["a"] * 4})
+
+        result = convert_numeric_columns(df, ["cpu", "missing"], fillna=np.nan)
+
+        assert result["cpu"].dtype == "float64"
+        assert result["cpu"].isna().tolist() == [False, True, True, False]
+        assert result["name"].tolist() == ["a"] * 4
+
+    def test_invalid_values_take_the_fill_value(self):
+        df = pd.DataFrame({"cpu": ["1.5", "bad", None]})
+        assert convert_numeric_columns(df, ["cpu"])["cpu"].tolist() == [1.5, 0, 0]
+
+    def test_dtypes_are_applied(self):
+        df = pd.DataFrame({"load": ["1.25", "x"], "users": ["3", "4"]})
+
+        result = convert_numeric_columns(
+            df, ["load", "users"], dtypes={"load": "float32", "users": "int32"}
+        )
+
+        assert result["load"].dtype == "float32"
+        assert result["users"].dtype == "int32"
+        assert result["load"].tolist() == [1.25, 0.0]
+
+
+class TestPrepareHistoricalDataframe:
+    """Tests for prepare_historical_dataframe function"""
+
+    def test_result_dtypes(self, sample_historical_data):
+        rows = [dict(row) for row in sample_historical_data]
+        rows[0]["ram_percentage"] = "not a number"
+        rows[1]["disk_percentage"] = 150  # clipped to 100
+
+        df = prepare_historical_dataframe(rows, "TestServer1")
+
+        assert list(df.columns) == HISTORICAL_COLUMNS
+        assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+        assert df.dtypes.drop("timestamp").to_dict() == {
+            column: np.dtype(dtype) for column, dtype in HISTORICAL_DTYPES.items()
+        }
+        assert df["ram_percentage"].iloc[0] == 0.0
+        assert df["disk_percentage"].iloc[1] == 100.0
+
+
+class TestValidateDataframeRange:
+    """Tests for validate_dataframe_range function"""
+
+    def test_clip_limits_values_and_keeps_nan(self):
+        df = pd.DataFrame({"ram": [-5.0, 50.0, np.nan, 150.0]})
+
+        result = validate_dataframe_range(df, "ram", 0, 100, clip=True)
+
+        np.testing.assert_array_equal(result["ram"], [0.0, 50.0, np.nan, 100.0])
+
+    def test_clip_keeps_float32(self):
+        df = pd.DataFrame({"ram": np.array([50.0, 150.0], dtype=np.float32)})
+        result = validate_dataframe_range(df, "ram", 0, 100, clip=True)
+        assert result["ram"].dtype == "float32"
+
+    def test_out_of_range_is_logged_not_changed(self, caplog):
+        df = pd.DataFrame({"cpu": [1.0, np.nan, 2000.0, -1.0]})
+
+        with caplog.at_level("WARNING", logger="data_processing"):
+            result = validate_dataframe_range(df, "cpu", 0, 1000)
+
+        # NaN is neither counted nor altered
+        assert "2 values in column 'cpu' are out of range" in caplog.text
+        np.testing.assert_array_equal(result["cpu"], [1.0, np.nan, 2000.0, -1.0])
+
+    def test_missing_column_returns_frame_unchanged(self):
+        df = pd.DataFrame({"cpu": [2000.0]})
+        result = validate_dataframe_range(df, "ram", 0, 100, clip=True)
+        assert result["cpu"].tolist() == [2000.0]
+
+
+class TestDetectAnomalies:
+    """Tests for detect_anomalies function"""
+
+    @staticmethod
+    def _reference(series, threshold_std):
+        """The pandas formulation the numpy path replaced"""
+        return (series - series.mean()).abs() > threshold_std * series.std()
+
+    @pytest.mark.parametrize("threshold_std", [1.0, 2.0, 3.0])
+    def test_matches_pandas_statistics(self, threshold_std):
+        values = np.random.default_rng(3).normal(50, 5, 200)
+        values[[10, 90]] = [120.0, -40.0]
+        values[::17] = np.nan
+        df = pd.DataFrame({"cpu": values}, index=range(100, 300))
+
+        result = detect_anomalies(df, "cpu", threshold_std)
+
+        pd.testing.assert_series_equal(
+            result, self._reference(df["cpu"], threshold_std), check_names=False
+        )
+        assert result.loc[110] and result.loc[190]
+
+    def test_nan_is_never_flagged(self):
+        df = pd.DataFrame({"cpu": [10.0, np.nan, 10.5, 9.5, 10.0, 300.0]})
+        result = detect_anomalies(df, "cpu", 1.0)
+        assert result.tolist() == [False, False, False, False, False, True]
+
+    def test_zero_std_flags_nothing(self):
+        df = pd.DataFrame({"cpu": [5.0] * 10})
+        assert not detect_anomalies(df, "cpu").any()
+
+    def test_single_value_flags_nothing(self):
+        df = pd.DataFrame({"cpu": [5.0, np.nan]})
+        assert detect_anomalies(df, "cpu").tolist() == [False, False]
+
+    def test_missing_column_returns_empty(self):
+        df = pd.DataFrame({"cpu": [1.0, 2.0]})
+        result = detect_anomalies(df, "ram")
+        assert result.empty
+        assert result.dtype == bool
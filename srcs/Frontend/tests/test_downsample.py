@@ -0,0 +1,73 @@
+# Unit tests for downsample module
+import pytest
+import numpy as np
+import pandas as pd
+
+from downsample import lttb_indices, downsample_series
+
+
+class TestLttbIndices:
+    """Tests for lttb_indices function"""
+
+    def test_returns_requested_number_of_points(self):
+        x = np.arange(1000)
+        y = np.sin(x / 10.0)
+        assert len(lttb_indices(x, y, 100)) == 100
+
+    def test_keeps_first_and_last_points(self):
+        x = np.arange(500)
+        y = np.random.default_rng(0).random(500)
+        indices = lttb_indices(x, y, 50)
+        assert indices[0] == 0
+        assert indices[-1] == 499
+
+    def test_indices_are_sorted_and_unique(self):
+        x = np.arange(500)
+        y = np.random.default_rng(1).random(500)
+        indices = lttb_indices(x, y, 50)
+        assert np.all(np.diff(indices) > 0)
+
+    def test_keeps_spike(self):
+        x = np.arange(1000)
+        y = np.zeros(1000)
+        y[437] = 100.0
+        assert 437 in lttb_indices(x, y, 20)
+
+    def test_short_series_returns_all_indices(self):
+        x = np.arange(10)
+        assert list(lttb_indices(x, x, 20)) == list(range(10))
+
+    def test_handles_nan_values(self):
+        x = np.arange(300)
+        y = np.ones(300)
+        y[::7] = np.nan
+        assert len(lttb_indices(x, y, 30)) == 30
+
+
+class TestDownsampleSeries:
+    """Tests for downsample_series function"""
+
+    def test_short_series_unchanged(self):
+        x = pd.Series(pd.date_range("2025-01-01", periods=100, freq="min"))
+        y = pd.Series(np.arange(100.0))
+        out_x, out_y = downsample_series(x, y, 100)
+        assert out_x is x
+        assert out_y is y
+
+    def test_long_series_downsampled(self):
+        x = pd.Series(pd.date_range("2025-01-01", periods=10000, freq="min"))
+        y = pd.Series(np.random.default_rng(2).random(10000))
+        out_x, out_y = downsample_series(x, y, 500)
+        assert len(out_x) == len(out_y) == 500
+        assert out_x.iloc[0] == x.iloc[0]
+        assert out_x.iloc[-1] == x.iloc[-1]
+
+    def test_string_values_coerced(self):
+        x = pd.Series(pd.date_range("2025-01-01", periods=1000, freq="min"))
+        y = pd.Series(["N/A" if i % 5 == 0 else str(i) for i in range(1000)])
+        out_x, out_y = downsample_series(x, y, 100)
+        assert len(out_x) == 100
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
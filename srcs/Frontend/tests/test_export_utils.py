@@ -0,0 +1,376 @@
+# Unit tests for export_utils module
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+
+import pytest
+import pandas as pd
+from datetime import datetime
+
+import export_utils
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned, so export file names are predictable"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2000, 1, 1, 0, 0, 0, tzinfo=tz)
+
+
+@pytest.fixture
+def export_timestamp():
+    """Unique file-name timestamp; removes every /tmp file written with it"""
+    timestamp = f"test_{uuid.uuid4().hex}"
+    yield timestamp
+    for name in os.listdir("/tmp"):
+        if timestamp in name:
+            os.remove(os.path.join("/tmp", name))
+
+
+@pytest.fixture
+def export_data(export_timestamp):
+    """Export tables shaped like generate_export_report's output"""
+    return {
+        "timestamp": export_timestamp,
+        "server_metrics": pd.DataFrame({
+            "server_name": [f"Server{i}" for i in range(1, 6)],
+            "cpu_load_5min": [0.5, 1.25, 2.0, 3.75, 8.5],
+            "ram_percentage": [40.5, 55.0, 61.25, 70.0, 95.5],
+            "logged_users": [1, 2, 3, 4, 5],
+        }),
+        "top_users": pd.DataFrame({
+            "username": ["user1", "user2", "user3"],
+            "cpu": [25.5, 60.0, 10.0],
+            "mem": [15.2, 45.0, 8.0],
+        }),
+        "system_overview": pd.DataFrame({
+            "metric": ["Total Servers", "Average CPU Load"],
+            "value": [5.0, 3.2],
+            "unit": ["count", "load"],
+        }),
+        "historical_metrics": None,
+    }
+
+
+class TestExportToExcel:
+    """Tests for export_to_excel function"""
+
+    @pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter"])
+    def test_round_trip(self, monkeypatch, export_data, engine):
+        pytest.importorskip(engine)
+        pytest.importorskip("openpyxl")  # pandas reads .xlsx with openpyxl
+        monkeypatch.setattr(export_utils, "_EXCEL_ENGINE", engine)
+
+        filepath = export_utils.export_to_excel(export_data)
+
+        assert filepath is not None
+        sheets = pd.read_excel(filepath, sheet_name=None)
+        assert list(sheets) == ["Server Metrics", "Top Users", "System Overview"]
+        pd.testing.assert_frame_equal(
+            sheets["Server Metrics"], export_data["server_metrics"]
+        )
+        pd.testing.assert_frame_equal(sheets["Top Users"], export_data["top_users"])
+        pd.testing.assert_frame_equal(
+            sheets["System Overview"], export_data["system_overview"]
+        )
+
+
+class TestColumnarExports:
+    """Tests for export_to_parquet and export_to_feather functions"""
+
+    @pytest.mark.parametrize(
+        "format, read",
+        [("parquet", pd.read_parquet), ("feather", pd.read_feather)],
+    )
+    def test_round_trip(self, export_data, format, read):
+        pytest.importorskip("pyarrow")
+
+        file_paths = export_utils.EXPORTERS[format](export_data)
+
+        timestamp = export_data["timestamp"]
+        assert file_paths == [
+            f"/tmp/{name}_{timestamp}.{format}"
+            for name in ("server_metrics", "top_users", "system_overview")
+        ]
+        for key, path in zip(
+            ("server_metrics", "top_users", "system_overview"), file_paths
+        ):
+            pd.testing.assert_frame_equal(read(path), export_data[key])
+
+
+def _history_rows(server, hours):
+    """Historical rows in the backend's shape for one server"""
+    return [
+        {
+            "timestamp": f"2026-10-16T{hour:02d}:00:00",
+            "cpu_load_1min": 0.5 * hour,
+            "cpu_load_5min": None if hour == 1 else 1.5,
+            "cpu_load_15min": 2.0,
+            "ram_percentage": 40.25 + hour,
+            "disk_percentage": 55.0,
+            "logged_users": hour % 3,
+            "tcp_connections": 100 + hour,
+            "server": server,
+        }
+        for hour in range(hours)
+    ]
+
+
+class TestHistoricalFrame:
+    """Tests for _historical_frame function"""
+
+    @staticmethod
+    def _reference(batches):
+        return pd.DataFrame([row for rows in batches for row in rows])
+
+    def test_arrow_path_matches_dataframe_constructor(self):
+        batches = [_history_rows("a", 3), [], _history_rows("b", 5)]
+        pd.testing.assert_frame_equal(
+            export_utils._historical_frame(batches), self._reference(batches)
+        )
+
+    def test_keys_missing_from_first_row_are_kept(self):
+        batches = [[{"a": 1}, {"a": 2, "b": 3.5}]]
+        pd.testing.assert_frame_equal(
+            export_utils._historical_frame(batches), self._reference(batches)
+        )
+
+    def test_incompatible_batches_fall_back_to_dataframe(self):
+        batches = [[{"value": 1}], [{"value": "n/a"}]]
+        pd.testing.assert_frame_equal(
+            export_utils._historical_frame(batches), self._reference(batches)
+        )
+
+    def test_no_rows_returns_none(self):
+        assert export_utils._historical_frame([[], []]) is None
+
+
+@pytest.fixture
+def fake_history(monkeypatch):
+    """Patch get_historical_metrics to serve _history_rows; records calls"""
+    calls = []
+
+    def get_historical_metrics(server_name, hours):
+        calls.append((server_name, hours))
+        return _history_rows(server_name, 2) if server_name != "empty" else None
+
+    monkeypatch.setattr(export_utils, "get_historical_metrics", get_historical_metrics)
+    return calls
+
+
+class TestHistoricalBatches:
+    """Tests for _historical_batches function"""
+
+    def test_yields_in_server_order(self, fake_history):
+        batches = list(export_utils._historical_batches(["b", "empty", "a"], 6))
+
+        assert [rows[0]["server"] if rows else None for rows in batches] == [
+            "b", None, "a"
+        ]
+        assert sorted(fake_history) == [("a", 6), ("b", 6), ("empty", 6)]
+
+    def test_skips_blank_names_and_empty_list(self, fake_history):
+        assert list(export_utils._historical_batches(None)) == []
+        assert len(list(export_utils._historical_batches(["", "a", None]))) == 1
+
+    def test_in_flight_fetches_stay_within_window(self, monkeypatch):
+        lock = threading.Lock()
+        started = in_flight = peak = 0
+
+        def get_historical_metrics(server_name, hours):
+            nonlocal started, in_flight, peak
+            with lock:
+                started += 1
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.001)
+            with lock:
+                in_flight -= 1
+            return [{"server": server_name}]
+
+        monkeypatch.setattr(
+            export_utils, "get_historical_metrics", get_historical_metrics
+        )
+        monkeypatch.setattr(export_utils, "_HISTORY_FETCH_WINDOW", 4)
+        names = [f"s{i}" for i in range(40)]
+
+        batches = export_utils._historical_batches(names)
+        first = next(batches)
+        # Taking one result refills one slot; nothing else is requested until
+        # more results are consumed
+        time.sleep(0.05)
+        assert started == 5
+        rest = list(batches)
+
+        assert [rows[0]["server"] for rows in [first, *rest]] == names
+        assert peak <= 4
+
+
+class TestValidateExportColumns:
+    """Tests for _validate_export_columns function"""
+
+    def test_invalid_values_become_nan(self):
+        df = pd.DataFrame({
+            "ram_percentage": [50.0, 120.0, "bad"],
+            "disk_percentage": [10.0, 20.0, -5.0],
+            "logged_users": [1, 2, 3],
+        })
+
+        export_utils._validate_export_columns(df, "historical_metrics")
+
+        assert df["ram_percentage"].tolist()[0] == 50.0
+        assert df["ram_percentage"].isna().tolist() == [False, True, True]
+        assert df["disk_percentage"].isna().tolist() == [False, False, True]
+        assert df["logged_users"].tolist() == [1, 2, 3]
+
+    def test_unknown_table_and_missing_columns_are_ignored(self):
+        df = pd.DataFrame({"cpu": [500.0]})
+        expected = df.copy()
+        export_utils._validate_export_columns(df, "server_metrics")
+        export_utils._validate_export_columns(df, "historical_metrics")
+        pd.testing.assert_frame_equal(df, expected)
+
+
+class TestDowncastIntegers:
+    """Tests for _downcast_integers function"""
+
+    def test_shrinks_integers_and_keeps_floats(self):
+        df = pd.DataFrame({
+            "small": [1, 2, 3],
+            "large": [0, 70_000, 3],
+            "ratio": [12.3, 0.1, 5.0],
+        })
+
+        export_utils._downcast_integers(df)
+
+        assert df["small"].dtype == "int8"
+        assert df["large"].dtype == "int32"
+        assert df["ratio"].dtype == "float64"
+        assert df["ratio"].tolist() == [12.3, 0.1, 5.0]
+
+
+class TestExportToCsv:
+    """Tests for export_to_csv function"""
+
+    def test_writes_gzipped_csv_per_table(self, export_data):
+        file_paths = export_utils.export_to_csv(export_data)
+
+        timestamp = export_data["timestamp"]
+        keys = ("server_metrics", "top_users", "system_overview")
+        assert file_paths == [f"/tmp/{key}_{timestamp}.csv.gz" for key in keys]
+        for key, path in zip(keys, file_paths):
+            with gzip.open(path, "rt") as f:
+                assert f.readline().strip() == ",".join(export_data[key].columns)
+            pd.testing.assert_frame_equal(pd.read_csv(path), export_data[key])
+
+
+class TestStreamHistoricalToCsv:
+    """Tests for stream_historical_to_csv function"""
+
+    def test_writes_schema_columns(self, monkeypatch, fake_history, export_timestamp):
+        monkeypatch.setattr(export_utils, "_fetch_server_list", lambda: ["a", "b"])
+
+        filepath = export_utils.stream_historical_to_csv(export_timestamp, hours=6)
+
+        assert filepath == f"/tmp/historical_metrics_{export_timestamp}.csv.gz"
+        assert not os.path.exists(f"{filepath}.part")
+        df = pd.read_csv(filepath)
+        # Keys outside HISTORICAL_COLUMNS ("server") are not written
+        assert list(df.columns) == export_utils.HISTORICAL_COLUMNS
+        expected = pd.DataFrame(_history_rows("a", 2) + _history_rows("b", 2))
+        pd.testing.assert_frame_equal(
+            df, expected[export_utils.HISTORICAL_COLUMNS], check_dtype=False
+        )
+
+    def test_nothing_to_write_leaves_no_file(
+        self, monkeypatch, fake_history, export_timestamp
+    ):
+        monkeypatch.setattr(export_utils, "_fetch_server_list", lambda: ["empty"])
+
+        assert export_utils.stream_historical_to_csv(export_timestamp) is None
+        assert not [name for name in os.listdir("/tmp") if export_timestamp in name]
+
+    def test_failed_fetch_leaves_no_partial_file(
+        self, monkeypatch, export_timestamp
+    ):
+        def get_historical_metrics(server_name, hours):
+            if server_name == "broken":
+                raise ConnectionError("backend went away")
+            return _history_rows(server_name, 2)
+
+        monkeypatch.setattr(
+            export_utils, "get_historical_metrics", get_historical_metrics
+        )
+        monkeypatch.setattr(
+            export_utils, "_fetch_server_list", lambda: ["a", "broken"]
+        )
+
+        assert export_utils.stream_historical_to_csv(export_timestamp) is None
+        assert not [name for name in os.listdir("/tmp") if export_timestamp in name]
+
+
+class TestExportReport:
+    """Tests for export_report function"""
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self, monkeypatch, fake_history):
+        monkeypatch.setattr(
+            export_utils,
+            "_fetch_server_metrics",
+            lambda: [{"server_name": "a", "ram_percentage": 50.0}],
+        )
+        monkeypatch.setattr(
+            export_utils,
+            "_fetch_top_users",
+            lambda: [{"username": "u1", "cpu": 10.0, "mem": 5.0, "disk": 1.0}],
+        )
+        monkeypatch.setattr(
+            export_utils, "_fetch_system_overview", lambda: {"total_servers": 2}
+        )
+        monkeypatch.setattr(export_utils, "_fetch_server_list", lambda: ["a", "b"])
+
+    @pytest.fixture
+    def export_timestamp(self, monkeypatch):
+        """Pin the report's file-name timestamp; removes the files written"""
+        monkeypatch.setattr(export_utils, "datetime", _FrozenDatetime)
+        timestamp = _FrozenDatetime.now().strftime("%Y%m%d_%H%M%S")
+        yield timestamp
+        for name in os.listdir("/tmp"):
+            if timestamp in name:
+                os.remove(os.path.join("/tmp", name))
+
+    def test_unknown_format_returns_none(self, export_timestamp):
+        assert export_utils.export_report("xml") is None
+
+    def test_dispatches_to_the_format_writer(self, monkeypatch, export_timestamp):
+        received = []
+        monkeypatch.setitem(
+            export_utils.EXPORTERS, "json", lambda data: received.append(data) or "x"
+        )
+
+        assert export_utils.export_report("json") == "x"
+        (export_data,) = received
+        assert export_data["historical_metrics"].shape[0] == 4
+        assert export_data["system_overview"]["value"].tolist()[0] == 2
+
+    def test_json_files_match_tables(self, export_timestamp):
+        file_paths = export_utils.export_report("json")
+
+        keys = ("server_metrics", "top_users", "system_overview", "historical_metrics")
+        assert file_paths == [f"/tmp/{key}_{export_timestamp}.json" for key in keys]
+        with open(file_paths[0]) as f:
+            assert json.load(f) == [{"server_name": "a", "ram_percentage": 50.0}]
+        with open(file_paths[3]) as f:
+            assert len(json.load(f)) == 4
+
+    def test_csv_streams_historical_metrics(self, export_timestamp):
+        file_paths = export_utils.export_report("csv")
+
+        historical = f"/tmp/historical_metrics_{export_timestamp}.csv.gz"
+        assert file_paths[-1] == historical
+        columns = export_utils.HISTORICAL_COLUMNS
+        assert pd.read_csv(historical).shape == (4, len(columns))
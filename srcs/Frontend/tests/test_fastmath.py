@@ -0,0 +1,52 @@
+# Unit tests for _fastmath module
+import pytest
+import numpy as np
+
+from _fastmath import _anomaly_mask_loop, _anomaly_mask_numpy, anomaly_mask
+
+
+def _samples(seed, size=500, nan_every=None):
+    values = np.random.default_rng(seed).normal(50.0, 10.0, size)
+    values[::37] += 60.0  # spikes well past any threshold below
+    if nan_every:
+        values[::nan_every] = np.nan
+    return values
+
+
+class TestAnomalyMask:
+    """Tests for anomaly_mask and its numba/numpy implementations"""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            _samples(0),
+            _samples(1, nan_every=5),
+            _samples(2, size=3),
+            np.array([np.nan, 1.0, np.nan, 100.0, 2.0]),
+            np.full(20, 42.0),  # zero variance
+            np.array([42.0, np.nan, 42.0, np.nan]),  # zero variance with gaps
+            np.array([7.0, np.nan]),  # one valid value
+            np.full(5, np.nan),
+            np.array([], dtype=np.float64),
+        ],
+    )
+    @pytest.mark.parametrize("threshold_std", [1.0, 2.0, 3.0])
+    def test_loop_matches_numpy(self, values, threshold_std):
+        # The loop is the function numba compiles; run it as plain Python
+        np.testing.assert_array_equal(
+            _anomaly_mask_loop(values, threshold_std),
+            _anomaly_mask_numpy(values, threshold_std),
+        )
+
+    def test_flags_spikes(self):
+        values = np.array([10.0] * 20 + [100.0])
+        assert anomaly_mask(values, 3).tolist() == [False] * 20 + [True]
+
+    def test_nan_is_never_flagged(self):
+        values = np.array([10.0, 11.0, np.nan, 9.0, 10.0, 10.5, 500.0])
+        mask = anomaly_mask(values, 1)
+        assert not mask[2]
+        assert mask[6]
+
+    def test_zero_variance_flags_nothing(self):
+        assert not anomaly_mask(np.full(10, 5.0), 0.5).any()
@@ -1,15 +1,13 @@
 # Unit tests for utils module
 import pytest
 from datetime import datetime, timedelta
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import MappingProxyType
 
+import utils
 from utils import (
     safe_float,
     determine_server_status,
+    determine_server_statuses,
     get_performance_rating,
     generate_alerts,
     format_uptime,
@@ -23,30 +21,42 @@ from utils import (
 from config import PERFORMANCE_THRESHOLDS
 
 
-class TestSafeFloat:
-    """Tests for safe_float function"""
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned, so time-relative tests are deterministic"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 1, 12, 0, 0, tzinfo=tz)
 
-    def test_int_to_float(self):
-        assert safe_float(42) == 42.0
 
-    def test_float_to_float(self):
-        assert safe_float(3.14) == 3.14
+@pytest.fixture(scope="module")
+def now():
+    """Pin utils' clock for the module and return the pinned time"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(utils, "datetime", _FrozenDatetime)
+        yield _FrozenDatetime.now()
 
-    def test_string_to_float(self):
-        assert safe_float("3.14") == 3.14
 
-    def test_invalid_string_returns_default(self):
-        assert safe_float("invalid") == 0.0
+class TestSafeFloat:
+    """Tests for safe_float function"""
 
-    def test_none_returns_default(self):
-        assert safe_float(None) == 0.0
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (42, 42.0),
+            (3.14, 3.14),
+            ("3.14", 3.14),
+            ("invalid", 0.0),
+            (None, 0.0),
+            ([1, 2, 3], 0.0),
+        ],
+    )
+    def test_conversion(self, value, expected):
+        assert safe_float(value) == expected
 
     def test_custom_default(self):
         assert safe_float("invalid", default=99.0) == 99.0
 
-    def test_list_returns_default(self):
-        assert safe_float([1, 2, 3]) == 0.0
-
 
 class TestDetermineServerStatus:
     """Tests for determine_server_status function"""
@@ -57,35 +67,35 @@ class TestDetermineServerStatus:
     def test_empty_dict_returns_offline(self):
         assert determine_server_status({}) == "offline"
 
-    def test_high_ram_returns_warning(self):
+    def test_high_ram_returns_warning(self, now):
         metrics = {
             "ram_percentage": 90,
             "disk_percentage": 50,
             "cpu_load_5min": 2.0,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         assert determine_server_status(metrics) == "warning"
 
-    def test_high_disk_returns_warning(self):
+    def test_high_disk_returns_warning(self, now):
         metrics = {
             "ram_percentage": 50,
             "disk_percentage": 90,
             "cpu_load_5min": 2.0,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         assert determine_server_status(metrics) == "warning"
 
-    def test_high_cpu_returns_warning(self):
+    def test_high_cpu_returns_warning(self, now):
         metrics = {
             "ram_percentage": 50,
             "disk_percentage": 50,
             "cpu_load_5min": 6.0,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         assert determine_server_status(metrics) == "warning"
 
-    def test_old_timestamp_returns_offline(self):
-        old_time = datetime.now() - timedelta(hours=1)
+    def test_old_timestamp_returns_offline(self, now):
+        old_time = now - timedelta(hours=1)
         metrics = {
             "ram_percentage": 50,
             "disk_percentage": 50,
@@ -94,12 +104,12 @@ class TestDetermineServerStatus:
         }
         assert determine_server_status(metrics) == "offline"
 
-    def test_recent_timestamp_normal_metrics_returns_online(self):
+    def test_recent_timestamp_normal_metrics_returns_online(self, now):
         metrics = {
             "ram_percentage": 50,
             "disk_percentage": 50,
             "cpu_load_5min": 2.0,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         assert determine_server_status(metrics) == "online"
 
@@ -114,25 +124,56 @@ class TestDetermineServerStatus:
         status = determine_server_status(metrics)
         assert status in ["online", "warning"]  # Depends on metrics
 
+    def test_explicit_now(self):
+        metrics = {
+            "ram_percentage": 50,
+            "disk_percentage": 50,
+            "cpu_load_5min": 2.0,
+            "timestamp": "2024-01-01T08:00:00",
+        }
+        recent = datetime(2024, 1, 1, 8, 5)
+        assert determine_server_status(metrics, now=recent) == "online"
+        later = recent + timedelta(hours=1)
+        assert determine_server_status(metrics, now=later) == "offline"
+
+
+class TestDetermineServerStatuses:
+    """Tests for determine_server_statuses function"""
+
+    def test_empty_list(self):
+        assert determine_server_statuses([]) == []
+
+    def test_matches_single_server_status(self, now):
+        normal = {"ram_percentage": 50, "disk_percentage": 50, "cpu_load_5min": 2.0}
+        metrics_list = [
+            None,
+            {},
+            {**normal, "timestamp": now.isoformat()},
+            {**normal, "ram_percentage": 90, "timestamp": now.isoformat()},
+            {**normal, "timestamp": (now - timedelta(hours=1)).isoformat()},
+            {**normal, "timestamp": "invalid"},
+            {**normal, "disk_percentage": "n/a"},
+        ]
+        expected = [determine_server_status(m) for m in metrics_list]
+        assert determine_server_statuses(metrics_list) == expected
+        assert expected[:5] == ["offline", "offline", "online", "warning", "offline"]
+
 
 class TestGetPerformanceRating:
     """Tests for get_performance_rating function"""
 
-    def test_excellent_performance(self):
-        rating, color = get_performance_rating(1.0, 10.0, 20.0)
-        assert rating == "excellent"
-
-    def test_good_performance(self):
-        rating, color = get_performance_rating(2.0, 20.0, 30.0)
-        assert rating == "good"
-
-    def test_fair_performance(self):
-        rating, color = get_performance_rating(5.0, 50.0, 50.0)
-        assert rating == "fair"
-
-    def test_poor_performance(self):
-        rating, color = get_performance_rating(10.0, 90.0, 90.0)
-        assert rating == "poor"
+    @pytest.mark.parametrize(
+        "cpu,ram,disk,expected",
+        [
+            (1.0, 10.0, 20.0, "excellent"),
+            (2.0, 20.0, 30.0, "good"),
+            (5.0, 50.0, 50.0, "fair"),
+            (10.0, 90.0, 90.0, "poor"),
+        ],
+    )
+    def test_rating(self, cpu, ram, disk, expected):
+        rating, color = get_performance_rating(cpu, ram, disk)
+        assert rating == expected
 
     def test_returns_color(self):
         rating, color = get_performance_rating(1.0, 10.0, 20.0)
@@ -140,56 +181,48 @@ class TestGetPerformanceRating:
         assert color.startswith("#") or color.startswith("rgb")
 
 
+@pytest.fixture(scope="module")
+def thresholds():
+    """Performance thresholds, looked up once per module"""
+    return PERFORMANCE_THRESHOLDS
+
+
+@pytest.fixture(scope="module")
+def base_metric():
+    """Healthy server metrics; tests override only the field they exercise"""
+    return MappingProxyType(
+        {
+            "server_name": "Server1",
+            "cpu_load_5min": 2.0,
+            "ram_percentage": 50,
+            "disk_percentage": 50,
+        }
+    )
+
+
 class TestGenerateAlerts:
     """Tests for generate_alerts function"""
 
-    def test_no_alerts_for_normal_metrics(self):
-        metrics = [
-            {
-                "server_name": "Server1",
-                "cpu_load_5min": 2.0,
-                "ram_percentage": 50,
-                "disk_percentage": 50,
-            }
-        ]
-        alerts = generate_alerts(metrics)
+    def test_no_alerts_for_normal_metrics(self, base_metric):
+        alerts = generate_alerts([dict(base_metric)])
         assert len(alerts) == 0
 
-    def test_cpu_warning_alert(self):
-        metrics = [
-            {
-                "server_name": "Server1",
-                "cpu_load_5min": PERFORMANCE_THRESHOLDS["cpu_warning"] + 0.1,
-                "ram_percentage": 50,
-                "disk_percentage": 50,
-            }
-        ]
+    def test_cpu_warning_alert(self, base_metric, thresholds):
+        metrics = [{**base_metric, "cpu_load_5min": thresholds["cpu_warning"] + 0.1}]
         alerts = generate_alerts(metrics)
         assert len(alerts) > 0
         assert any("CPU" in alert["title"] for alert in alerts)
 
-    def test_cpu_critical_alert(self):
-        metrics = [
-            {
-                "server_name": "Server1",
-                "cpu_load_5min": PERFORMANCE_THRESHOLDS["cpu_critical"] + 0.1,
-                "ram_percentage": 50,
-                "disk_percentage": 50,
-            }
-        ]
+    def test_cpu_critical_alert(self, base_metric, thresholds):
+        metrics = [{**base_metric, "cpu_load_5min": thresholds["cpu_critical"] + 0.1}]
         alerts = generate_alerts(metrics)
         assert len(alerts) > 0
         critical_alerts = [a for a in alerts if a["type"] == "critical"]
         assert len(critical_alerts) > 0
 
-    def test_memory_alert(self):
+    def test_memory_alert(self, base_metric, thresholds):
         metrics = [
-            {
-                "server_name": "Server1",
-                "cpu_load_5min": 2.0,
-                "ram_percentage": PERFORMANCE_THRESHOLDS["memory_warning"] + 1,
-                "disk_percentage": 50,
-            }
+            {**base_metric, "ram_percentage": thresholds["memory_warning"] + 1}
         ]
         alerts = generate_alerts(metrics)
         assert len(alerts) > 0
@@ -197,37 +230,42 @@ class TestGenerateAlerts:
             "Memory" in alert["title"] or "RAM" in alert["title"] for alert in alerts
         )
 
-    def test_disk_alert(self):
-        metrics = [
-            {
-                "server_name": "Server1",
-                "cpu_load_5min": 2.0,
-                "ram_percentage": 50,
-                "disk_percentage": PERFORMANCE_THRESHOLDS["disk_warning"] + 1,
-            }
-        ]
+    def test_disk_alert(self, base_metric, thresholds):
+        metrics = [{**base_metric, "disk_percentage": thresholds["disk_warning"] + 1}]
         alerts = generate_alerts(metrics)
         assert len(alerts) > 0
         assert any("Disk" in alert["title"] for alert in alerts)
 
-    def test_multiple_servers_multiple_alerts(self):
+    def test_multiple_servers_multiple_alerts(self, base_metric, thresholds):
         metrics = [
+            {**base_metric, "cpu_load_5min": thresholds["cpu_critical"] + 1},
             {
-                "server_name": "Server1",
-                "cpu_load_5min": PERFORMANCE_THRESHOLDS["cpu_critical"] + 1,
-                "ram_percentage": 50,
-                "disk_percentage": 50,
-            },
-            {
+                **base_metric,
                 "server_name": "Server2",
-                "cpu_load_5min": 2.0,
-                "ram_percentage": PERFORMANCE_THRESHOLDS["memory_critical"] + 1,
-                "disk_percentage": 50,
+                "ram_percentage": thresholds["memory_critical"] + 1,
             },
         ]
         alerts = generate_alerts(metrics)
         assert len(alerts) >= 2
 
+        # Collect once, then check each expectation against the same lists
+        titles = [alert["title"] for alert in alerts]
+        types = [alert["type"] for alert in alerts]
+        assert any("CPU" in title and "Server1" in title for title in titles)
+        assert any("Memory" in title and "Server2" in title for title in titles)
+        assert types.count("critical") >= 2
+
+    def test_limit_stops_early(self, base_metric, thresholds):
+        over = {
+            "cpu_load_5min": thresholds["cpu_critical"] + 1,
+            "ram_percentage": thresholds["memory_critical"] + 1,
+        }
+        metrics = [
+            {**base_metric, **over, "server_name": f"Server{i}"} for i in range(3)
+        ]
+        alerts = generate_alerts(metrics, limit=3)
+        assert alerts == generate_alerts(metrics)[:3]
+
 
 class TestFormatUptime:
     """Tests for format_uptime function"""
@@ -238,45 +276,50 @@ class TestFormatUptime:
     def test_empty_string_returns_unknown(self):
         assert format_uptime("") == "Unknown"
 
-    def test_days_hours_minutes(self):
-        boot_time = datetime.now() - timedelta(days=2, hours=3, minutes=15)
+    def test_days_hours_minutes(self, now):
+        boot_time = now - timedelta(days=2, hours=3, minutes=15)
         result = format_uptime(boot_time)
         assert "2d" in result
         assert "h" in result
 
-    def test_hours_minutes(self):
-        boot_time = datetime.now() - timedelta(hours=5, minutes=30)
+    def test_hours_minutes(self, now):
+        boot_time = now - timedelta(hours=5, minutes=30)
         result = format_uptime(boot_time)
         assert "5h" in result
         assert "m" in result
         assert "d" not in result
 
-    def test_minutes_only(self):
-        boot_time = datetime.now() - timedelta(minutes=45)
+    def test_minutes_only(self, now):
+        boot_time = now - timedelta(minutes=45)
         result = format_uptime(boot_time)
         assert "m" in result
         assert "h" not in result
         assert "d" not in result
 
+    def test_explicit_now(self, now):
+        boot_time = now - timedelta(hours=1)
+        later = now + timedelta(hours=1, minutes=5)
+        assert format_uptime(boot_time, now=later) == "2h 5m"
+
 
 class TestIsHighUsageUser:
     """Tests for is_high_usage_user function"""
 
-    def test_high_cpu_usage(self):
-        user_data = {"cpu": PERFORMANCE_THRESHOLDS["high_cpu_usage"] + 1, "mem": 20}
+    def test_high_cpu_usage(self, thresholds):
+        user_data = {"cpu": thresholds["high_cpu_usage"] + 1, "mem": 20}
         assert is_high_usage_user(user_data) is True
 
-    def test_high_memory_usage(self):
-        user_data = {"cpu": 20, "mem": PERFORMANCE_THRESHOLDS["high_memory_usage"] + 1}
+    def test_high_memory_usage(self, thresholds):
+        user_data = {"cpu": 20, "mem": thresholds["high_memory_usage"] + 1}
         assert is_high_usage_user(user_data) is True
 
     def test_normal_usage(self):
         user_data = {"cpu": 20, "mem": 30}
         assert is_high_usage_user(user_data) is False
 
-    def test_string_values(self):
+    def test_string_values(self, thresholds):
         user_data = {
-            "cpu": str(PERFORMANCE_THRESHOLDS["high_cpu_usage"] + 1),
+            "cpu": str(thresholds["high_cpu_usage"] + 1),
             "mem": "20",
         }
         assert is_high_usage_user(user_data) is True
@@ -314,25 +357,19 @@ class TestGetTrendIndicator:
 class TestFormatBytes:
     """Tests for format_bytes function"""
 
-    def test_bytes(self):
-        result = format_bytes(500)
-        assert "500" in result
-        assert "B" in result
-
-    def test_kilobytes(self):
-        result = format_bytes(1024)
-        assert "1.0" in result
-        assert "KB" in result
-
-    def test_megabytes(self):
-        result = format_bytes(1024 * 1024)
-        assert "1.0" in result
-        assert "MB" in result
-
-    def test_gigabytes(self):
-        result = format_bytes(1024 * 1024 * 1024)
-        assert "1.0" in result
-        assert "GB" in result
+    @pytest.mark.parametrize(
+        "value,number,unit",
+        [
+            (500, "500", "B"),
+            (1024, "1.0", "KB"),
+            (1024 * 1024, "1.0", "MB"),
+            (1024 * 1024 * 1024, "1.0", "GB"),
+        ],
+    )
+    def test_units(self, value, number, unit):
+        result = format_bytes(value)
+        assert number in result
+        assert unit in result
 
     def test_invalid_input(self):
         result = format_bytes("invalid")
@@ -342,58 +379,52 @@ class TestFormatBytes:
 class TestSanitizeServerName:
     """Tests for sanitize_server_name function"""
 
-    def test_simple_name(self):
-        assert sanitize_server_name("Server1") == "server1"
-
-    def test_with_spaces(self):
-        assert sanitize_server_name("Server 1") == "server-1"
-
-    def test_with_underscores(self):
-        assert sanitize_server_name("Server_1") == "server-1"
-
-    def test_mixed_case(self):
-        assert sanitize_server_name("MyServer") == "myserver"
-
-    def test_empty_string(self):
-        assert sanitize_server_name("") == "unknown"
-
-    def test_none(self):
-        assert sanitize_server_name(None) == "unknown"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("Server1", "server1"),
+            ("Server 1", "server-1"),
+            ("Server_1", "server-1"),
+            ("MyServer", "myserver"),
+            ("", "unknown"),
+            (None, "unknown"),
+        ],
+    )
+    def test_sanitize(self, name, expected):
+        assert sanitize_server_name(name) == expected
 
 
 class TestGetStatusBadgeClass:
     """Tests for get_status_badge_class function"""
 
-    def test_online_status(self):
-        assert get_status_badge_class("online") == "status-online"
-
-    def test_warning_status(self):
-        assert get_status_badge_class("warning") == "status-warning"
-
-    def test_offline_status(self):
-        assert get_status_badge_class("offline") == "status-offline"
-
-    def test_unknown_status_returns_offline(self):
-        assert get_status_badge_class("unknown") == "status-offline"
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            ("online", "status-online"),
+            ("warning", "status-warning"),
+            ("offline", "status-offline"),
+            ("unknown", "status-offline"),
+        ],
+    )
+    def test_status_class(self, status, expected):
+        assert get_status_badge_class(status) == expected
 
 
 class TestGetPerformanceBadgeClass:
     """Tests for get_performance_badge_class function"""
 
-    def test_excellent(self):
-        assert get_performance_badge_class("excellent") == "perf-excellent"
-
-    def test_good(self):
-        assert get_performance_badge_class("good") == "perf-good"
-
-    def test_fair(self):
-        assert get_performance_badge_class("fair") == "perf-fair"
-
-    def test_poor(self):
-        assert get_performance_badge_class("poor") == "perf-poor"
-
-    def test_unknown_returns_poor(self):
-        assert get_performance_badge_class("unknown") == "perf-poor"
+    @pytest.mark.parametrize(
+        "performance,expected",
+        [
+            ("excellent", "perf-excellent"),
+            ("good", "perf-good"),
+            ("fair", "perf-fair"),
+            ("poor", "perf-poor"),
+            ("unknown", "perf-poor"),
+        ],
+    )
+    def test_performance_class(self, performance, expected):
+        assert get_performance_badge_class(performance) == expected
 
 
 if __name__ == "__main__":
@@ -1,11 +1,7 @@
 # Unit tests for validation module
 import pytest
 from datetime import datetime
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pandas as pd
 
 from validation import (
     validate_percentage,
@@ -15,6 +11,7 @@ from validation import (
     validate_timestamp,
     validate_server_metrics,
     validate_user_data,
+    validate_column,
     safe_get,
 )
 from exceptions import ValidationError
@@ -79,6 +76,39 @@ class TestValidatePositiveNumber:
             validate_positive_number("invalid", "test")
 
 
+class TestValidateColumn:
+    """Tests for validate_column function"""
+
+    def test_percentage_flags_out_of_range_and_non_numeric(self):
+        series = pd.Series([50, "75.5", 150, -1, "abc", None])
+        clean, invalid = validate_column(series, "percentage")
+        assert list(invalid) == [2, 3, 4, 5]
+        assert clean.iloc[0] == 50.0
+        assert clean.iloc[1] == 75.5
+        assert clean.iloc[2:].isna().all()
+
+    def test_positive_number_has_no_upper_bound(self):
+        clean, invalid = validate_column(pd.Series([0, 350.0, -5]), "positive_number")
+        assert list(invalid) == [2]
+        assert clean.iloc[1] == 350.0
+
+    def test_integer_with_bounds(self):
+        series = pd.Series([1, 2.5, 10, 300])
+        _, invalid = validate_column(series, "integer", min_val=0, max_val=256)
+        assert list(invalid) == [1, 3]
+
+    def test_preserves_index(self):
+        series = pd.Series([10, 200], index=["a", "b"], name="mem")
+        clean, invalid = validate_column(series)
+        assert list(clean.index) == ["a", "b"]
+        assert clean.name == "mem"
+        assert list(invalid) == ["b"]
+
+    def test_unknown_validator_raises(self):
+        with pytest.raises(ValidationError):
+            validate_column(pd.Series([1]), "unknown")
+
+
 class TestValidateServerName:
     """Tests for validate_server_name function"""
 
@@ -177,6 +207,15 @@ class TestValidateTimestamp:
         with pytest.raises(ValidationError):
             validate_timestamp("invalid")
 
+    def test_repeated_string_reuses_parse(self):
+        ts = "2025-10-01T12:30:45"
+        assert validate_timestamp(ts) is validate_timestamp(ts)
+
+    def test_invalid_format_raises_every_time(self):
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validate_timestamp("still-invalid")
+
     def test_non_string_non_datetime_raises_error(self):
         with pytest.raises(ValidationError):
             validate_timestamp(12345)
@@ -1,13 +1,79 @@
 # Toast notification utilities for user feedback
 from dash import html
+from functools import lru_cache
 import logging
-from typing import Optional, Literal
+from types import MappingProxyType
+from typing import Dict, Optional, Literal, Tuple
+from exceptions import (
+    APIConnectionError,
+    APITimeoutError,
+    APIResponseError,
+    APIDataError,
+    ValidationError,
+)
 
 logger = logging.getLogger(__name__)
 
 ToastType = Literal["success", "error", "warning", "info"]
 
 
+# Icon and color per toast type (unknown types fall back to "info")
+_TOAST_ICONS = MappingProxyType(
+    {
+        "success": "fas fa-check-circle",
+        "error": "fas fa-exclamation-circle",
+        "warning": "fas fa-exclamation-triangle",
+        "info": "fas fa-info-circle",
+    }
+)
+
+_TOAST_COLORS = MappingProxyType(
+    {
+        "success": "#27AE60",
+        "error": "#E31E24",
+        "warning": "#F57F29",
+        "info": "#00A9CE",
+    }
+)
+
+# Style shared by every toast; only border and text color vary by type
+_TOAST_BASE_STYLE = MappingProxyType(
+    {
+        "display": "flex",
+        "alignItems": "center",
+        "padding": "16px 20px",
+        "marginBottom": "12px",
+        "borderRadius": "8px",
+        "backgroundColor": "white",
+        "boxShadow": "0 4px 12px rgba(0,0,0,0.15)",
+        "animation": "slideInRight 0.3s ease-out",
+        "fontWeight": "500",
+        "fontSize": "14px",
+        "maxWidth": "400px",
+    }
+)
+
+# Child and container styles (plain dicts: Dash serializes them as-is)
+_ICON_STYLE = {"marginRight": "12px", "fontSize": "20px"}
+_MESSAGE_STYLE = {"flex": 1}
+_CONTAINER_STYLE = {
+    "position": "fixed",
+    "top": "80px",
+    "right": "20px",
+    "zIndex": "9999",
+    "maxWidth": "400px",
+}
+_HIDDEN_CONTAINER_STYLE = {"display": "none"}
+
+
+@lru_cache(maxsize=8)
+def _toast_style(toast_type: str) -> Tuple[str, Dict]:
+    """Icon class and container style for a toast type, built once per type"""
+    color = _TOAST_COLORS.get(toast_type, _TOAST_COLORS["info"])
+    style = {**_TOAST_BASE_STYLE, "border": f"2px solid {color}", "color": color}
+    return _TOAST_ICONS.get(toast_type, _TOAST_ICONS["info"]), style
+
+
 def create_toast(
     message: str,
     toast_type: ToastType = "info",
@@ -26,49 +92,18 @@ def create_toast(
     Returns:
         Dash HTML component for toast
     """
-    # Icon mapping
-    icons = {
-        "success": "fas fa-check-circle",
-        "error": "fas fa-exclamation-circle",
-        "warning": "fas fa-exclamation-triangle",
-        "info": "fas fa-info-circle",
-    }
-
-    # Color mapping
-    colors = {
-        "success": "#27AE60",
-        "error": "#E31E24",
-        "warning": "#F57F29",
-        "info": "#00A9CE",
-    }
-
+    # Styles are shared between toasts; Dash never mutates them
+    icon_class, style = _toast_style(toast_type)
     toast_id = toast_id or f"toast-{toast_type}"
 
     return html.Div(
         [
-            html.I(
-                className=icons.get(toast_type, icons["info"]),
-                style={"marginRight": "12px", "fontSize": "20px"},
-            ),
-            html.Span(message, style={"flex": 1}),
+            html.I(className=icon_class, style=_ICON_STYLE),
+            html.Span(message, style=_MESSAGE_STYLE),
         ],
         id=toast_id,
         className=f"toast toast-{toast_type}",
-        style={
-            "display": "flex",
-            "alignItems": "center",
-            "padding": "16px 20px",
-            "marginBottom": "12px",
-            "borderRadius": "8px",
-            "backgroundColor": "white",
-            "border": f"2px solid {colors.get(toast_type, colors['info'])}",
-            "boxShadow": "0 4px 12px rgba(0,0,0,0.15)",
-            "animation": "slideInRight 0.3s ease-out",
-            "color": colors.get(toast_type, colors["info"]),
-            "fontWeight": "500",
-            "fontSize": "14px",
-            "maxWidth": "400px",
-        },
+        style=style,
     )
 
 
@@ -83,19 +118,9 @@ def create_toast_container(toasts: list) -> html.Div:
         Container div with all toasts
     """
     if not toasts:
-        return html.Div(id="toast-container", style={"display": "none"})
+        return html.Div(id="toast-container", style=_HIDDEN_CONTAINER_STYLE)
 
-    return html.Div(
-        toasts,
-        id="toast-container",
-        style={
-            "position": "fixed",
-            "top": "80px",
-            "right": "20px",
-            "zIndex": "9999",
-            "maxWidth": "400px",
-        },
-    )
+    return html.Div(toasts, id="toast-container", style=_CONTAINER_STYLE)
 
 
 def create_success_toast(message: str) -> html.Div:
@@ -122,6 +147,31 @@ def create_info_toast(message: str) -> html.Div:
     return create_toast(message, "info")
 
 
+def _response_error_message(error: APIResponseError) -> str:
+    """User-facing message for an error response, by HTTP status"""
+    status_code = error.status_code
+    if status_code == 404:
+        return "Data not found. The requested resource doesn't exist."
+    if status_code is not None and status_code >= 500:
+        return "Server error. Please try again later."
+    return "The server returned an error. Please try again."
+
+
+# Exception class -> fixed message, or a function of the error
+_API_ERROR_MESSAGES = MappingProxyType(
+    {
+        APIConnectionError: (
+            "Unable to connect to the server. Please check your connection."
+        ),
+        APITimeoutError: "Request timed out. The server is taking too long to respond.",
+        APIResponseError: _response_error_message,
+        APIDataError: "Received invalid data from the server.",
+    }
+)
+
+_DEFAULT_API_ERROR_MESSAGE = "An unexpected error occurred. Please try again."
+
+
 def format_api_error_message(error: Exception) -> str:
     """
     Format an API error for user-friendly display
@@ -132,28 +182,18 @@ def format_api_error_message(error: Exception) -> str:
     Returns:
         User-friendly error message
     """
-    from exceptions import (
-        APIConnectionError,
-        APITimeoutError,
-        APIResponseError,
-        APIDataError,
-    )
-
-    if isinstance(error, APIConnectionError):
-        return "Unable to connect to the server. Please check your connection."
-    elif isinstance(error, APITimeoutError):
-        return "Request timed out. The server is taking too long to respond."
-    elif isinstance(error, APIResponseError):
-        if hasattr(error, "status_code"):
-            if error.status_code == 404:
-                return "Data not found. The requested resource doesn't exist."
-            elif error.status_code >= 500:
-                return "Server error. Please try again later."
-        return "The server returned an error. Please try again."
-    elif isinstance(error, APIDataError):
-        return "Received invalid data from the server."
-    else:
-        return "An unexpected error occurred. Please try again."
+    message = _API_ERROR_MESSAGES.get(type(error))
+    if message is None:
+        # Subclasses of the known errors: first match up the MRO
+        message = next(
+            (
+                _API_ERROR_MESSAGES[cls]
+                for cls in type(error).__mro__[1:]
+                if cls in _API_ERROR_MESSAGES
+            ),
+            _DEFAULT_API_ERROR_MESSAGE,
+        )
+    return message if isinstance(message, str) else message(error)
 
 
 def format_validation_error_message(error: Exception) -> str:
@@ -166,8 +206,6 @@ def format_validation_error_message(error: Exception) -> str:
     Returns:
         User-friendly error message
     """
-    from exceptions import ValidationError
-
     if isinstance(error, ValidationError):
         # Extract the core message without technical details
         message = str(error.message)
@@ -1,7 +1,10 @@
 # Utility functions for the Server Monitoring Dashboard
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Optional
 import logging
+import math
+import string
+import numpy as np
 from config import PERFORMANCE_THRESHOLDS, STATUS_CONFIG, KU_COLORS
 from validation import validate_timestamp
 
@@ -19,20 +22,37 @@ def safe_float(val: Any, default: float = 0.0) -> float:
     Returns:
         Float value or default
     """
+    # Exact-type checks: plain floats and ints skip the try block entirely
+    if type(val) is float:
+        return val
+    if type(val) is int:
+        return float(val)
     try:
         return float(val)
     except (ValueError, TypeError, AttributeError):
-        if val is not None:
+        if val is not None and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Failed to convert {val} to float, using default {default}")
         return default
 
 
-def determine_server_status(metrics: dict) -> str:
+# determine_server_status limits (RAM, disk, CPU warning) and offline cutoff,
+# bound once instead of looked up per server
+_STATUS_WARNING_LIMITS = (
+    PERFORMANCE_THRESHOLDS["memory_warning"],
+    PERFORMANCE_THRESHOLDS["disk_warning"],
+    PERFORMANCE_THRESHOLDS["cpu_warning"],
+)
+_OFFLINE_TIMEOUT = timedelta(minutes=STATUS_CONFIG["offline_timeout_minutes"])
+
+
+def determine_server_status(metrics: dict, now: Optional[datetime] = None) -> str:
     """
     Determine server status based on metrics
 
     Args:
         metrics: Server metrics dictionary
+        now: Current time; pass one snapshot when checking many servers
+            (defaults to datetime.now())
 
     Returns:
         Status string: 'online', 'warning', or 'offline'
@@ -47,27 +67,20 @@ def determine_server_status(metrics: dict) -> str:
         cpu_load = safe_float(metrics.get("cpu_load_5min", 0))
 
         # Check for warning conditions
+        ram_limit, disk_limit, cpu_limit = _STATUS_WARNING_LIMITS
         if (
-            ram_percentage > PERFORMANCE_THRESHOLDS["memory_warning"]
-            or disk_percentage > PERFORMANCE_THRESHOLDS["disk_warning"]
-            or cpu_load > PERFORMANCE_THRESHOLDS["cpu_warning"]
+            ram_percentage > ram_limit
+            or disk_percentage > disk_limit
+            or cpu_load > cpu_limit
         ):
             return "warning"
 
         # Check if server is offline based on timestamp
         timestamp_raw = metrics.get("timestamp")
         if timestamp_raw:
-            try:
-                timestamp = validate_timestamp(timestamp_raw)
-                offline_threshold = timedelta(
-                    minutes=STATUS_CONFIG["offline_timeout_minutes"]
-                )
-                if datetime.now() - timestamp.replace(tzinfo=None) > offline_threshold:
-                    return "offline"
-            except Exception as e:
-                logger.warning(f"Failed to parse timestamp for status check: {e}")
-                # If we can't parse timestamp, assume online if we got metrics
-                return "online"
+            return _timestamp_status(
+                timestamp_raw, datetime.now() if now is None else now
+            )
 
         return "online"
 
@@ -76,6 +89,69 @@ def determine_server_status(metrics: dict) -> str:
         return "offline"
 
 
+def _timestamp_status(timestamp_raw: Any, now: datetime) -> str:
+    """'offline' if a metrics timestamp is older than the offline timeout"""
+    try:
+        timestamp = validate_timestamp(timestamp_raw)
+        if now - timestamp.replace(tzinfo=None) > _OFFLINE_TIMEOUT:
+            return "offline"
+    except Exception as e:
+        logger.warning(f"Failed to parse timestamp for status check: {e}")
+        # If we can't parse timestamp, assume online if we got metrics
+    return "online"
+
+
+def determine_server_statuses(metrics_list: list) -> list:
+    """
+    Determine the status of every server in one pass
+
+    Same result as determine_server_status on each entry, but the warning
+    thresholds are compared across all servers at once and the clock is read
+    once; only servers below the thresholds have their timestamps checked.
+
+    Args:
+        metrics_list: Server metrics dictionaries
+
+    Returns:
+        Status strings ('online', 'warning' or 'offline'), in input order
+    """
+    statuses = ["offline"] * len(metrics_list)
+    valid = []
+    for i, metrics in enumerate(metrics_list):
+        if metrics and isinstance(metrics, dict):
+            valid.append(i)
+        else:
+            logger.warning("Invalid or empty metrics provided")
+    if not valid:
+        return statuses
+
+    rows = [metrics_list[i] for i in valid]
+    cpu, ram, disk = _extract_metric_arrays(rows)
+    ram_limit, disk_limit, cpu_limit = _STATUS_WARNING_LIMITS
+    warning = (ram > ram_limit) | (disk > disk_limit) | (cpu > cpu_limit)
+
+    now = datetime.now()
+    for i, metrics, is_warning in zip(valid, rows, warning.tolist()):
+        if is_warning:
+            statuses[i] = "warning"
+        else:
+            timestamp_raw = metrics.get("timestamp")
+            statuses[i] = (
+                _timestamp_status(timestamp_raw, now) if timestamp_raw else "online"
+            )
+    return statuses
+
+
+# (minimum overall score, rating, color), best first; the last entry catches
+# every remaining score
+_PERFORMANCE_RATINGS = (
+    (85, "excellent", KU_COLORS["performance_good"]),
+    (70, "good", KU_COLORS["performance_good"]),
+    (50, "fair", KU_COLORS["performance_fair"]),
+    (float("-inf"), "poor", KU_COLORS["performance_poor"]),
+)
+
+
 def get_performance_rating(cpu_load, ram_percentage, disk_percentage):
     """Calculate overall performance rating"""
     cpu_score = 100 - min(cpu_load * 10, 100)  # CPU load of 10 = 0 score
@@ -84,26 +160,62 @@ def get_performance_rating(cpu_load, ram_percentage, disk_percentage):
 
     overall_score = (cpu_score + ram_score + disk_score) / 3
 
-    if overall_score >= 85:
-        return "excellent", KU_COLORS["performance_good"]
-    elif overall_score >= 70:
-        return "good", KU_COLORS["performance_good"]
-    elif overall_score >= 50:
-        return "fair", KU_COLORS["performance_fair"]
-    else:
-        return "poor", KU_COLORS["performance_poor"]
+    for minimum, rating, color in _PERFORMANCE_RATINGS:
+        if overall_score >= minimum:
+            return rating, color
+    return _PERFORMANCE_RATINGS[-1][1:]
+
+
+def _extract_metric_arrays(metrics_list):
+    """CPU load, RAM and disk percentages as float arrays, one entry per server"""
+    count = len(metrics_list)
+    return tuple(
+        np.fromiter(
+            (safe_float(metric.get(field, 0)) for metric in metrics_list),
+            dtype=float,
+            count=count,
+        )
+        for field in ("cpu_load_5min", "ram_percentage", "disk_percentage")
+    )
 
 
-def generate_alerts(metrics_list):
-    """Generate system alerts based on metrics"""
-    alerts = []
+def generate_alerts(metrics_list, limit: Optional[int] = None):
+    """
+    Generate system alerts based on metrics
+
+    Thresholds are compared across all servers at once; alert dicts are only
+    built for servers over a threshold, in input order (CPU, memory, disk).
+
+    Args:
+        metrics_list: Server metrics dictionaries
+        limit: Stop once this many alerts exist (None for all of them)
 
-    for metric in metrics_list:
+    Returns:
+        List of alert dictionaries
+    """
+    if not metrics_list:
+        return []
+
+    cpu, ram, disk = _extract_metric_arrays(metrics_list)
+    cpu_critical = cpu > PERFORMANCE_THRESHOLDS["cpu_critical"]
+    cpu_warning = cpu > PERFORMANCE_THRESHOLDS["cpu_warning"]
+    ram_critical = ram > PERFORMANCE_THRESHOLDS["memory_critical"]
+    ram_warning = ram > PERFORMANCE_THRESHOLDS["memory_warning"]
+    disk_critical = disk > PERFORMANCE_THRESHOLDS["disk_critical"]
+    disk_warning = disk > PERFORMANCE_THRESHOLDS["disk_warning"]
+    flagged = np.flatnonzero(
+        cpu_critical | cpu_warning | ram_critical | ram_warning
+        | disk_critical | disk_warning
+    )
+
+    alerts = []
+    for i in flagged.tolist():
+        metric = metrics_list[i]
         server_name = metric.get("server_name", "Unknown")
 
         # CPU Alert
-        cpu_load = safe_float(metric.get("cpu_load_5min", 0))
-        if cpu_load > PERFORMANCE_THRESHOLDS["cpu_critical"]:
+        cpu_load = float(cpu[i])
+        if cpu_critical[i]:
             alerts.append(
                 {
                     "type": "critical",
@@ -113,7 +225,7 @@ def generate_alerts(metrics_list):
                     "time": "Now",
                 }
             )
-        elif cpu_load > PERFORMANCE_THRESHOLDS["cpu_warning"]:
+        elif cpu_warning[i]:
             alerts.append(
                 {
                     "type": "warning",
@@ -126,7 +238,7 @@ def generate_alerts(metrics_list):
 
         # Memory Alert
         ram_percentage = metric.get("ram_percentage", 0)
-        if ram_percentage > PERFORMANCE_THRESHOLDS["memory_critical"]:
+        if ram_critical[i]:
             alerts.append(
                 {
                     "type": "critical",
@@ -136,7 +248,7 @@ def generate_alerts(metrics_list):
                     "time": "Now",
                 }
             )
-        elif ram_percentage > PERFORMANCE_THRESHOLDS["memory_warning"]:
+        elif ram_warning[i]:
             alerts.append(
                 {
                     "type": "warning",
@@ -149,7 +261,7 @@ def generate_alerts(metrics_list):
 
         # Disk Alert
         disk_percentage = metric.get("disk_percentage", 0)
-        if disk_percentage > PERFORMANCE_THRESHOLDS["disk_critical"]:
+        if disk_critical[i]:
             alerts.append(
                 {
                     "type": "critical",
@@ -159,7 +271,7 @@ def generate_alerts(metrics_list):
                     "time": "Now",
                 }
             )
-        elif disk_percentage > PERFORMANCE_THRESHOLDS["disk_warning"]:
+        elif disk_warning[i]:
             alerts.append(
                 {
                     "type": "warning",
@@ -170,15 +282,20 @@ def generate_alerts(metrics_list):
                 }
             )
 
+        if limit is not None and len(alerts) >= limit:
+            return alerts[:limit]
+
     return alerts
 
 
-def format_uptime(boot_time: Any) -> str:
+def format_uptime(boot_time: Any, now: Optional[datetime] = None) -> str:
     """
     Format server uptime based on boot time
 
     Args:
         boot_time: Boot time as string or datetime
+        now: Current time; pass one snapshot when formatting many servers
+            (defaults to datetime.now())
 
     Returns:
         Formatted uptime string
@@ -195,10 +312,12 @@ def format_uptime(boot_time: Any) -> str:
             logger.warning(f"Invalid boot_time type: {type(boot_time)}")
             return "Unknown"
 
-        uptime = datetime.now() - boot_datetime.replace(tzinfo=None)
+        if now is None:
+            now = datetime.now()
+        uptime = now - boot_datetime.replace(tzinfo=None)
         days = uptime.days
-        hours = uptime.seconds // 3600
-        minutes = (uptime.seconds % 3600) // 60
+        hours, seconds = divmod(uptime.seconds, 3600)
+        minutes = seconds // 60
 
         if days > 0:
             return f"{days}d {hours}h {minutes}m"
@@ -228,14 +347,19 @@ def calculate_resource_utilization(metrics):
     return min(utilization, 100)
 
 
+# Badge class tables, bound once so each lookup is a single dict.get
+_STATUS_CLASSES = STATUS_CONFIG["status_classes"]
+_PERFORMANCE_CLASSES = STATUS_CONFIG["performance_classes"]
+
+
 def get_status_badge_class(status):
     """Get CSS class for status badge"""
-    return STATUS_CONFIG["status_classes"].get(status, "status-offline")
+    return _STATUS_CLASSES.get(status, "status-offline")
 
 
 def get_performance_badge_class(performance):
     """Get CSS class for performance badge"""
-    return STATUS_CONFIG["performance_classes"].get(performance, "perf-poor")
+    return _PERFORMANCE_CLASSES.get(performance, "perf-poor")
 
 
 def is_high_usage_user(user_data):
@@ -254,6 +378,10 @@ def get_trend_indicator(current_value, previous_value):
     if previous_value is None or current_value is None:
         return "stable", ""
 
+    # Idle metrics often repeat exactly; no change needs no arithmetic
+    if current_value == previous_value:
+        return "stable", "→"
+
     diff = current_value - previous_value
     percentage_change = (diff / previous_value * 100) if previous_value != 0 else 0
 
@@ -265,21 +393,36 @@ def get_trend_indicator(current_value, previous_value):
         return "down", f"↓ {abs(percentage_change):.1f}%"
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_bytes(bytes_value):
     """Format bytes to human readable format"""
     try:
         bytes_value = float(bytes_value)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
     except (ValueError, TypeError):
         return "0 B"
+    if bytes_value < 1024.0:
+        return f"{bytes_value:.1f} B"
+    if not math.isfinite(bytes_value):
+        return f"{bytes_value:.1f} PB"
+    # Each unit is 2**10 of the previous one, so the binary exponent picks it;
+    # dividing by a power of two is exact, matching repeated /1024
+    index = min((math.frexp(bytes_value)[1] - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{math.ldexp(bytes_value, -10 * index):.1f} {_BYTE_UNITS[index]}"
+
+
+# ASCII upper -> lower, and space/underscore -> hyphen, in one translate pass
+_SANITIZE_TABLE = str.maketrans(
+    string.ascii_uppercase + " _", string.ascii_lowercase + "--"
+)
 
 
 def sanitize_server_name(server_name):
     """Sanitize server name for use in HTML IDs"""
     if not server_name:
         return "unknown"
-    return server_name.lower().replace(" ", "-").replace("_", "-")
+    if server_name.isascii():
+        return server_name.translate(_SANITIZE_TABLE)
+    # str.lower() also folds non-ASCII letters
+    return server_name.lower().translate(_SANITIZE_TABLE)
@@ -1,11 +1,23 @@
 # Input validation utilities for the Server Monitoring Dashboard
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 from datetime import datetime
+from functools import lru_cache
 import logging
+import numpy as np
+import pandas as pd
 from exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# strptime formats tried by validate_timestamp after fromisoformat
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
 
 def validate_percentage(value: Any, field_name: str = "percentage") -> float:
     """
@@ -21,6 +33,9 @@ def validate_percentage(value: Any, field_name: str = "percentage") -> float:
     Raises:
         ValidationError: If validation fails
     """
+    # In-range plain floats are the common case and need no conversion
+    if type(value) is float and 0.0 <= value <= 100.0:
+        return value
     try:
         float_value = float(value)
         if not 0 <= float_value <= 100:
@@ -50,6 +65,8 @@ def validate_positive_number(value: Any, field_name: str = "number") -> float:
     Raises:
         ValidationError: If validation fails
     """
+    if type(value) is float and value >= 0.0:
+        return value
     try:
         float_value = float(value)
         if float_value < 0:
@@ -65,6 +82,63 @@ def validate_positive_number(value: Any, field_name: str = "number") -> float:
         )
 
 
+# Default bounds for validate_column, by validator name
+_COLUMN_BOUNDS = {
+    "percentage": (0, 100),
+    "positive_number": (0, None),
+    "integer": (None, None),
+}
+
+
+def validate_column(
+    series: pd.Series,
+    validator_name: str = "percentage",
+    min_val: Optional[float] = None,
+    max_val: Optional[float] = None,
+) -> Tuple[pd.Series, pd.Index]:
+    """
+    Validate a whole column at once instead of calling a scalar validator per row
+
+    Values are coerced to numbers; anything non-numeric, outside the bounds or
+    (for "integer") non-integral is reported as invalid and set to NaN.
+
+    Args:
+        series: Column to validate
+        validator_name: "percentage", "positive_number" or "integer"
+        min_val: Lower bound, overriding the validator's default
+        max_val: Upper bound, overriding the validator's default
+
+    Returns:
+        Tuple of (cleaned float series, index of invalid rows)
+
+    Raises:
+        ValidationError: If validator_name is unknown
+    """
+    if validator_name not in _COLUMN_BOUNDS:
+        raise ValidationError(
+            f"Unknown column validator: {validator_name}",
+            details={"validator": validator_name},
+        )
+
+    default_min, default_max = _COLUMN_BOUNDS[validator_name]
+    min_val = default_min if min_val is None else min_val
+    max_val = default_max if max_val is None else max_val
+
+    arr = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+    valid = ~np.isnan(arr)
+    if min_val is not None:
+        valid &= arr >= min_val
+    if max_val is not None:
+        valid &= arr <= max_val
+    if validator_name == "integer":
+        valid &= arr == np.floor(arr)
+
+    clean = pd.Series(
+        np.where(valid, arr, np.nan), index=series.index, name=series.name
+    )
+    return clean, series.index[~valid]
+
+
 def validate_server_name(server_name: Any) -> str:
     """
     Validate and sanitize server name
@@ -141,6 +215,21 @@ def validate_time_range(hours: Any) -> int:
         )
 
 
+# Marks an absent key, so one dict.get replaces an `in` test plus a lookup
+_MISSING = object()
+
+# (field, min, max) for the numeric fields validate_server_metrics checks
+_METRIC_RANGES = (
+    ("cpu_load_1min", 0, 100),
+    ("cpu_load_5min", 0, 100),
+    ("cpu_load_15min", 0, 100),
+    ("ram_percentage", 0, 100),
+    ("disk_percentage", 0, 100),
+    ("logged_users", 0, 10000),
+    ("tcp_connections", 0, 100000),
+)
+
+
 def validate_server_metrics(metrics: Dict) -> Dict:
     """
     Validate server metrics dictionary structure
@@ -170,31 +259,23 @@ def validate_server_metrics(metrics: Dict) -> Dict:
         )
 
     # Validate numeric fields if present
-    numeric_fields = {
-        "cpu_load_1min": (0, 100),
-        "cpu_load_5min": (0, 100),
-        "cpu_load_15min": (0, 100),
-        "ram_percentage": (0, 100),
-        "disk_percentage": (0, 100),
-        "logged_users": (0, 10000),
-        "tcp_connections": (0, 100000),
-    }
-
     validated = metrics.copy()
 
-    for field, (min_val, max_val) in numeric_fields.items():
-        if field in validated:
-            try:
-                value = float(validated[field])
-                if not min_val <= value <= max_val:
-                    logger.warning(
-                        f"Value for {field} out of expected range: {value} "
-                        f"(expected {min_val}-{max_val})"
-                    )
-                validated[field] = value
-            except (TypeError, ValueError):
-                logger.warning(f"Invalid numeric value for {field}: {validated[field]}")
-                validated[field] = 0
+    for field, min_val, max_val in _METRIC_RANGES:
+        raw = metrics.get(field, _MISSING)
+        if raw is _MISSING:
+            continue
+        try:
+            value = float(raw)
+            if not min_val <= value <= max_val:
+                logger.warning(
+                    f"Value for {field} out of expected range: {value} "
+                    f"(expected {min_val}-{max_val})"
+                )
+            validated[field] = value
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid numeric value for {field}: {raw}")
+            validated[field] = 0
 
     return validated
 
@@ -221,23 +302,27 @@ def validate_timestamp(timestamp: Any) -> datetime:
             details={"type": type(timestamp).__name__},
         )
 
-    # Try multiple timestamp formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d %H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ]
+    return _parse_timestamp_str(timestamp)
 
-    # Try ISO format with timezone
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_str(timestamp: str) -> datetime:
+    """
+    Parse a timestamp string (see validate_timestamp)
+
+    Memoized because refreshes re-parse the same poll timestamps; datetimes
+    are immutable, so cached results are safe to share. Failures raise and
+    are therefore never cached.
+    """
+    # Fast path: fromisoformat (C) covers every format below plus offsets and,
+    # on the supported Pythons (3.11+), a trailing "Z"
     try:
-        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
         pass
 
-    # Try other formats
-    for fmt in formats:
+    # Fallback for strings fromisoformat rejects
+    for fmt in _TIMESTAMP_FORMATS:
         try:
             return datetime.strptime(timestamp, fmt)
         except ValueError:
@@ -245,10 +330,14 @@ def validate_timestamp(timestamp: Any) -> datetime:
 
     raise ValidationError(
         f"Unable to parse timestamp: {timestamp}",
-        details={"value": timestamp, "tried_formats": formats},
+        details={"value": timestamp, "tried_formats": list(_TIMESTAMP_FORMATS)},
     )
 
 
+# Numeric fields validate_user_data coerces to float
+_USER_NUMERIC_FIELDS = ("cpu", "mem", "disk")
+
+
 def validate_user_data(user: Dict) -> Dict:
     """
     Validate user data dictionary structure
@@ -280,14 +369,15 @@ def validate_user_data(user: Dict) -> Dict:
     validated = user.copy()
 
     # Validate numeric fields
-    numeric_fields = ["cpu", "mem", "disk"]
-    for field in numeric_fields:
-        if field in validated:
-            try:
-                validated[field] = float(validated[field])
-            except (TypeError, ValueError):
-                logger.warning(f"Invalid numeric value for {field}: {validated[field]}")
-                validated[field] = 0.0
+    for field in _USER_NUMERIC_FIELDS:
+        raw = user.get(field, _MISSING)
+        if raw is _MISSING:
+            continue
+        try:
+            validated[field] = float(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid numeric value for {field}: {raw}")
+            validated[field] = 0.0
 
     return validated
 